@@ -55,6 +55,23 @@ modules = [
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',
     'scripts/variable_cruise_distance/variable_cruise_distance.py',
+    'scripts/segments/colored_jacobian.py',
+    'scripts/segments/state_reset.py',
+    'scripts/segments/skip_unchanged.py',
+    'scripts/surrogates/surrogate_models.py',
+    'scripts/propeller/battery_propeller.py',
+    'scripts/propeller/performance_map.py',
+    'scripts/optimization/nexus_gradients.py',
+    'scripts/optimization/nexus_cache.py',
+    'scripts/segments/flat_storage.py',
+    'scripts/segments/parallel_missions.py',
+    'scripts/segments/warm_started_segments.py',
+    'scripts/atmosphere/atmosphere_table.py',
+    'scripts/segments/operator_cache.py',
+    'scripts/gasturbine_network/engine_deck.py',
+    'scripts/fuel_cell/fuel_cell.py',
+    'scripts/geometry/nurbs_evaluation.py',
+    'scripts/avl_parallel/avl_parallel.py',
     'scripts/noise_optimization/Optimize.py'
 ]
 
@@ -172,9 +172,43 @@ def main():
         
         assert(np.max(tests)<1e-4),'Aero regression test failed at ' + i
         
+    test_vectorized_drag(vehicle, state)
+    
     #return conditions, configuration, geometry, test_num
       
 
+def test_vectorized_drag(vehicle, state):
+    # the vectorized drag buildup gives the breakdown of the per component processes
+    aerodynamics = SUAVE.Analyses.Aerodynamics.Fidelity_Zero_Vectorized()
+    aerodynamics.geometry = vehicle
+    aerodynamics.initialize()
+    
+    state_vectorized = deepcopy(state)
+    aerodynamics.evaluate(state_vectorized)
+    
+    drag_breakdown            = state.conditions.aerodynamics.drag_breakdown
+    drag_breakdown_vectorized = state_vectorized.conditions.aerodynamics.drag_breakdown
+    
+    for group in ['parasite','compressible']:
+        for tag in drag_breakdown[group].keys():
+            if tag == 'total':
+                values            = drag_breakdown[group].total
+                values_vectorized = drag_breakdown_vectorized[group].total
+            elif group == 'parasite':
+                values            = drag_breakdown[group][tag].parasite_drag_coefficient
+                values_vectorized = drag_breakdown_vectorized[group][tag].parasite_drag_coefficient
+            else:
+                values            = drag_breakdown[group][tag].compressibility_drag
+                values_vectorized = drag_breakdown_vectorized[group][tag].compressibility_drag
+            
+            error = np.max(np.abs(values_vectorized-values)/np.abs(values))
+            print 'vectorized', group, tag, 'error =', error
+            assert error < 1e-10, 'Aero regression test failed at vectorized ' + group + ' ' + tag
+    
+    assert np.max(np.abs(drag_breakdown_vectorized.total-drag_breakdown.total)/drag_breakdown.total) < 1e-10
+    
+    return
+
 def reg_values():
     cd_c_r = np.array([  2.08459463e-09,   1.08648911e-09,   4.40666169e-23,   1.88258599e-09,
                          3.71806409e-04,   6.07658788e-05,   2.38156998e-09,   4.35875057e-11,
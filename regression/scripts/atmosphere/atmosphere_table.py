@@ -0,0 +1,132 @@
+# atmosphere_table.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the vectorized US Standard 1976 atmosphere against a loop over
+    the altitude breaks, and its lookup table against the default path
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+from SUAVE.Core import Units
+from SUAVE.Core.Arrays import atleast_2d_col
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+    # geometric altitudes within the model, with the altitude breaks
+    Rad    = atmosphere.planet.mean_radius
+    breaks = atmosphere.breaks.altitude[1:-1]
+    z = np.hstack([ np.linspace(-1.9,85.,500) * Units.km , breaks/(1. - breaks/Rad) ])
+
+    test_breaks(atmosphere,z)
+    test_table(atmosphere,z)
+
+    return
+
+
+def test_breaks(atmosphere,z):
+
+    for delta_isa in [0.,15.]:
+        values = atmosphere.compute_values(z,delta_isa)
+        truth  = loop_values(atmosphere,z,delta_isa)
+
+        error = max_relative_error(values,truth)
+        print 'vectorized atmosphere error, delta isa', delta_isa, '=', error
+        assert error < 1e-12
+
+    return
+
+
+def test_table(atmosphere,z):
+
+    default = atmosphere.compute_values(z)
+
+    for tolerance in [1e-6,1e-9]:
+        table = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+        table.settings.lookup_table           = True
+        table.settings.lookup_table_tolerance = tolerance
+
+        for delta_isa in [0.,15.]:
+            values = table.compute_values(z,delta_isa)
+            truth  = atmosphere.compute_values(z,delta_isa)
+
+            error = max_relative_error(values,truth)
+            print 'lookup table error, tolerance', tolerance, ', delta isa', delta_isa, '=', error
+            assert error <= tolerance
+
+    # the default path is left as it was
+    assert max_relative_error(atmosphere.compute_values(z),default) == 0.
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def loop_values(atmosphere,z,delta_isa):
+    """ the atmosphere with one boolean mask per layer of the breaks """
+
+    gas    = atmosphere.fluid_properties
+    grav   = atmosphere.planet.sea_level_gravity
+    Rad    = atmosphere.planet.mean_radius
+    gamma  = gas.gas_specific_constant
+    breaks = atmosphere.breaks
+
+    zs = atleast_2d_col(z)
+    zs = zs/(1 + zs/Rad)
+
+    z0    = np.zeros_like(zs)
+    T0    = np.zeros_like(zs)
+    p0    = np.zeros_like(zs)
+    alpha = np.zeros_like(zs)
+
+    # both edges of each layer, the upper layer is kept at a break
+    for i in range( len(breaks.altitude)-1 ):
+        i_inside = (zs >= breaks.altitude[i]) & (zs <= breaks.altitude[i+1])
+        z0[ i_inside ]    = breaks.altitude[i]
+        T0[ i_inside ]    = breaks.temperature[i]
+        p0[ i_inside ]    = breaks.pressure[i]
+        alpha[ i_inside ] = -(breaks.temperature[i+1] - breaks.temperature[i])/ \
+                             (breaks.altitude[i+1]    - breaks.altitude[i])
+
+    dz = zs-z0
+    p  = np.zeros_like(zs)
+    i_isoth = (alpha == 0.)
+    i_adiab = (alpha != 0.)
+    p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(gamma*T0[i_isoth]))
+    p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*gamma)) )
+
+    T = T0 - dz*alpha + delta_isa
+
+    values = SUAVE.Core.Data()
+    values.pressure          = p
+    values.temperature       = T
+    values.density           = gas.compute_density(T,p)
+    values.speed_of_sound    = gas.compute_speed_of_sound(T)
+    values.dynamic_viscosity = gas.compute_absolute_viscosity(T)
+
+    return values
+
+
+def max_relative_error(values,truth):
+
+    keys = ['pressure','temperature','density','speed_of_sound','dynamic_viscosity']
+
+    return max([ np.max(np.abs(values[key]/truth[key] - 1.)) for key in keys ])
+
+
+if __name__ == '__main__':
+    main()
+    print 'Atmosphere table regression test passed!'
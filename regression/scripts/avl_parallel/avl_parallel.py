@@ -0,0 +1,240 @@
+# avl_parallel.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the concurrent avl processes against a fake avl that writes
+    canned results: the splitting of the cases, their merging back in
+    order, and the retries of failed and timed out processes
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../B737')
+
+import SUAVE
+from SUAVE.Core import Units
+
+import os
+import stat
+import shutil
+import tempfile
+import numpy as np
+
+from mission_B737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    directory = tempfile.mkdtemp()
+
+    try:
+        serial = test_serial(vehicle,directory)
+        test_order_and_retries(vehicle,directory,serial)
+        test_retries_exhausted(vehicle,directory)
+    finally:
+        shutil.rmtree(directory)
+
+    return
+
+
+def test_serial(vehicle,directory):
+
+    avl = avl_setup(vehicle,directory)
+    results = avl.evaluate_conditions(conditions_setup())
+
+    # the canned results of each case
+    alpha = results.aerodynamics.angle_of_attack/Units.deg
+    assert np.allclose(results.aerodynamics.lift_coefficient,0.1*alpha)
+    assert np.allclose(results.aerodynamics.pitch_moment_coefficient,-0.02*alpha)
+
+    return results
+
+
+def test_order_and_retries(vehicle,directory,serial):
+
+    # worker 2 fails once, worker 3 hangs once
+    avl = avl_setup(vehicle,directory,fail='worker_02',hang='worker_03')
+    avl.settings.number_of_processes = 3
+    avl.settings.timeout             = 2.
+    avl.settings.number_of_retries   = 1
+
+    results = avl.evaluate_conditions(conditions_setup())
+
+    for key in ['lift_coefficient','pitch_moment_coefficient','roll_moment_coefficient','cm_alpha','neutral_point']:
+        assert np.array_equal(results.aerodynamics[key],serial.aerodynamics[key]), key
+    assert np.array_equal(results.aerodynamics.angle_of_attack,serial.aerodynamics.angle_of_attack)
+
+    # each worker ran its own block of the cases
+    run_folder = avl.settings.filenames.run_folder
+    attempts = [ count_attempts(run_folder,'worker_{0:02d}'.format(i)) for i in [1,2,3] ]
+    print 'avl attempts of each worker =', attempts
+    assert attempts == [1,2,2]
+
+    print 'parallel avl results in case order after a failure and a timeout'
+
+    return
+
+
+def test_retries_exhausted(vehicle,directory):
+
+    for number_of_retries in [0,2]:
+        avl = avl_setup(vehicle,directory,fail='worker_02',always=True)
+        avl.settings.number_of_processes = 2
+        avl.settings.number_of_retries   = number_of_retries
+
+        try:
+            avl.evaluate_conditions(conditions_setup())
+        except RuntimeError as exc:
+            print 'retries', number_of_retries, ':', exc
+        else:
+            raise AssertionError , 'no error once the retries are exhausted'
+
+        attempts = count_attempts(avl.settings.filenames.run_folder,'worker_02')
+        assert attempts == number_of_retries + 1
+
+    # a timeout without retries
+    avl = avl_setup(vehicle,directory,hang='worker_01')
+    avl.settings.number_of_processes = 2
+    avl.settings.timeout             = 1.
+
+    try:
+        avl.evaluate_conditions(conditions_setup())
+    except RuntimeError as exc:
+        print 'timeout :', exc
+        assert 'timed out' in str(exc)
+    else:
+        raise AssertionError , 'no error once the timeout is exceeded'
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def avl_setup(vehicle,directory,fail=None,hang=None,always=False):
+
+    avl = SUAVE.Analyses.Aerodynamics.AVL()
+    avl.features   = vehicle
+    avl.keep_files = True
+
+    filenames = avl.settings.filenames
+    filenames.run_folder   = os.path.join(directory,'avl_files')
+    filenames.avl_bin_name = os.path.join(directory,'fake_avl')
+
+    avl.initialize()
+
+    write_fake_avl(filenames.avl_bin_name,fail,hang,always)
+
+    return avl
+
+
+def conditions_setup():
+
+    n_cases = 7
+
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(n_cases)
+
+    conditions.weights.total_mass[:,0]             = 60000.
+    conditions.freestream.mach_number[:,0]         = 0.3
+    conditions.freestream.velocity[:,0]            = 100.
+    conditions.freestream.density[:,0]             = 1.225
+    conditions.freestream.gravity[:,0]             = 9.81
+    conditions.aerodynamics.angle_of_attack[:,0]   = np.linspace(-2.,10.,n_cases) * Units.deg
+    conditions.aerodynamics.side_slip_angle[:,0]   = 0.
+
+    return conditions
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+fake_avl = \
+'''#!{python}
+""" a fake avl, writes results made from the angle of attack of each case """
+
+import os, sys, time
+
+fail   = {fail!r}
+hang   = {hang!r}
+always = {always!r}
+
+folder = os.path.basename(os.getcwd())
+with open('attempts.txt','a') as f:
+    f.write('attempt\\n')
+
+# the first attempt of the chosen workers fails or hangs
+first = not os.path.exists('tried.txt')
+open('tried.txt','w').close()
+if folder == fail and (first or always):
+    sys.exit(1)
+if folder == hang and first:
+    time.sleep(60.)
+
+# the commands of the input deck, until avl is told to quit
+commands = []
+for line in iter(sys.stdin.readline,''):
+    if line.strip() == 'QUIT':
+        break
+    if line.strip():
+        commands.append(line.strip())
+batch_file = commands[0].split()[1]
+cases = commands[2:]
+
+# the angle of attack of each case of the batch file
+alpha = {{}}
+for block in open(batch_file).read().split('Run case')[1:]:
+    index = block.split(':')[0].strip()
+    alpha[index] = float(block.split('alpha       =')[1].split()[0])
+
+def field(line,columns,value):
+    line = line.ljust(60)
+    return line[:columns[0]] + '%*.5f' % (columns[1]-columns[0],value) + line[columns[1]:]
+
+for i in range(0,len(cases),4):
+    index, result_file = cases[i], cases[i+3]
+    a = alpha[index]
+    lines = [''] * 60
+    lines[19] = field(lines[19],(32,42),0.001*a)
+    lines[20] = field(lines[20],(32,42),-0.02*a)
+    lines[21] = field(lines[21],(32,42),0.)
+    lines[23] = field(lines[23],(10,20),0.1*a)
+    lines[25] = field(lines[25],(32,42),0.0001*a*a)
+    lines[27] = field(lines[27],(32,42),0.9)
+    for j in range(5):
+        lines[36+j] = field(lines[36+j],(25,35),j + 0.01*a)
+        lines[36+j] = field(lines[36+j],(44,55),-j - 0.01*a)
+    lines[50] = field(lines[50],(22,33),10. + 0.01*a)
+    with open(result_file,'w') as f:
+        f.write('\\n'.join(lines) + '\\n')
+'''
+
+def write_fake_avl(filename,fail,hang,always):
+
+    with open(filename,'w') as f:
+        f.write(fake_avl.format(python=sys.executable,fail=fail,hang=hang,always=always))
+    os.chmod(filename,os.stat(filename).st_mode | stat.S_IEXEC)
+
+    return
+
+
+def count_attempts(run_folder,worker_tag):
+
+    with open(os.path.join(run_folder,worker_tag,'attempts.txt')) as f:
+        return len(f.readlines())
+
+
+if __name__ == '__main__':
+    main()
+    print 'AVL parallel regression test passed!'
@@ -13,10 +13,11 @@ from SUAVE.Core import Units
 from SUAVE.Methods.Power.Battery.Discharge import datta_discharge
 from SUAVE.Methods.Power.Battery.Sizing import initialize_from_energy_and_power, initialize_from_mass
 from SUAVE.Core import Data
-from SUAVE.Methods.Power.Battery.Ragone import find_ragone_properties, find_specific_power, find_ragone_optimum
+from SUAVE.Methods.Power.Battery.Ragone import find_ragone_properties, find_specific_power, find_ragone_optimum, find_ragone_optima
 from SUAVE.Methods.Power.Battery.Variable_Mass import find_mass_gain_rate, find_total_mass_gain
 import numpy as np
 import matplotlib.pyplot as plt
+from copy import deepcopy
 
 
 def main():
@@ -50,6 +51,7 @@ def main():
     test_initialize_from_energy_and_power(battery_al_air, Ereq, Preq)
     test_mass_gain(battery_al_air, Preq)
     test_find_ragone_properties(specific_energy_guess,battery_li_s, Ereq,Preq)
+    test_find_ragone_optima(battery_li_s)
     test_find_ragone_optimum(battery_li_ion,Ereq,Preq)
    
     test_initialize_from_mass(battery_li_ion,li_ion_mass)
@@ -84,6 +86,22 @@ def test_find_ragone_optimum(battery, energy, power):
     print 'specific_energy (Wh/kg)=',battery.specific_energy/(Units.Wh/Units.kg)
     print 'max_energy [W-h]=', battery.max_energy/Units.Wh
     return
+def test_find_ragone_optima(battery):
+    # a grid of requirements, against the optimum of each on its own
+    energy = np.array([[500.],[2000.],[4000.],[20000.]])*Units.Wh
+    power  = np.array([[0., 500., 3000., 20000., 100000.]])
+    specific_energy, specific_power, mass = find_ragone_optima(battery, energy, power)
+    
+    for i in xrange(energy.shape[0]):
+        for j in xrange(power.shape[1]):
+            battery_scalar = deepcopy(battery)
+            find_ragone_optimum(battery_scalar, energy[i,0], power[0,j])
+            
+            error = (mass[i,j] - battery_scalar.mass_properties.mass)/battery_scalar.mass_properties.mass
+            print 'E =', energy[i,0]/Units.Wh, 'W-h, P =', power[0,j], 'W, mass error =', error
+            assert np.abs(error) < 1e-5
+            assert np.abs(specific_power[i,j]*mass[i,j] - battery_scalar.max_power)/battery_scalar.max_power < 1e-4
+    return
 def test_initialize_from_mass(battery,mass):
     initialize_from_mass(battery,mass)
     print battery
@@ -0,0 +1,173 @@
+# data_access.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import time
+from SUAVE.Core import Data
+from SUAVE.Core.Deep_Core import Bunch, IndexableDict
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    print 'Data access time [us]'
+    print '%-24s %10s %10s %10s %8s' % ('','object','reference','Data','speedup')
+
+    for name,function,plain in [('get attribute'         ,get_attribute ,True ),
+                                ('set existing attribute',set_attribute ,True ),
+                                ('get item'              ,get_item      ,False),
+                                ('set existing item'     ,set_item      ,False),
+                                ('set conditions'        ,set_conditions,True )]:
+
+        t_reference = best_time(function,setup_data(Reference_Data))
+        t_data      = best_time(function,setup_data(Data))
+
+        # plain objects have no item style access
+        if plain:
+            t_plain = '%10.3f' % best_time(function,setup_plain())
+        else:
+            t_plain = '%10s' % '-'
+
+        print '%-24s %s %10.3f %10.3f %8.1f' % (name,t_plain,t_reference,t_data,t_reference/t_data)
+
+    # both give the same data, in the same order
+    reference = setup_data(Reference_Data)
+    data      = setup_data(Data)
+    for d in (reference,data):
+        set_conditions(d,1)
+        d.freestream.new_key = 1.
+        d['freestream']['other_key'] = 2.
+        d.freestream[0] = 3.
+    assert reference.freestream.keys() == data.freestream.keys()
+    for a,b in zip(reference.freestream.values(),data.freestream.values()):
+        assert np.all( a == b )
+    assert data.freestream.keys()[-2:] == ['new_key','other_key']
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Reference Data, the access methods before the fast paths
+# ----------------------------------------------------------------------
+
+class Reference_Data(Data):
+
+    def __setattr__(self, key, value):
+        if not hasattr(self,key) and not hasattr(self.__class__,key):
+            root = dict.__getitem__(self,'_root')
+            last = root[0]
+            map  = dict.__getitem__(self,'_map')
+            last[1] = root[0] = map[key] = [last, root, key]
+        Bunch.__setattr__(self,key, value)
+
+    def __getitem__(self,k):
+        if not isinstance(k,int):
+            return super(IndexableDict,self).__getitem__(k)
+        else:
+            return super(IndexableDict,self).__getitem__(self.keys()[k])
+
+    def __setitem__(self,k,v):
+        if not isinstance(k,int):
+            super(IndexableDict,self).__setitem__(k,v)
+        else:
+            super(IndexableDict,self).__setitem__( self.keys()[k], v )
+
+
+class Plain_Object(object):
+    pass
+
+
+# ----------------------------------------------------------------------
+#   Workloads
+# ----------------------------------------------------------------------
+
+keys = ['velocity','mach_number','pressure','temperature','density',
+        'speed_of_sound','dynamic_viscosity','altitude','gravity','reynolds_number']
+
+def get_attribute(d,n=10000):
+    for i in xrange(n):
+        v = d.freestream.velocity
+        v = d.freestream.density
+    return
+
+def set_attribute(d,n=10000):
+    value = np.ones([16,1])
+    for i in xrange(n):
+        d.freestream.velocity = value
+        d.freestream.density  = value
+    return
+
+def get_item(d,n=10000):
+    for i in xrange(n):
+        v = d['freestream']['velocity']
+        v = d['freestream']['density']
+    return
+
+def set_item(d,n=10000):
+    value = np.ones([16,1])
+    for i in xrange(n):
+        d['freestream']['velocity'] = value
+        d['freestream']['density']  = value
+    return
+
+def set_conditions(d,n=2000):
+    # the pattern of a mission iteration, many arrays reassigned
+    value = np.ones([16,1])
+    for i in xrange(n):
+        freestream = d.freestream
+        for key in keys:
+            setattr(freestream,key,value)
+    return
+
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup_data(data_class):
+
+    d = data_class()
+    d.freestream = data_class()
+    for key in keys:
+        setattr(d.freestream,key,np.zeros([16,1]))
+
+    return d
+
+def setup_plain():
+
+    d = Plain_Object()
+    d.freestream = Plain_Object()
+    for key in keys:
+        setattr(d.freestream,key,np.zeros([16,1]))
+
+    return d
+
+def best_time(function,*args):
+
+    # per attribute access
+    n_access = {get_attribute:2e4,set_attribute:2e4,get_item:4e4,
+                set_item:4e4,set_conditions:2e4}[function]
+
+    times = []
+    for i in range(5):
+        t0 = time.time()
+        function(*args)
+        times.append(time.time()-t0)
+
+    return min(times)/n_access*1e6
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# data_construction.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import time
+from SUAVE.Analyses.Mission.Segments.Segment import Segment
+from SUAVE.Analyses.Mission.Segments.Conditions.Conditions import Conditions
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    print 'Construction time [ms]'
+    print '%-40s %10s %10s %8s' % ('','defaults','prototype','speedup')
+
+    for klass in [Segments.Conditions.Aerodynamics,
+                  Segments.Conditions.State,
+                  Segments.Cruise.Constant_Speed_Constant_Altitude,
+                  Segments.Climb.Constant_Speed_Constant_Rate]:
+
+        set_prototypes(False)
+        t_defaults  = best_time(klass)
+        set_prototypes(True)
+        t_prototype = best_time(klass)
+
+        print '%-40s %10.3f %10.3f %8.1f' % (klass.__name__,t_defaults,t_prototype,t_defaults/t_prototype)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def set_prototypes(on):
+    Segment._prototype_defaults    = on
+    Conditions._prototype_defaults = on
+
+def best_time(klass,n=200):
+
+    times = []
+    for i in range(3):
+        t0 = time.time()
+        for j in xrange(n):
+            klass()
+        times.append(time.time()-t0)
+
+    return min(times)/n*1000.
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
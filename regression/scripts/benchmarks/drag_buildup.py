@@ -0,0 +1,139 @@
+# drag_buildup.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../aerodynamics')
+
+import SUAVE
+import numpy as np
+import time
+from copy import deepcopy
+from SUAVE.Core import Units
+
+from mission_B737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    print 'Parasite and compressibility drag time [ms]'
+    print '%8s %8s %12s %12s %8s' % ('copies','points','per part','buildup','speedup')
+
+    for n_copies in [1, 4, 16]:
+
+        vehicle = setup_vehicle(n_copies)
+
+        for n_points in [16, 256]:
+
+            default    = setup_aerodynamics(SUAVE.Analyses.Aerodynamics.Fidelity_Zero,vehicle)
+            vectorized = setup_aerodynamics(SUAVE.Analyses.Aerodynamics.Fidelity_Zero_Vectorized,vehicle)
+
+            state_default    = setup_state(default,n_points)
+            state_vectorized = setup_state(vectorized,n_points)
+
+            compute = default.process.compute.drag
+            steps   = [compute.parasite,compute.compressibility]
+            t_part  = best_time(steps,state_default,default)
+
+            steps    = [vectorized.process.compute.drag.parasite]
+            t_buildup = best_time(steps,state_vectorized,vectorized)
+
+            print '%8i %8i %12.3f %12.3f %8.1f' % (n_copies,n_points,t_part*1000.,t_buildup*1000.,t_part/t_buildup)
+
+            # both give the same drag breakdown
+            breakdown_default    = state_default.conditions.aerodynamics.drag_breakdown
+            breakdown_vectorized = state_vectorized.conditions.aerodynamics.drag_breakdown
+            for group in ['parasite','compressible']:
+                for tag,result in breakdown_default[group].items():
+                    if tag == 'total':
+                        assert np.allclose(result,breakdown_vectorized[group][tag],rtol=1e-12,atol=0.)
+                        continue
+                    for key,value in result.items():
+                        assert np.allclose(value,breakdown_vectorized[group][tag][key],rtol=1e-12,atol=0.)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup_vehicle(n_copies):
+    """ the B737, with copies of its wings and propulsor, so there are
+        more components, ie a configuration with many lifting surfaces
+    """
+
+    vehicle = vehicle_setup()
+
+    for wing in vehicle.wings:
+        wing.areas.wetted   = 2.0 * wing.areas.reference
+        wing.areas.exposed  = 0.8 * wing.areas.wetted
+
+    for i in range(1,n_copies):
+        for wing in vehicle.wings.values()[:3]:
+            copy     = deepcopy(wing)
+            copy.tag = wing.tag + '_%i' % i
+            vehicle.append_component(copy)
+        for propulsor in vehicle.propulsors.values()[:1]:
+            copy     = deepcopy(propulsor)
+            copy.tag = propulsor.tag + '_%i' % i
+            vehicle.append_component(copy)
+
+    return vehicle
+
+
+def setup_aerodynamics(analysis,vehicle):
+
+    aerodynamics = analysis()
+    aerodynamics.geometry = deepcopy(vehicle)
+    aerodynamics.initialize()
+
+    return aerodynamics
+
+
+def setup_state(aerodynamics,n_points):
+
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n_points)
+
+    freestream = state.conditions.freestream
+    freestream.mach_number       = np.linspace(0.2,0.85,n_points)[:,None]
+    freestream.temperature       = np.linspace(288.,218.,n_points)[:,None]
+    freestream.reynolds_number   = np.linspace(4e6,9e6,n_points)[:,None]
+    freestream.dynamic_pressure  = np.linspace(2e3,1e4,n_points)[:,None]
+    state.conditions.aerodynamics.angle_of_attack = np.linspace(0.,6.,n_points)[:,None] * Units.deg
+
+    # the lift the compressibility drag needs
+    aerodynamics.process.compute.lift.evaluate(state,aerodynamics.settings,aerodynamics.geometry)
+
+    return state
+
+
+def best_time(steps,state,aerodynamics,n=20):
+
+    times = []
+    for i in range(3):
+        t0 = time.time()
+        for j in xrange(n):
+            for step in steps:
+                step.evaluate(state,aerodynamics.settings,aerodynamics.geometry)
+        times.append(time.time()-t0)
+
+    return min(times)/n
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
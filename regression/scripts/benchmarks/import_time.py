@@ -0,0 +1,75 @@
+# import_time.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import subprocess
+import sys
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+# each workload runs in a new process, timing a cold start
+workloads = [('import SUAVE'              , ''),
+             ('convert a unit'            , '1. * SUAVE.Core.Units.ft'),
+             ('build a vehicle'           , 'SUAVE.Vehicle().append_component(SUAVE.Components.Wings.Main_Wing())'),
+             ('fidelity zero aerodynamics', 'SUAVE.Analyses.Aerodynamics.Fidelity_Zero()'),
+             ('mission segment'           , 'SUAVE.Analyses.Mission.Segments.Cruise.Constant_Speed_Constant_Altitude()')]
+
+timer = '''
+import time, sys
+t0 = time.time()
+import SUAVE
+%s
+t1 = time.time()
+print t1 - t0, len([ m for m in sys.modules if m.startswith('SUAVE') ])
+'''
+
+def main():
+
+    print 'Cold start time'
+    print '%-28s %10s %10s' % ('','time [s]','modules')
+
+    for name,code in workloads:
+        seconds, modules = best_time(timer % code)
+        print '%-28s %10.3f %10d' % (name,seconds,modules)
+
+    # the lazy modules a full aerodynamics setup loads
+    print
+    report = '''
+import SUAVE
+SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+from SUAVE.Core.Lazy_Module import import_report
+import_report()
+'''
+    subprocess.check_call([sys.executable,'-c',report])
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def best_time(code,n=3):
+
+    times = []
+    for i in range(n):
+        output  = subprocess.check_output([sys.executable,'-c',code])
+        seconds, modules = output.split()[-2:]
+        times.append(float(seconds))
+
+    return min(times), int(modules)
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+# noise_setup.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import time
+from SUAVE.Core import Units, Data
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_source_conditions
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    analyses = setup_analyses()
+    turbofan = setup_turbofan()
+
+    print 'Noise setup time [ms]'
+    print '%8s %12s %12s %8s' % ('points','per point','batched','speedup')
+
+    for n_points in [50, 200, 1000, 5000]:
+
+        noise_segment = setup_segment(n_points)
+
+        t_point   = best_time(per_point_setup,noise_segment,analyses,None,turbofan)
+        t_batched = best_time(noise_source_conditions,noise_segment,analyses,None,turbofan)
+
+        print '%8i %12.2f %12.2f %8.1f' % (n_points,t_point*1000.,t_batched*1000.,t_point/t_batched)
+
+        # both setups give the same inputs
+        reference = per_point_setup(noise_segment,analyses,None,turbofan)
+        batched   = noise_source_conditions(noise_segment,analyses,None,turbofan)
+        for key in ['speed_of_sound','density','dynamic_viscosity','temperature','pressure']:
+            assert np.all( reference.freestream[key] == batched.freestream[key] )
+        for key in reference.engine.keys():
+            assert np.all( reference.engine[key] == batched.engine[key] )
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Reference Setup, one atmosphere call per point
+# ----------------------------------------------------------------------
+
+def per_point_setup(noise_segment,analyses,config,turbofan):
+
+    altitude = noise_segment.conditions.freestream.altitude[:,0]
+    n_steps  = len(altitude)
+
+    results = Data()
+    results.freestream = Data()
+    for key in ['speed_of_sound','density','dynamic_viscosity','temperature','pressure']:
+        results.freestream[key] = np.zeros(n_steps)
+
+    for i in range(n_steps):
+        atmo_data = analyses.atmosphere.compute_values(altitude[i])
+        for key in results.freestream.keys():
+            results.freestream[key][i] = np.float(atmo_data[key])
+
+    results.geometric = noise_geometric(noise_segment,analyses,config)
+
+    core = noise_segment.conditions.propulsion.acoustic_outputs.core
+    fan  = noise_segment.conditions.propulsion.acoustic_outputs.fan
+
+    results.engine = Data()
+    results.engine.velocity_primary      = np.ones(n_steps) * np.float(turbofan.core_nozzle.noise_speed * 0.92*(turbofan.design_thrust/52700.))
+    results.engine.temperature_primary   = core.exit_stagnation_temperature
+    results.engine.pressure_primary      = core.exit_stagnation_pressure
+    results.engine.velocity_secondary    = np.ones(n_steps) * np.float(turbofan.fan_nozzle.noise_speed * (turbofan.design_thrust/52700.))
+    results.engine.temperature_secondary = fan.exit_stagnation_temperature
+    results.engine.pressure_secondary    = fan.exit_stagnation_pressure
+
+    return results
+
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup_analyses():
+
+    analyses = Data()
+    analyses.atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+    analyses.noise = Data()
+    analyses.noise.settings = Data()
+    analyses.noise.settings.approach       = 1
+    analyses.noise.settings.flyover        = 0
+    analyses.noise.settings.sideline       = 0
+    analyses.noise.settings.mic_x_position = 0
+
+    return analyses
+
+def setup_turbofan():
+
+    turbofan = Data()
+    turbofan.design_thrust = 52700.
+    turbofan.core_nozzle = Data()
+    turbofan.core_nozzle.noise_speed = 350.
+    turbofan.fan_nozzle = Data()
+    turbofan.fan_nozzle.noise_speed = 160.
+
+    return turbofan
+
+def setup_segment(n_points):
+
+    # straight 3 deg approach at 140 kts
+    velocity = 140. * Units.knots
+    gamma    = 3. * Units.deg
+    t        = np.linspace(0.,60.,n_points)[:,None]
+
+    x = -4000. + velocity*np.cos(gamma)*t
+    h = 350. - velocity*np.sin(gamma)*t
+
+    ones = np.ones([n_points,1])
+
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(n_points)
+    conditions.frames.inertial.time            = t
+    conditions.frames.inertial.position_vector = np.hstack([x,0.*x,-h])
+    conditions.freestream.altitude             = h
+    conditions.freestream.velocity             = ones * velocity
+    conditions.aerodynamics.angle_of_attack    = ones * 5. * Units.deg
+
+    conditions.propulsion.acoustic_outputs.core.exit_stagnation_temperature = ones * 800.
+    conditions.propulsion.acoustic_outputs.core.exit_stagnation_pressure    = ones * 101325.
+    conditions.propulsion.acoustic_outputs.fan.exit_stagnation_temperature  = ones * 300.
+    conditions.propulsion.acoustic_outputs.fan.exit_stagnation_pressure     = ones * 101325.
+
+    noise_segment = Data()
+    noise_segment.conditions = conditions
+
+    return noise_segment
+
+def best_time(function,*args):
+
+    times = []
+    for i in range(3):
+        t0 = time.time()
+        function(*args)
+        times.append(time.time()-t0)
+
+    return min(times)
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
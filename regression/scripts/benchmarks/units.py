@@ -0,0 +1,160 @@
+# units.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import time
+from SUAVE.Core import Units
+from SUAVE.Plugins.pint import UnitRegistry
+from SUAVE.Plugins.pint.quantity import _Quantity
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    reference = reference_units()
+
+    print 'Unit conversion time [us]'
+    print '%-28s %10s %10s %8s' % ('','pint','table','speedup')
+
+    for name,function in [('scalar * Units.ft'       ,scalar_in      ),
+                          ('array * Units.ft'        ,array_in       ),
+                          ('array / Units.knots'     ,array_out      ),
+                          ('array * Units.ft**2'     ,array_compound ),
+                          ('array * Units.degF'      ,array_offset_in),
+                          ('array / Units.degF'      ,array_offset_out)]:
+
+        t_reference = best_time(function,reference)
+        t_table     = best_time(function,Units)
+
+        print '%-28s %10.3f %10.3f %8.1f' % (name,t_reference,t_table,t_reference/t_table)
+
+        # both give the same conversions
+        assert np.allclose(function(reference,1),function(Units,1),rtol=1e-12)
+
+    check_base_units(reference)
+
+    return
+
+
+def check_base_units(reference):
+    """ integer operands of units that convert become floating point, as
+        with pint, so a later division isn't an integer division, base
+        units pass their operands through
+    """
+
+    for name in ['N','W','Pa','J','V','deg','m','kg','s','rad']:
+        for value in [3, np.array([1,2])]:
+            for convert in [lambda x,u: x*u, lambda x,u: u*x, lambda x,u: x/u]:
+                converted = convert(value,getattr(Units,name))
+                expected  = convert(value,getattr(reference,name))
+                assert np.asarray(converted).dtype == np.asarray(expected).dtype
+                assert np.all(converted == expected)
+
+    assert 3*Units.N/2 == 1.5
+
+    x = np.ones(3)
+    assert x * Units.m is x
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Reference Units, Pint monkey patched to convert on each use
+# ----------------------------------------------------------------------
+
+def reference_units():
+
+    units = UnitRegistry()
+
+    def __rmul__(self,other):
+        if isinstance(other,_Quantity):
+            return _Quantity.__rmul__(self,other)
+        else:
+            self._magnitude = other
+            self.ito_base_units()
+            return self.magnitude
+
+    def __rdiv__(self,other):
+        if isinstance(other,_Quantity):
+            return _Quantity.__truediv__(self,other)
+        else:
+            units = str(self._units)
+            self.ito_base_units()
+            self._magnitude = other
+            self.ito(units)
+            return self.magnitude
+
+    units.Quantity.__mul__      = __rmul__
+    units.Quantity.__rmul__     = __rmul__
+    units.Quantity.__div__      = __rdiv__
+    units.Quantity.__truediv__  = __rdiv__
+    units.Quantity.__rdiv__     = __rdiv__
+    units.Quantity.__rtruediv__ = __rdiv__
+    units.Quantity.__getattr__  = getattr
+    units.Quantity.__array_prepare__ = None
+    units.Quantity.__array_wrap__    = None
+
+    return units
+
+
+# ----------------------------------------------------------------------
+#   Workloads
+# ----------------------------------------------------------------------
+
+values = np.linspace(0.,1000.,16)[:,None]
+
+def scalar_in(units,n=2000):
+    for i in xrange(n):
+        x = 1000. * units.ft
+    return x
+
+def array_in(units,n=2000):
+    for i in xrange(n):
+        x = values * units.ft
+    return x
+
+def array_out(units,n=2000):
+    for i in xrange(n):
+        x = values / units.knots
+    return x
+
+def array_compound(units,n=2000):
+    for i in xrange(n):
+        x = values * units.ft**2
+    return x
+
+def array_offset_in(units,n=2000):
+    for i in xrange(n):
+        x = values * units.degF
+    return x
+
+def array_offset_out(units,n=2000):
+    for i in xrange(n):
+        x = values / units.degF
+    return x
+
+def best_time(function,units,n=2000):
+
+    times = []
+    for i in range(3):
+        t0 = time.time()
+        function(units,n)
+        times.append(time.time()-t0)
+
+    return min(times)/n*1e6
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
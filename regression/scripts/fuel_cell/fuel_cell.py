@@ -0,0 +1,83 @@
+# fuel_cell.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the current densities of the Larminie fuel cell, found for all
+    powers at once, against a bounded minimization for each power
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+import scipy.optimize
+
+from SUAVE.Methods.Power.Fuel_Cell.Discharge import setup_larminie, find_power_larminie, \
+     find_power_diff_larminie, find_current_density_larminie
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    fuel_cell = SUAVE.Components.Energy.Converters.Fuel_Cell()
+    setup_larminie(fuel_cell)
+
+    # the bounds of the larminie discharge model
+    lb = .1*Units.mA/(Units.cm**2.)
+    ub = 1200.0*Units.mA/(Units.cm**2.)
+
+    # the maximum power of a cell
+    i_max = scipy.optimize.fminbound(find_power_larminie, lb, ub, args=(fuel_cell,-1.), xtol=1e-8)
+    P_max = find_power_larminie(i_max,fuel_cell)
+
+    test_below_maximum(fuel_cell,lb,ub,P_max)
+    test_outside_range(fuel_cell,lb,ub,i_max,P_max)
+
+    return
+
+
+def test_below_maximum(fuel_cell,lb,ub,P_max):
+
+    power = np.array([[0.05,0.2,0.5],[0.8,0.95,0.999]])*P_max
+
+    current_density = find_current_density_larminie(fuel_cell,power,lb,ub)
+    assert current_density.shape == power.shape
+
+    for i,p in np.ndenumerate(power):
+        truth = scipy.optimize.fminbound(find_power_diff_larminie, lb, ub, args=(fuel_cell,p))
+        error = (current_density[i] - truth)/truth
+        print 'P =', p, 'W, current density error =', error
+        assert np.abs(error) < 1e-6
+
+    return
+
+
+def test_outside_range(fuel_cell,lb,ub,i_max,P_max):
+
+    tolerance = 1e-5
+
+    # above the maximum power, the current density of the maximum
+    current_density = find_current_density_larminie(fuel_cell,np.array([1.01,2.])*P_max,lb,ub,tolerance)
+    print 'current density above the maximum power =', current_density, ', of the maximum =', i_max
+    assert np.all(np.abs(current_density - i_max) < 10.*tolerance)
+    assert np.all(np.abs(find_power_larminie(current_density,fuel_cell)/P_max - 1.) < 1e-10)
+
+    # below the power at lb, lb
+    P_lb = find_power_larminie(lb,fuel_cell)
+    current_density = find_current_density_larminie(fuel_cell,np.array([0.,0.5])*P_lb,lb,ub,tolerance)
+    print 'current density below the power at lb =', current_density
+    assert np.all(np.abs(current_density - lb) < tolerance)
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'Fuel cell regression test passed!'
@@ -0,0 +1,99 @@
+# engine_deck.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the turbofan evaluated from an engine deck against its full
+    cycle, between the grid points of the deck
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../B737')
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+from copy import deepcopy
+
+from SUAVE.Methods.Propulsion import turbofan_deck
+
+from mission_B737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the sized B737 turbofan
+    vehicle  = vehicle_setup()
+    turbofan = vehicle.propulsors.values()[0]
+
+    # off the grid of the deck
+    altitude    = np.array([1234.,5678.,9876.,3210.])[:,None] * Units.m
+    mach_number = np.array([0.33,0.57,0.79,0.48])[:,None]
+    throttle    = np.array([0.45,0.7,0.93,1.0])[:,None]
+
+    cycle = deepcopy(turbofan)
+    results_cycle = cycle.evaluate_thrust(state_setup(altitude,mach_number,throttle))
+
+    deck = deepcopy(turbofan)
+    deck.engine_deck = turbofan_deck(deck,np.linspace(0.05,0.95,19),np.linspace(210.,300.,11))
+    results_deck = deck.evaluate_thrust(state_setup(altitude,mach_number,throttle))
+
+    error = Data()
+    error.thrust    = np.max(np.abs(results_deck.thrust_force_vector[:,0]/results_cycle.thrust_force_vector[:,0] - 1.))
+    error.fuel_flow = np.max(np.abs(results_deck.vehicle_mass_rate[:,0]/results_cycle.vehicle_mass_rate[:,0] - 1.))
+
+    print 'Errors of the engine deck to the cycle:'
+    print error
+
+    for k,v in error.items():
+        assert(np.abs(v)<1e-3)
+
+    # the deck follows the throttle
+    assert np.all(np.diff(results_deck.thrust_force_vector[:3,0]) != 0.)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def state_setup(altitude,mach_number,throttle):
+
+    n_points = altitude.shape[0]
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude)
+
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(n_points)
+
+    conditions.freestream.altitude          = altitude
+    conditions.freestream.pressure          = atmo_data.pressure
+    conditions.freestream.temperature       = atmo_data.temperature
+    conditions.freestream.density           = atmo_data.density
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound    = atmo_data.speed_of_sound
+    conditions.freestream.mach_number       = mach_number
+    conditions.freestream.velocity          = mach_number * atmo_data.speed_of_sound
+    conditions.freestream.gravity           = np.ones([n_points,1]) * 9.81
+    conditions.propulsion.throttle          = throttle
+
+    state = Data()
+    state.numerics   = Data()
+    state.conditions = conditions
+
+    return state
+
+
+if __name__ == '__main__':
+    main()
+    print 'Engine deck regression test passed!'
@@ -0,0 +1,175 @@
+# nurbs_evaluation.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the batch NURBS evaluators against the point by point Evaluate
+    of the curve and surface, and their derivatives against finite
+    differences, for weighted, non-uniform knots with repeated knots
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Attributes.Curve import Curve
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Attributes.Surface import Surface
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Methods.evaluate_curve import evaluate_curve
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Methods.evaluate_curve_points import evaluate_curve_points
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Methods.evaluate_surface import evaluate_surface
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Methods.evaluate_surface_grid import evaluate_surface_grid
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    curve   = curve_setup()
+    surface = surface_setup()
+
+    test_curve(curve)
+    test_curve_derivatives(curve)
+    test_surface(surface)
+    test_surface_derivatives(surface)
+
+    return
+
+
+def test_curve(curve):
+
+    # with both ends and the interior knots
+    u = np.unique(np.hstack([np.linspace(0.,1.,37),curve.knots]))
+
+    points = evaluate_curve_points(curve,u)
+    truth  = np.array([ curve.Evaluate(ui) for ui in u ])
+
+    error = np.max(np.abs(points - truth))
+    print 'curve points error =', error
+    assert error < 1e-12
+
+    assert np.max(np.abs(evaluate_curve(curve,u[5]) - truth[5])) < 1e-12
+
+    return
+
+
+def test_curve_derivatives(curve):
+
+    h = 1e-6
+    u = parameters_off_knots(curve.knots,h)
+
+    C = evaluate_curve_points(curve,u,derivatives=3)
+    assert C.shape == (4,len(u),3)
+    assert np.array_equal(C[0],evaluate_curve_points(curve,u))
+
+    # each order against central differences of the one below
+    for k in range(1,4):
+        C_p = evaluate_curve_points(curve,u+h,derivatives=k-1)
+        C_m = evaluate_curve_points(curve,u-h,derivatives=k-1)
+        if k > 1:
+            C_p = C_p[k-1]; C_m = C_m[k-1]
+        fd = (C_p - C_m)/(2.*h)
+
+        error = np.max(np.abs(C[k] - fd))/np.max(np.abs(C[k]))
+        print 'curve derivative', k, 'error =', error
+        assert error < 1e-6
+
+    return
+
+
+def test_surface(surface):
+
+    u = np.unique(np.hstack([np.linspace(0.,1.,13),surface.uknots]))
+    v = np.unique(np.hstack([np.linspace(0.,1.,11),surface.vknots]))
+
+    points = evaluate_surface_grid(surface,u,v)
+    assert points.shape == (len(u),len(v),3)
+
+    truth = np.array([ [ surface.Evaluate(ui,vj) for vj in v ] for ui in u ])
+
+    error = np.max(np.abs(points - truth))
+    print 'surface points error =', error
+    assert error < 1e-12
+
+    assert np.max(np.abs(evaluate_surface(surface,u[3],v[4]) - truth[3,4])) < 1e-12
+
+    return
+
+
+def test_surface_derivatives(surface):
+
+    h = 1e-6
+    u = parameters_off_knots(surface.uknots,h)
+    v = parameters_off_knots(surface.vknots,h)
+
+    S, Su, Sv = evaluate_surface_grid(surface,u,v,derivatives=1)
+    assert np.array_equal(S,evaluate_surface_grid(surface,u,v))
+
+    fd_u = (evaluate_surface_grid(surface,u+h,v) - evaluate_surface_grid(surface,u-h,v))/(2.*h)
+    fd_v = (evaluate_surface_grid(surface,u,v+h) - evaluate_surface_grid(surface,u,v-h))/(2.*h)
+
+    error_u = np.max(np.abs(Su - fd_u))/np.max(np.abs(Su))
+    error_v = np.max(np.abs(Sv - fd_v))/np.max(np.abs(Sv))
+    print 'surface derivative errors, u =', error_u, ', v =', error_v
+    assert error_u < 1e-6 and error_v < 1e-6
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def curve_setup():
+
+    curve = Curve()
+    curve.p     = 3
+    curve.knots = np.array([0.,0.,0.,0.,0.15,0.4,0.4,0.7,1.,1.,1.,1.])
+
+    points  = [[0.,0.,0.],[1.,2.,0.5],[2.5,2.2,1.],[3.,0.5,0.2],
+               [4.2,-1.,0.8],[5.,0.3,1.5],[6.1,1.8,0.4],[7.,0.,0.]]
+    weights = [1.,0.6,2.,1.4,0.8,2.5,0.7,1.]
+    for P,w in zip(points,weights):
+        curve.AddPoint(P,w)
+
+    return curve
+
+
+def surface_setup():
+
+    surface = Surface()
+    surface.p      = 3
+    surface.q      = 2
+    surface.uknots = np.array([0.,0.,0.,0.,0.2,0.45,0.45,1.,1.,1.,1.])
+    surface.vknots = np.array([0.,0.,0.,0.3,0.3,0.55,1.,1.,1.])
+    surface.N      = len(surface.uknots) - surface.p - 1
+    surface.M      = len(surface.vknots) - surface.q - 1
+
+    i, j = np.meshgrid(np.arange(surface.N),np.arange(surface.M),indexing='ij')
+    surface.CPs.x = 1.3*i + 0.2*np.sin(j)
+    surface.CPs.y = 0.9*j + 0.3*np.cos(1.7*i)
+    surface.CPs.z = 0.5*np.sin(0.8*i + 1.1*j)
+    surface.w     = 1. + 0.6*np.sin(1.3*i - 0.7*j)**2
+
+    return surface
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def parameters_off_knots(knots,h):
+    """ parameters at least 100 steps away from every knot """
+
+    u = np.linspace(0.,1.,41)[1:-1]
+    distance = np.min(np.abs(u[:,None] - np.unique(knots)[None,:]),axis=1)
+
+    return u[ distance > 100.*h ]
+
+
+if __name__ == '__main__':
+    main()
+    print 'NURBS evaluation regression test passed!'
@@ -22,6 +22,7 @@ from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_tone_correction
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_certification_limits
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_source_conditions
 
 from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift.compute_max_lift_coeff import compute_max_lift_coeff
 # ----------------------------------------------------------------------        
@@ -475,9 +476,12 @@ def compute_noise(config,analyses,noise_segment):
     engine_flag       = config.engine_flag  #remove engine noise component from the approach segment
     
     
-    airframe_noise = noise_fidelity_one(config,analyses,noise_segment,print_output,outputfile)  
+    # atmospheric, geometric and jet conditions shared by the airframe and engine noise
+    source_conditions = noise_source_conditions(noise_segment,analyses,config,turbofan)
+    
+    airframe_noise = noise_fidelity_one(config,analyses,noise_segment,print_output,outputfile,source_conditions)  
 
-    engine_noise   = noise_SAE(turbofan,noise_segment,config,analyses,print_output,outputfile_engine)
+    engine_noise   = noise_SAE(turbofan,noise_segment,config,analyses,print_output,outputfile_engine,source_conditions)
 
     noise_sum = 10. * np.log10(10**(airframe_noise[0]/10)+ (engine_flag)*10**(engine_noise[0]/10))
 
@@ -0,0 +1,168 @@
+# nexus_cache.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the hits, misses and tolerance matching of the nexus cache, that
+    the finite difference steps are neither matched nor stored, and that
+    outputs outside the results and summary aren't read from the cache
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+
+from nexus_gradients import nexus_setup, analytic_gradients
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    test_hits_and_misses()
+    test_finite_difference_steps()
+    test_design_points_kept()
+    test_other_aliases()
+
+    return
+
+
+def test_hits_and_misses():
+
+    nexus = nexus_setup()
+    nexus.cache.size      = 2
+    nexus.cache.tolerance = 1e-3
+
+    x = np.array([0.6,-0.4])
+
+    f = nexus.objective(x).astype(float)
+    assert nexus.cache.misses == 1 and nexus.evaluation_count == 1
+
+    # the same inputs again
+    nexus.all_constraints(x)
+    assert nexus.cache.hits == 1 and nexus.evaluation_count == 1
+
+    # new inputs
+    nexus.objective(x+0.1)
+    assert nexus.cache.misses == 2 and nexus.evaluation_count == 2
+
+    # back to x, restored from the cache
+    assert np.array_equal(nexus.objective(x).astype(float),f)
+    assert nexus.cache.hits == 2 and nexus.evaluation_count == 2
+
+    # within the tolerance of x
+    assert np.array_equal(nexus.objective(x+1e-4).astype(float),f)
+    assert nexus.cache.hits == 3 and nexus.evaluation_count == 2
+
+    # the least recently used, x + 0.1, is dropped
+    nexus.objective(x-0.1)
+    assert len(nexus.cache.entries) == 2
+    nexus.objective(x+0.1)
+    assert nexus.cache.misses == 4 and nexus.evaluation_count == 4
+
+    print 'cache hits =', nexus.cache.hits, ', misses =', nexus.cache.misses
+
+    return
+
+
+def test_finite_difference_steps():
+
+    x = np.array([0.6,-0.4])
+    grad_truth, jac_truth = analytic_gradients(x)
+
+    for method in ['forward','central','complex']:
+        nexus = nexus_setup()
+        nexus.cache.tolerance     = 1e-3
+        nexus.gradients.method    = method
+        nexus.gradients.step_size = 1e-20 if method == 'complex' else 1e-7 if method == 'forward' else 1e-5
+
+        f = nexus.objective(x).astype(float)
+        count = nexus.evaluation_count
+
+        grad_obj, jac_con = nexus.finite_difference(x)
+
+        # every step is evaluated, none is matched to x within the tolerance
+        n_steps = 4 if method == 'central' else 2
+        assert nexus.evaluation_count == count + n_steps
+        assert nexus.cache.tolerance == 1e-3
+
+        # and none is stored
+        assert len(nexus.cache.entries) == 1 and nexus.cache.store
+
+        error = max(np.max(np.abs(grad_obj-grad_truth)),np.max(np.abs(jac_con-jac_truth)))
+        print method, 'step gradient error with a cache tolerance =', error
+        assert error < 1e-5
+
+        # x is still cached
+        count = nexus.evaluation_count
+        assert np.array_equal(nexus.objective(x).astype(float),f)
+        assert nexus.evaluation_count == count
+
+    return
+
+
+def test_design_points_kept():
+
+    nexus = nexus_setup()
+    nexus.cache.size = 2
+
+    x0 = np.array([0.6,-0.4])
+    x1 = np.array([0.7,-0.3])
+
+    nexus.objective(x0)
+    nexus.objective(x1)
+
+    # a sweep with more steps than the cache size
+    nexus.gradients.method = 'central'
+    nexus.finite_difference(x1)
+
+    count = nexus.evaluation_count
+    nexus.objective(x0)
+    nexus.objective(x1)
+    assert nexus.evaluation_count == count
+
+    print 'design points kept over the finite difference steps'
+
+    return
+
+
+def test_other_aliases():
+
+    # a constraint read from outside the results and summary
+    nexus = nexus_setup()
+    nexus.optimization_problem.aliases[3] = [ 'c1' , 'design.c1' ]
+    nexus.procedure.constraint = copy_constraint
+
+    x = np.array([0.6,-0.4])
+
+    c = nexus.all_constraints(x).astype(float)
+    nexus.all_constraints(x+0.1)
+
+    # evaluated again, the cache can't restore design.c1
+    assert np.array_equal(nexus.all_constraints(x).astype(float),c)
+    assert nexus.evaluation_count == 3
+    assert len(nexus.cache.entries) == 0
+
+    print 'outputs outside the results and summary are not cached'
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def copy_constraint(nexus):
+
+    nexus.design.c1 = nexus.summary.c1
+
+    return nexus
+
+
+if __name__ == '__main__':
+    main()
+    print 'Nexus cache regression test passed!'
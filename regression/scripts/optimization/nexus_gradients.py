@@ -0,0 +1,247 @@
+# nexus_gradients.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the finite difference gradients of the nexus against the
+    analytic gradients of a toy problem
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import warnings
+
+from SUAVE.Optimization.Nexus import Nexus
+from SUAVE.Optimization.finite_differences import broyden_update
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    test_methods()
+    test_processes()
+    test_broyden()
+    test_complex_warning()
+
+    return
+
+
+def test_methods():
+
+    x = np.array([0.6,-0.4])
+    grad_truth, jac_truth = analytic_gradients(x)
+
+    for method, tolerance in [['forward',1e-5],['central',1e-8],['complex',1e-12]]:
+        nexus = nexus_setup()
+        nexus.gradients.method    = method
+        nexus.gradients.step_size = 1e-20 if method == 'complex' else 1e-7 if method == 'forward' else 1e-5
+
+        grad_obj, jac_con = nexus.finite_difference(x)
+
+        error = max(np.max(np.abs(grad_obj-grad_truth)),np.max(np.abs(jac_con-jac_truth)))
+        print method, 'step gradient error =', error
+        assert error < tolerance
+        assert grad_obj.dtype == float and jac_con.shape == (2,2)
+
+        # the gradients of the same inputs aren't evaluated again
+        count = nexus.evaluation_count
+        nexus.finite_difference(x)
+        assert nexus.evaluation_count == count
+
+    return
+
+
+def test_processes():
+
+    x = np.array([0.6,-0.4])
+
+    serial = nexus_setup()
+    serial.gradients.method = 'central'
+    serial.gradients.step_size = 1e-5
+    grad_serial, jac_serial = serial.finite_difference(x)
+
+    parallel = nexus_setup()
+    parallel.gradients.method = 'central'
+    parallel.gradients.step_size = 1e-5
+    parallel.gradients.number_of_processes = 2
+    grad_parallel, jac_parallel = parallel.finite_difference(x)
+
+    # the parallel processes evaluate the same points
+    assert np.array_equal(grad_parallel,grad_serial)
+    assert np.array_equal(jac_parallel,jac_serial)
+
+    # and leave this process at x
+    assert np.allclose(parallel.design_vector(),x)
+    assert np.allclose(parallel.objective(x).astype(float),serial.objective(x).astype(float))
+
+    print 'parallel gradients identical to the serial gradients'
+
+    return
+
+
+def test_broyden():
+
+    nexus = nexus_setup()
+    nexus.gradients.method          = 'central'
+    nexus.gradients.step_size       = 1e-5
+    nexus.gradients.broyden_updates = 1
+
+    x0 = np.array([0.6,-0.4])
+    x1 = np.array([0.61,-0.41])
+    x2 = np.array([0.62,-0.42])
+
+    nexus.finite_difference(x0)
+    last = nexus.last_gradients
+
+    # one update of the last jacobian, without perturbed evaluations
+    count = nexus.evaluation_count
+    grad_obj, jac_con = nexus.finite_difference(x1)
+    assert nexus.evaluation_count == count + 1
+    assert nexus.last_gradients.updates == 1
+
+    J = np.vstack([grad_obj,jac_con])
+    F = nexus.last_gradients.values
+    assert np.allclose(J,broyden_update(last.jacobian,x1-x0,F-last.values),rtol=1e-12)
+
+    # the secant condition holds
+    assert np.allclose(np.dot(J,x1-x0),F-last.values,rtol=1e-10)
+
+    # and the update is within the change of the analytic gradients over the step
+    grad_truth, jac_truth = analytic_gradients(x1)
+    grad_last,  jac_last  = analytic_gradients(x0)
+    error  = max(np.max(np.abs(grad_obj-grad_truth)),np.max(np.abs(jac_con-jac_truth)))
+    change = max(np.max(np.abs(grad_last-grad_truth)),np.max(np.abs(jac_last-jac_truth)))
+    print 'Broyden update gradient error =', error, ', gradient change =', change
+    assert error < 2.*change
+
+    # the allowed updates are used, the finite differences are back
+    grad_obj, jac_con = nexus.finite_difference(x2)
+    assert nexus.last_gradients.updates == 0
+
+    grad_truth, jac_truth = analytic_gradients(x2)
+    error = max(np.max(np.abs(grad_obj-grad_truth)),np.max(np.abs(jac_con-jac_truth)))
+    assert error < 1e-8
+
+    return
+
+
+def test_complex_warning():
+
+    # a procedure that drops the imaginary parts
+    nexus = nexus_setup(real_procedure=True)
+    nexus.gradients.method    = 'complex'
+    nexus.gradients.step_size = 1e-20
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        grad_obj, jac_con = nexus.finite_difference(np.array([0.6,-0.4]))
+
+    assert any([ issubclass(w.category,RuntimeWarning) for w in caught ])
+    assert np.all(grad_obj == 0.)
+
+    print 'complex step without imaginary parts warned'
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def nexus_setup(real_procedure=False):
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    # [ tag , initial, (lb,ub), scaling, units ]
+    problem.inputs = np.array([
+        [ 'x1' ,  1.2 , ( -4. ,  4. ) , 2.  , Units.less],
+        [ 'x2' , -0.8 , ( -4. ,  4. ) , 2.  , Units.less],
+    ])
+
+    # [ tag, scaling, units ]
+    problem.objective = np.array([
+        [ 'f' , 10. , Units.less],
+    ])
+
+    # [ tag, sense, edge, scaling, units ]
+    problem.constraints = np.array([
+        [ 'c1' , '>' , 0. , 1.  , Units.less],
+        [ 'c2' , '<' , 0. , 0.5 , Units.less],
+    ])
+
+    # [ 'alias' , ['data.path1.name','data.path2.name'] ]
+    problem.aliases = [
+        [ 'x1' , 'design.x1' ],
+        [ 'x2' , 'design.x2' ],
+        [ 'f'  , 'summary.f' ],
+        [ 'c1' , 'summary.c1'],
+        [ 'c2' , 'summary.c2'],
+    ]
+
+    nexus.design = Data()
+
+    procedure = SUAVE.Analyses.Process()
+    if real_procedure:
+        procedure.toy = toy_procedure_real
+    else:
+        procedure.toy = toy_procedure
+    nexus.procedure = procedure
+
+    return nexus
+
+
+def toy_procedure(nexus):
+
+    x1 = nexus.design.x1
+    x2 = nexus.design.x2
+
+    nexus.summary.f  = x1**2 + 3.*x1*x2 + np.exp(x2)
+    nexus.summary.c1 = x1*x2**2
+    nexus.summary.c2 = np.sin(x1) - x2
+
+    return nexus
+
+
+def toy_procedure_real(nexus):
+
+    nexus.design.x1 = np.real(nexus.design.x1)
+    nexus.design.x2 = np.real(nexus.design.x2)
+
+    return toy_procedure(nexus)
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def analytic_gradients(x):
+    """ the gradients of the scaled objective and constraints of the toy
+        problem at the scaled inputs x
+    """
+
+    x1, x2 = x*2.
+
+    # derivatives to the unscaled inputs
+    df  = np.array([ 2.*x1 + 3.*x2 , 3.*x1 + np.exp(x2) ])
+    dc1 = np.array([ x2**2 , 2.*x1*x2 ])
+    dc2 = np.array([ np.cos(x1) , -1. ])
+
+    grad_obj = df * 2. / 10.
+    jac_con  = np.array([ dc1 * 2. / 1. , dc2 * 2. / 0.5 ])
+
+    return grad_obj, jac_con
+
+
+if __name__ == '__main__':
+    main()
+    print 'Nexus gradients regression test passed!'
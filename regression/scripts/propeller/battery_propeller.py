@@ -0,0 +1,262 @@
+# battery_propeller.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the battery propeller network, which converges the motor and
+    propeller together, against the fixed point iteration on the propeller
+    power coefficient
+"""
+
+#----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+from copy import deepcopy
+
+from SUAVE.Components.Energy.Networks.Battery_Propeller import Battery_Propeller
+from SUAVE.Methods.Propulsion import propeller_design
+from SUAVE.Methods.Power.Battery.Sizing import initialize_from_mass
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    net = network_setup()
+
+    test_fixed_point(net)
+    test_call_history(net)
+    test_reverse(net)
+
+    return
+
+
+def test_fixed_point(net):
+
+    state = state_setup(net)
+    results = net(state)
+
+    F   = results.thrust_force_vector[:,0,None]
+    rpm = state.conditions.propulsion.rpm
+
+    # the spin and motor fixed point iteration the network used before
+    F_truth, omega_truth = fixed_point(net,state_setup(net))
+    rpm_truth = omega_truth*60./(2.*np.pi)
+
+    error = Data()
+    error.Thrust = np.max(np.abs(F-F_truth)/np.abs(F_truth))
+    error.RPM    = np.max(np.abs(rpm-rpm_truth)/rpm_truth)
+
+    print 'Errors to the fixed point iteration:'
+    print error
+
+    # spin stops once the inflow angles move by less than 1e-5
+    for k,v in error.items():
+        assert(np.abs(v)<1e-3)
+
+    assert np.all(net.propeller.outputs.converged)
+
+    return
+
+
+def test_call_history(net):
+
+    # a fresh network and state
+    state = state_setup(net)
+    net_fresh = deepcopy(net)
+    net_fresh(state)
+    rpm_fresh = state.conditions.propulsion.rpm
+
+    # after running other conditions, of another size, with the same network
+    other = state_setup(net,n_points=5,velocity=25.)
+    net(other)
+
+    state = state_setup(net)
+    net(state)
+
+    error = np.max(np.abs(state.conditions.propulsion.rpm-rpm_fresh)/rpm_fresh)
+    print 'RPM error after other conditions =', error
+    assert error < 1e-8
+
+    # the segment keeps its inflow angles for the next iteration
+    inflow_angles = state.conditions.propulsion.propeller_inflow_angles
+    assert inflow_angles.shape == (3,len(net.propeller.prop_attributes.chord_distribution))
+
+    net(state)
+    assert np.all(net.propeller.outputs.iterations <= 2)
+
+    return
+
+
+def test_reverse(net):
+
+    state      = state_setup(net)
+    conditions = state.conditions
+    motor      = net.motor
+    propeller  = net.propeller
+
+    motor.inputs.voltage = 40.
+    F_forward, Q, P, Cp  = propeller.spin_coupled(conditions,motor)
+    omega_forward        = propeller.inputs.omega*1.
+
+    # a negative voltage turns the propeller backwards
+    motor.inputs.voltage = -40.
+    F_reverse, Q, P, Cp  = propeller.spin_coupled(conditions,motor)
+    omega_reverse        = propeller.inputs.omega*1.
+
+    assert np.all(F_forward > 0.)
+    assert np.allclose(F_reverse,-F_forward,rtol=1e-8)
+    assert np.allclose(omega_reverse,-omega_forward,rtol=1e-8)
+
+    print 'reverse thrust =', F_reverse[:,0]
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def network_setup():
+
+    net = Battery_Propeller()
+    net.number_of_engines = 1.
+    net.nacelle_diameter  = 0.2
+    net.voltage           = 50.
+
+    # the ESC
+    esc = SUAVE.Components.Energy.Distributors.Electronic_Speed_Controller()
+    esc.efficiency = 0.95
+    net.esc        = esc
+
+    # the propeller
+    prop_attributes = Data()
+    prop_attributes.number_blades       = 2.0
+    prop_attributes.freestream_velocity = 10.0
+    prop_attributes.angular_velocity    = 5887.*(2.*np.pi/60.0)
+    prop_attributes.tip_radius          = 0.4064
+    prop_attributes.hub_radius          = 0.05
+    prop_attributes.design_Cl           = 0.7
+    prop_attributes.design_altitude     = 0.0 * Units.km
+    prop_attributes.design_thrust       = 0.0
+    prop_attributes.design_power        = 7500.
+    prop_attributes                     = propeller_design(prop_attributes)
+
+    prop                 = SUAVE.Components.Energy.Converters.Propeller()
+    prop.prop_attributes = prop_attributes
+    net.propeller        = prop
+
+    # the motor
+    motor = SUAVE.Components.Energy.Converters.Motor()
+    motor.resistance           = 0.01
+    motor.no_load_current      = 8.0
+    motor.speed_constant       = 140.*(2.*np.pi/60.)
+    motor.propeller_radius     = prop.prop_attributes.tip_radius
+    motor.propeller_Cp         = prop.prop_attributes.Cp
+    motor.gear_ratio           = 1.
+    motor.gearbox_efficiency   = 1.
+    motor.expected_current     = 260.
+    motor.mass_properties.mass = 2.0
+    net.motor                  = motor
+
+    # the payload and avionics
+    payload = SUAVE.Components.Energy.Peripherals.Payload()
+    payload.power_draw           = 10.
+    payload.mass_properties.mass = 0. * Units.kg
+    net.payload                  = payload
+
+    avionics = SUAVE.Components.Energy.Peripherals.Avionics()
+    avionics.power_draw = 20.
+    net.avionics        = avionics
+
+    # the battery
+    bat = SUAVE.Components.Energy.Storages.Batteries.Constant_Mass.Lithium_Ion()
+    bat.resistance     = 0.0
+    bat.energy_density = 250.
+    initialize_from_mass(bat,50.)
+    bat.current_energy = bat.max_energy
+    net.battery = bat
+
+    return net
+
+
+def state_setup(net,n_points=3,velocity=10.):
+
+    state            = Data()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.numerics   = SUAVE.Analyses.Mission.Segments.Conditions.Numerics()
+
+    conditions = state.conditions
+    numerics   = state.numerics
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    altitude   = np.linspace(0.,2000.,n_points)[:,None]
+    atmo_data  = atmosphere.compute_values(altitude)
+
+    ones = np.ones([n_points,1])
+
+    conditions.propulsion.throttle            = np.linspace(0.6,1.0,n_points)[:,None]
+    conditions.freestream.velocity            = velocity*ones
+    conditions.freestream.density             = atmo_data.density
+    conditions.freestream.dynamic_viscosity   = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound      = atmo_data.speed_of_sound
+    conditions.freestream.temperature         = atmo_data.temperature
+    conditions.freestream.altitude            = altitude
+    conditions.propulsion.battery_energy      = net.battery.max_energy*ones
+    conditions.frames.inertial.time           = np.linspace(0.,10.,n_points)[:,None]
+
+    # first order operators on the evenly spaced times
+    dt = 10./max(n_points-1,1)
+    numerics.time.integrate     = np.tril(np.ones([n_points,n_points]),-1) * dt
+    numerics.time.differentiate = (np.eye(n_points) - np.eye(n_points,k=-1)) / dt
+    numerics.time.differentiate[0,0] = 0.
+
+    return state
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def fixed_point(net,state):
+    """ the thrust and rotation rate of the motor and propeller, from
+        the iteration on the power coefficient the network used before
+    """
+
+    conditions = state.conditions
+    motor      = deepcopy(net.motor)
+    propeller  = deepcopy(net.propeller)
+    esc        = deepcopy(net.esc)
+
+    esc.inputs.voltagein = net.voltage
+    esc.voltageout(conditions)
+    motor.inputs.voltage = esc.outputs.voltageout
+
+    motor.omega(conditions)
+    propeller.inputs.omega = motor.outputs.omega
+    F, Q, P, Cplast = propeller.spin(conditions)
+
+    diff = abs(Cplast-motor.propeller_Cp)
+    while (np.any(diff>1e-10)):
+        motor.propeller_Cp     = Cplast
+        motor.omega(conditions)
+        propeller.inputs.omega = motor.outputs.omega
+        F, Q, P, Cplast        = propeller.spin(conditions)
+        diff                   = abs(Cplast-motor.propeller_Cp)
+
+    return F, motor.outputs.omega
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    print 'Battery propeller regression test passed!'
@@ -0,0 +1,156 @@
+# performance_map.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the propeller performance map against the blade element
+    solution, and the filling of points that did not converge
+"""
+
+#----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import warnings
+
+from SUAVE.Methods.Propulsion import propeller_design
+from SUAVE.Methods.Propulsion.propeller_map import propeller_map, fill_failed
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    test_fill_failed()
+    test_map()
+
+    return
+
+
+def test_fill_failed():
+
+    J  = np.linspace(0.,1.,5)
+    Mt = np.linspace(0.2,0.6,3)
+    Re = np.linspace(5.,6.,4)
+
+    truth = J[:,None,None] + 2.*Mt[None,:,None] + 3.*Re[None,None,:]
+
+    # a point, a whole column of advance ratios and a whole Reynolds number fail
+    values = truth*1.
+    values[2,0,0] = np.nan
+    values[:,1,2] = np.nan
+    values[:,:,3] = np.nan
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        filled = fill_failed(values,[J,Mt,Re])
+
+    assert len(caught) == 3
+    assert np.all(np.isfinite(filled))
+
+    # linear between the converged points, held beyond them
+    assert np.allclose(filled[:,:,:3],truth[:,:,:3],rtol=0.,atol=1e-12)
+    assert np.allclose(filled[:,:,3],truth[:,:,2],rtol=0.,atol=1e-12)
+
+    # nothing to fill from
+    try:
+        fill_failed(values*np.nan,[J,Mt,Re])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError, 'an empty propeller map was filled'
+
+    print 'failed propeller map points filled'
+
+    return
+
+
+def test_map():
+
+    prop = propeller_setup()
+
+    # a map around the design point, J = 0.5, tip Mach 0.92 and Re 7.1e4
+    omega = prop.prop_attributes.angular_velocity
+
+    advance_ratio   = np.linspace(0.2,0.8,9)
+    tip_mach        = np.linspace(0.8,1.0,5)
+    reynolds_number = np.logspace(4.5,5.,5)
+
+    performance_map = propeller_map(prop,advance_ratio,tip_mach,reynolds_number)
+
+    assert np.all(np.isfinite(performance_map.thrust_coefficient))
+    assert np.all(np.isfinite(performance_map.power_coefficient))
+
+    # the blade element solution at the design point
+    conditions = conditions_setup(prop)
+
+    prop.inputs.omega = np.array([[omega]])
+    F, Q, P, Cp = prop.spin(conditions)
+
+    prop.performance_map = performance_map
+    F_map, Q_map, P_map, Cp_map = prop.spin(conditions)
+
+    error = Data()
+    error.Thrust = np.abs(F_map[0,0]-F[0,0])/F[0,0]
+    error.Power  = np.abs(P_map[0,0]-P[0,0])/P[0,0]
+
+    print 'Map errors to the blade element solution:'
+    print error
+
+    for k,v in error.items():
+        assert(np.abs(v)<0.02)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def propeller_setup():
+
+    prop_attributes = Data()
+    prop_attributes.number_blades       = 2.0
+    prop_attributes.freestream_velocity = 50.0
+    prop_attributes.angular_velocity    = 2000.*(2.*np.pi/60.0)
+    prop_attributes.tip_radius          = 1.5
+    prop_attributes.hub_radius          = 0.05
+    prop_attributes.design_Cl           = 0.7
+    prop_attributes.design_altitude     = 0.0 * Units.km
+    prop_attributes.design_thrust       = 0.0
+    prop_attributes.design_power        = 7000.
+    prop_attributes                     = propeller_design(prop_attributes)
+
+    prop                 = SUAVE.Components.Energy.Converters.Propeller()
+    prop.prop_attributes = prop_attributes
+
+    return prop
+
+
+def conditions_setup(prop):
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere_conditions = atmosphere.compute_values(0.)
+
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.propulsion = Data()
+    conditions.freestream.update(atmosphere_conditions)
+    conditions.freestream.velocity = np.array([[prop.prop_attributes.freestream_velocity]])
+    conditions.propulsion.throttle = np.array([[1.0]])
+
+    return conditions
+
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
+    print 'Propeller map regression test passed!'
@@ -0,0 +1,145 @@
+# colored_jacobian.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the colored finite difference jacobian against a dense one
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+
+from SUAVE.Methods.Missions.Segments import colored_jacobian
+from SUAVE.Methods.Missions.Segments.converge_root import iterate
+
+from segment_setup import full_setup, cruise_segment, acceleration_segment
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+
+    test_scalar_unknowns(analyses)
+    test_unmatched_residuals(analyses)
+    test_converge(analyses)
+
+    return
+
+
+def test_scalar_unknowns(analyses):
+
+    # a segment with the scalar unknown time and scalar residual final_velocity_error
+    segment = acceleration_segment(analyses)
+    state   = segment.state.clone()
+    segment.process.initialize(segment,state)
+
+    unknowns = state.unknowns.pack_array()
+
+    J_colored = colored_jacobian(unknowns,(segment,state))
+    J_dense   = dense_jacobian(unknowns,(segment,state))
+
+    n = state.numerics.number_control_points
+
+    # packing order, body_angle and velocity_x at the control points, then time
+    body_angle = np.arange(0,n)
+    time       = 2*n
+
+    # residuals, final_velocity_error then forces at the control points
+    final_velocity_error = 0
+    forces               = np.arange(1,2*n+1)
+
+    # the scalar unknown has its full column
+    error = np.max(np.abs(J_colored[:,time]-J_dense[:,time])) / np.max(np.abs(J_dense[:,time]))
+    print 'scalar unknown column error =', error
+    assert error < 1e-12
+
+    # body angle only acts at its own control point
+    error = np.max(np.abs(J_colored[np.ix_(forces,body_angle)]-J_dense[np.ix_(forces,body_angle)])) \
+          / np.max(np.abs(J_dense[np.ix_(forces,body_angle)]))
+    print 'control point block error =', error
+    assert error < 1e-6
+
+    # the scalar residual keeps the derivative along each color
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(unknowns),1.)
+    for color in [np.arange(0,n),np.arange(n,2*n)]:
+        slope_colored = np.dot(J_colored[final_velocity_error,color],h[color])
+        slope_dense   = np.dot(J_dense  [final_velocity_error,color],h[color])
+        print 'scalar residual slope =', slope_colored, slope_dense
+        assert np.abs(slope_colored-slope_dense) <= 1e-6 * max(np.abs(slope_dense),1e-12)
+
+    # every residual is coupled to the unknowns
+    assert np.all(np.any(J_colored != 0.,axis=1))
+
+    return
+
+
+def test_unmatched_residuals(analyses):
+
+    # a residual at a control point without unknowns can't be colored
+    segment = cruise_segment(analyses)
+    state   = segment.state.clone()
+    segment.process.initialize(segment,state)
+
+    n = state.numerics.number_control_points
+    state.residuals.extra = np.zeros([n+1,1])
+
+    try:
+        colored_jacobian(state.unknowns.pack_array(),(segment,state))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError, 'unmatched residuals were not detected'
+
+    return
+
+
+def test_converge(analyses):
+
+    # converged solutions agree with the default jacobian
+    segment = cruise_segment(analyses)
+    state_default = segment.evaluate()
+
+    segment.settings.jacobian = colored_jacobian
+    state_colored = segment.evaluate()
+
+    for key in ['throttle','body_angle']:
+        default = state_default.unknowns[key]
+        colored = state_colored.unknowns[key]
+        error   = np.max(np.abs(colored-default)/np.abs(default))
+        print 'converged', key, 'error =', error
+        assert error < 1e-6
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def dense_jacobian(unknowns,(segment,state)):
+    """ forward differences, one unknown at a time """
+
+    residuals = iterate(unknowns,(segment,state))
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(unknowns),1.)
+
+    J = np.zeros([len(residuals),len(unknowns)])
+    for i in range(len(unknowns)):
+        x = unknowns.copy()
+        x[i] = x[i] + h[i]
+        J[:,i] = (iterate(x,(segment,state)) - residuals) / h[i]
+
+    state.unknowns.unpack_array(unknowns)
+
+    return J
+
+
+if __name__ == '__main__':
+    main()
+    print 'Colored jacobian regression test passed!'
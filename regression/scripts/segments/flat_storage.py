@@ -0,0 +1,116 @@
+# flat_storage.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks that flat storage of the unknowns and residuals packs and
+    unpacks as the nested conditions do, and gives the same mission results
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+
+from segment_setup import full_setup, mission_setup_B737, acceleration_segment
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+
+    test_pack_unpack(analyses)
+    test_mission(analyses)
+
+    return
+
+
+def test_pack_unpack(analyses):
+
+    # the acceleration segment has the scalar unknown time
+    states = []
+    for flat_storage in [False,True]:
+        segment = acceleration_segment(analyses)
+        segment.state.numerics.flat_storage = flat_storage
+        state = segment.state.clone()
+        segment.process.initialize(segment,state)
+        states.append(state)
+
+    default, flat = states
+
+    assert flat.unknowns._layout is not None and default.unknowns._layout is None
+
+    # the same vector
+    assert np.array_equal(flat.unknowns.pack_array(),default.unknowns.pack_array())
+    assert np.array_equal(flat.residuals.pack_array(),default.residuals.pack_array())
+
+    # unpacked into the same leaves
+    x = np.random.RandomState(0).rand(len(default.unknowns.pack_array()))
+    default.unknowns.unpack_array(x)
+    flat.unknowns.unpack_array(x)
+    assert_identical(default.unknowns,flat.unknowns)
+    assert np.array_equal(flat.unknowns.pack_array(),x)
+
+    # a reassigned leaf is packed from its new value
+    n = default.numerics.number_control_points
+    for state in states:
+        state.unknowns.body_angle = np.linspace(0.,0.1,n)[:,None]
+        state.unknowns.time       = 123.
+    assert np.array_equal(flat.unknowns.pack_array(),default.unknowns.pack_array())
+
+    # an added leaf changes the layout
+    for state in states:
+        state.residuals.extra = np.ones([n,1])
+    assert np.array_equal(flat.residuals.pack_array(),default.residuals.pack_array())
+
+    print 'flat storage packs and unpacks as the nested conditions'
+
+    return
+
+
+def test_mission(analyses):
+
+    mission = mission_setup_B737(analyses)
+    state_default = mission.evaluate()
+
+    mission = mission_setup_B737(analyses)
+    for segment in mission.segments:
+        segment.state.numerics.flat_storage = True
+    state_flat = mission.evaluate()
+
+    for segment_state in state_flat.segments:
+        assert segment_state.unknowns._layout is not None
+
+    assert_identical(state_default.merged().conditions,state_flat.merged().conditions)
+
+    print 'flat storage mission results identical to the default'
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def assert_identical(A,B,path='conditions'):
+
+    assert sorted(A.keys()) == sorted(B.keys()), 'keys of %s differ' % path
+
+    for key,a in A.items():
+        b = B[key]
+        if isinstance(a,dict):
+            assert_identical(a,b,path+'.'+key)
+        elif isinstance(a,(np.ndarray,float,int)):
+            assert np.array_equal(a,b), '%s.%s differs' % (path,key)
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'Flat storage regression test passed!'
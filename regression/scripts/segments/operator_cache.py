@@ -0,0 +1,161 @@
+# operator_cache.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks that the cached discretization operators and the states that
+    aren't expanded again give the results of rebuilding them
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import sys
+
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, linear_data, \
+     discretization_operators, clear_operator_cache
+
+from segment_setup import full_setup, mission_setup_B737, cruise_segment
+
+# the module, the package attribute is the function
+operator_cache = sys.modules['SUAVE.Methods.Utilities.Chebyshev.discretization_operators']
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    test_operators()
+    test_cache_size()
+
+    configs, analyses = full_setup()
+
+    test_expand_rows(analyses)
+    test_mission(analyses)
+
+    return
+
+
+def test_operators():
+
+    clear_operator_cache()
+
+    for method in [chebyshev_data,linear_data]:
+        for N in [4,16]:
+            x,D,I = discretization_operators(method,N)
+            x_truth,D_truth,I_truth = method(N)
+
+            assert np.array_equal(x,x_truth)
+            assert np.array_equal(D,D_truth)
+            assert np.array_equal(I,I_truth)
+
+            # shared and read-only
+            assert discretization_operators(method,N)[1] is D
+            assert not D.flags.writeable
+
+    # plain options are part of the key, others aren't
+    x,D,I = discretization_operators(chebyshev_data,4,integration=False)
+    assert I is None
+    assert discretization_operators(chebyshev_data,4,integration=False,D=np.eye(4))[1] is D
+
+    print 'cached operators identical to the discretization methods'
+
+    return
+
+
+def test_cache_size():
+
+    clear_operator_cache()
+
+    cache_size = operator_cache.cache_size
+    operator_cache.cache_size = 2
+
+    try:
+        D4 = discretization_operators(chebyshev_data,4)[1]
+        D5 = discretization_operators(chebyshev_data,5)[1]
+
+        # 4 is used, so 5 is the least recently used
+        discretization_operators(chebyshev_data,4)
+        discretization_operators(chebyshev_data,6)
+
+        assert discretization_operators(chebyshev_data,4)[1] is D4
+        assert discretization_operators(chebyshev_data,5)[1] is not D5
+        assert len(operator_cache._cache) == 2
+
+    finally:
+        operator_cache.cache_size = cache_size
+        clear_operator_cache()
+
+    return
+
+
+def test_expand_rows(analyses):
+
+    segment = cruise_segment(analyses)
+    state   = segment.state.clone()
+    segment.process.initialize(segment,state)
+
+    n = state.numerics.number_control_points
+    throttle = state.unknowns.throttle
+
+    # expanding to the same rows keeps the arrays
+    state.expand_rows(n)
+    assert state.unknowns.throttle is throttle
+
+    # a reset state is expanded again
+    state.reset()
+    state.expand_rows(n)
+    assert state.unknowns.throttle.shape == (n,1)
+
+    print 'states expanded once per number of rows'
+
+    return
+
+
+def test_mission(analyses):
+
+    # rebuild the operators on every call
+    cache_size = operator_cache.cache_size
+    operator_cache.cache_size = 0
+
+    try:
+        mission = mission_setup_B737(analyses)
+        state_rebuilt = mission.evaluate()
+    finally:
+        operator_cache.cache_size = cache_size
+
+    mission = mission_setup_B737(analyses)
+    state_cached = mission.evaluate()
+
+    assert_identical(state_rebuilt.merged().conditions,state_cached.merged().conditions)
+
+    print 'cached operator mission results identical to rebuilt operators'
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def assert_identical(A,B,path='conditions'):
+
+    assert sorted(A.keys()) == sorted(B.keys()), 'keys of %s differ' % path
+
+    for key,a in A.items():
+        b = B[key]
+        if isinstance(a,dict):
+            assert_identical(a,b,path+'.'+key)
+        elif isinstance(a,np.ndarray):
+            assert np.array_equal(a,b), '%s.%s differs' % (path,key)
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'Operator cache regression test passed!'
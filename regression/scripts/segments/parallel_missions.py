@@ -0,0 +1,122 @@
+# parallel_missions.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks that missions evaluated in worker processes give the results of
+    a serial evaluation, in the same order
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+import warnings
+
+from SUAVE.Methods.Missions import evaluate_missions
+
+from segment_setup import full_setup, mission_setup_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+
+    test_deltas(analyses)
+    test_container(analyses)
+    test_serial_fallback(analyses)
+
+    return
+
+
+def test_deltas(analyses):
+
+    mission = mission_setup_B737(analyses)
+
+    distances = np.array([2500.,3000.,3500.]) * Units.km
+    deltas    = [ {'segments.cruise.distance':d} for d in distances ]
+
+    results_serial   = evaluate_missions(mission,number_of_processes=1,deltas=deltas)
+    results_parallel = evaluate_missions(mission,number_of_processes=2,deltas=deltas)
+
+    assert len(results_parallel) == len(distances)
+
+    # in the order of the deltas
+    ranges = [ r.segments.cruise.conditions.frames.inertial.position_vector[-1,0] - \
+               r.segments.cruise.conditions.frames.inertial.position_vector[0,0] for r in results_parallel ]
+    assert np.allclose(ranges,distances,rtol=1e-6)
+
+    for serial,parallel in zip(results_serial,results_parallel):
+        assert_identical(serial.merged().conditions,parallel.merged().conditions)
+
+    print 'parallel mission deltas identical to the serial evaluation'
+
+    return
+
+
+def test_container(analyses):
+
+    missions = SUAVE.Analyses.Mission.Mission.Container()
+    missions.short = mission_setup_B737(analyses)
+    missions.short.segments.cruise.distance = 2000. * Units.km
+    missions.long  = mission_setup_B737(analyses)
+
+    results_serial   = missions.evaluate()
+    results_parallel = missions.evaluate(number_of_processes=2)
+
+    assert results_parallel.keys() == ['short','long']
+
+    for key in missions.keys():
+        assert_identical(results_serial[key].merged().conditions,results_parallel[key].merged().conditions)
+
+    print 'parallel mission container identical to the serial evaluation'
+
+    return
+
+
+def test_serial_fallback(analyses):
+
+    # a mission that can't be pickled is evaluated here
+    mission = mission_setup_B737(analyses)
+    deltas  = [ {'segments.cruise.unpicklable':lambda x: x} ]
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        results = evaluate_missions(mission,number_of_processes=2,deltas=deltas+deltas)
+
+    assert any([ issubclass(w.category,RuntimeWarning) for w in caught ])
+    assert len(results) == 2
+
+    print 'unpicklable missions evaluated serially'
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def assert_identical(A,B,path='conditions'):
+
+    assert sorted(A.keys()) == sorted(B.keys()), 'keys of %s differ' % path
+
+    for key,a in A.items():
+        b = B[key]
+        if isinstance(a,dict):
+            assert_identical(a,b,path+'.'+key)
+        elif isinstance(a,np.ndarray):
+            assert np.array_equal(a,b), '%s.%s differs' % (path,key)
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'Parallel missions regression test passed!'
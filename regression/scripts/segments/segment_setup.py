@@ -0,0 +1,86 @@
+# segment_setup.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" B737 analyses and segments shared by the segment regression scripts
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+sys.path.append('../B737')
+
+import SUAVE
+from SUAVE.Core import Units
+
+from mission_B737 import vehicle_setup, configs_setup, analyses_setup, simple_sizing, mission_setup
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def full_setup():
+    """ configs, analyses = full_setup()
+        the sized B737 configurations and their finalized analyses
+    """
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = analyses_setup(configs)
+
+    simple_sizing(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    return configs, analyses
+
+
+def mission_setup_B737(analyses):
+    """ the B737 regression mission """
+
+    return mission_setup(analyses)
+
+
+def cruise_segment(analyses):
+    """ a cruise at constant speed, unknowns at the control points only """
+
+    segment = SUAVE.Analyses.Mission.Segments.Cruise.Constant_Speed_Constant_Altitude()
+    segment.tag = 'cruise'
+
+    segment.analyses.extend( analyses.cruise )
+
+    segment.altitude  = 10.668  * Units.km
+    segment.air_speed = 230.412 * Units['m/s']
+    segment.distance  = 1000.   * Units.km
+
+    segment.state.numerics.number_control_points = 8
+
+    segment.state.conditions.weights.total_mass = segment.state.ones_row(1) * 70000.
+
+    return segment
+
+
+def acceleration_segment(analyses):
+    """ an acceleration at constant throttle, with the scalar unknown time
+        and the scalar residual final_velocity_error
+    """
+
+    segment = SUAVE.Analyses.Mission.Segments.Cruise.Constant_Throttle_Constant_Altitude()
+    segment.tag = 'acceleration'
+
+    segment.analyses.extend( analyses.cruise )
+
+    segment.altitude       = 10.668 * Units.km
+    segment.throttle       = 0.9
+    segment.air_speed_start = 200.  * Units['m/s']
+    segment.air_speed_end   = 220.  * Units['m/s']
+
+    segment.state.numerics.number_control_points = 8
+
+    segment.state.conditions.weights.total_mass = segment.state.ones_row(1) * 70000.
+
+    return segment
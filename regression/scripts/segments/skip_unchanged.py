@@ -0,0 +1,181 @@
+# skip_unchanged.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks that processes skipping unchanged steps give the results of a
+    full evaluation
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Analyses.Process import Process, step_graph
+from SUAVE.Methods.Missions.Segments.Common.Aerodynamics import update_atmosphere, update_freestream
+
+from segment_setup import full_setup, mission_setup_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    test_dependencies()
+
+    configs, analyses = full_setup()
+
+    test_mission(analyses)
+
+    return
+
+
+def test_dependencies():
+
+    calls = []
+
+    def scale(data):
+        calls.append('scale')
+        data.b = data.a * data.factor
+    scale.reads  = ('data.a','data.factor')
+    scale.writes = ('data.b',)
+
+    def offset(data):
+        calls.append('offset')
+        data.c = data.b + 1.
+    offset.reads  = ('data.b',)
+    offset.writes = ('data.c',)
+
+    def total(data):
+        calls.append('total')
+        data.d = np.sum(data.c)
+
+    def double(data):
+        calls.append('double')
+        data.e = 2. * data.d
+    double.reads  = ('data.d',)
+    double.writes = ('data.e',)
+
+    process = Process()
+    process.skip_unchanged = True
+    process.scale  = scale
+    process.offset = offset
+    process.total  = total
+    process.double = double
+
+    data = Data()
+    data.a = np.array([1.,2.,3.])
+    data.factor = 2.
+
+    # offset follows scale, double is compared after the undeclared total
+    graph = step_graph(process.items())
+    assert graph['offset'][3] == ['scale'] and graph['offset'][1] == [('data','c')]
+    assert graph['total'] is None
+    assert graph['double'][3] == [] and graph['double'][1] == [('data','d'),('data','e')]
+
+    process(data)
+    assert calls == ['scale','offset','total','double']
+
+    # nothing changed, only the undeclared step runs
+    del calls[:]
+    process(data)
+    assert calls == ['total']
+
+    # a changed input runs its readers
+    del calls[:]
+    data.factor = 3.
+    process(data)
+    assert calls == ['scale','offset','total','double']
+    assert np.array_equal(data.e,2.*np.sum(3.*data.a+1.))
+
+    # a changed output is put back
+    del calls[:]
+    data.c = data.c * 0.
+    process(data)
+    assert calls == ['offset','total']
+    assert np.array_equal(data.c,3.*data.a+1.)
+
+    # a step that runs to the same writes doesn't run its readers
+    del calls[:]
+    data.b = data.b * 0.
+    process(data)
+    assert calls == ['scale','total']
+
+    print 'process dependencies skip the unchanged steps'
+
+    return
+
+
+def test_mission(analyses):
+
+    mission = mission_setup_B737(analyses)
+    state_default = mission.evaluate()
+
+    # count the atmosphere and freestream evaluations
+    calls = Data(atmosphere=0,freestream=0,conditions=0)
+
+    def atmosphere(segment,state):
+        calls.atmosphere += 1
+        return update_atmosphere(segment,state)
+    atmosphere.reads  = update_atmosphere.reads
+    atmosphere.writes = update_atmosphere.writes
+
+    def freestream(segment,state):
+        calls.freestream += 1
+        return update_freestream(segment,state)
+    freestream.reads  = update_freestream.reads
+    freestream.writes = update_freestream.writes
+
+    def count(segment,state):
+        calls.conditions += 1
+
+    mission = mission_setup_B737(analyses)
+    for segment in mission.segments:
+        conditions = segment.process.iterate.conditions
+        conditions.skip_unchanged = True
+        conditions.atmosphere     = atmosphere
+        conditions.freestream     = freestream
+        conditions.count          = count
+
+    state_skipping = mission.evaluate()
+
+    assert_identical(state_default.merged().conditions,state_skipping.merged().conditions)
+
+    # the ram of the turbofan writes the speed of sound of its gas model, so
+    # the atmosphere runs again, the freestream follows the atmosphere's
+    # writes and only runs when the velocities or the atmosphere move
+    print 'atmosphere evaluations =', calls.atmosphere, ', freestream evaluations =', calls.freestream, \
+          ', of', calls.conditions
+    assert calls.freestream < calls.conditions
+
+    print 'skipping mission results identical to a full evaluation'
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def assert_identical(A,B,path='conditions'):
+
+    assert sorted(A.keys()) == sorted(B.keys()), 'keys of %s differ' % path
+
+    for key,a in A.items():
+        b = B[key]
+        if isinstance(a,dict):
+            assert_identical(a,b,path+'.'+key)
+        elif isinstance(a,np.ndarray):
+            assert np.array_equal(a,b), '%s.%s differs' % (path,key)
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'Skip unchanged regression test passed!'
@@ -0,0 +1,101 @@
+# state_reset.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks that cloned, reset and re-evaluated states give the results
+    of a fresh state
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+from copy import deepcopy
+
+from segment_setup import full_setup, mission_setup_B737, cruise_segment
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+
+    test_segment_clone(analyses)
+    test_mission_reset(analyses)
+
+    return
+
+
+def test_segment_clone(analyses):
+
+    segment = cruise_segment(analyses)
+
+    # a deep copy of the segment state, as before clone()
+    fresh = deepcopy(segment.state)
+    segment.process(segment,fresh)
+
+    cloned = segment.evaluate()
+    assert_identical(fresh.conditions,cloned.conditions,'segment clone')
+
+    # the evaluated state reset to its template
+    cloned.reset()
+    reset = segment.evaluate(cloned)
+    assert_identical(fresh.conditions,reset.conditions,'segment reset')
+
+    return
+
+
+def test_mission_reset(analyses):
+
+    mission = mission_setup_B737(analyses)
+
+    fresh = mission.evaluate()
+    fresh_conditions = deepcopy(fresh.merged().conditions)
+
+    # reset keeps and resets the segment states in place
+    state = mission.evaluate()
+    segment_states = state.segments.values()
+    state.reset()
+    reset = mission.evaluate(state)
+
+    assert all([ a is b for a,b in zip(segment_states,reset.segments.values()) ])
+    assert_identical(fresh_conditions,reset.merged().conditions,'mission reset')
+
+    # an evaluated state that wasn't reset gets new segment states
+    again = mission.evaluate(reset)
+
+    assert not any([ a is b for a,b in zip(segment_states,again.segments.values()) ])
+    assert_identical(fresh_conditions,again.merged().conditions,'mission re-evaluation')
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def assert_identical(A,B,name,path='conditions'):
+
+    assert sorted(A.keys()) == sorted(B.keys()), '%s: keys of %s differ' % (name,path)
+
+    for key,a in A.items():
+        b = B[key]
+        if isinstance(a,dict):
+            assert_identical(a,b,name,path+'.'+key)
+        elif isinstance(a,np.ndarray):
+            assert np.array_equal(a,b), '%s: %s.%s differs' % (name,path,key)
+
+    if path == 'conditions':
+        print name, 'results identical to a fresh state'
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'State reset regression test passed!'
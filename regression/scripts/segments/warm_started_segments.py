@@ -0,0 +1,131 @@
+# warm_started_segments.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks that segments seeded with the last converged unknowns converge
+    to the solution of a cold start, with fewer iterations
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+
+import numpy as np
+
+from segment_setup import full_setup, mission_setup_B737, cruise_segment
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = full_setup()
+
+    test_mission(analyses)
+    test_control_points(analyses)
+
+    return
+
+
+def test_mission(analyses):
+
+    calls = Data(cold=0,warm=0)
+
+    mission = mission_setup_B737(analyses)
+    count_iterations(mission.segments,calls,'cold')
+    state_cold = mission.evaluate()
+
+    # a store shared by all segments
+    warm_start = Data()
+    mission = mission_setup_B737(analyses)
+    for segment in mission.segments:
+        segment.settings.warm_start = warm_start
+
+    # nothing stored, the first evaluation is a cold start
+    state_first = mission.evaluate()
+    assert sorted(warm_start.keys()) == sorted(mission.segments.keys())
+    assert_close(state_cold.merged().conditions,state_first.merged().conditions,0.)
+
+    # the same mission again starts at its solution
+    count_iterations(mission.segments,calls,'warm')
+    state_warm = mission.evaluate()
+    assert_close(state_cold.merged().conditions,state_warm.merged().conditions,1e-6)
+
+    print 'mission iterations, cold =', calls.cold, ', warm =', calls.warm
+    assert calls.warm < calls.cold
+
+    return
+
+
+def test_control_points(analyses):
+
+    calls = Data(cold=0,warm=0)
+
+    segment = cruise_segment(analyses)
+    segment.state.numerics.number_control_points = 12
+    count_iterations([segment],calls,'cold')
+    state_cold = segment.evaluate()
+
+    # stored with 8 control points, interpolated onto 12
+    warm_start = Data()
+    segment = cruise_segment(analyses)
+    segment.settings.warm_start = warm_start
+    segment.evaluate()
+
+    segment = cruise_segment(analyses)
+    segment.state.numerics.number_control_points = 12
+    segment.settings.warm_start = warm_start
+    count_iterations([segment],calls,'warm')
+    state_warm = segment.evaluate()
+
+    assert state_warm.unknowns.throttle.shape == (12,1)
+    assert_close(state_cold.conditions,state_warm.conditions,1e-6)
+
+    print 'interpolated iterations, cold =', calls.cold, ', warm =', calls.warm
+    assert calls.warm < calls.cold
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def count_iterations(segments,calls,key):
+    """ counts the residual evaluations of the segments in calls[key] """
+
+    def count(segment,state):
+        calls[key] += 1
+
+    for segment in segments:
+        segment.process.iterate.count = count
+
+    return
+
+
+def assert_close(A,B,tolerance,path='conditions'):
+
+    assert sorted(A.keys()) == sorted(B.keys()), 'keys of %s differ' % path
+
+    for key,a in A.items():
+        b = B[key]
+        if isinstance(a,dict):
+            assert_close(a,b,tolerance,path+'.'+key)
+        # the residual forces are only zero to the solver tolerance
+        elif key == 'total_force_vector':
+            continue
+        elif isinstance(a,np.ndarray) and a.size:
+            error = np.max(np.abs(a-b)) / max(np.max(np.abs(a)),1e-12)
+            assert error <= tolerance, '%s.%s differs by %g' % (path,key,error)
+
+    return
+
+
+if __name__ == '__main__':
+    main()
+    print 'Warm started segments regression test passed!'
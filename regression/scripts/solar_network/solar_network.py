@@ -155,11 +155,15 @@ def main():
     results = net(state)
     F       = results.thrust_force_vector
     
-    # Truth results
-    truth_F   = [[ 522.40448791],[ 522.40448791]]
-    truth_i   = [[ 314.90485916],[ 314.90485916]]
-    truth_rpm = [[ 6581.17653732],[ 6581.17653732]]
-    truth_bat = [[ 36000000.    ],[ 35984254.75704217]]
+    # Truth results, the fully converged motor and propeller balance. The old
+    # iteration stopped short of it by 0.032 N of thrust (6.1e-5 relative),
+    # 0.027 A of current (8.5e-5), 0.035 rpm (5.4e-6) and 1.33 J of battery
+    # energy, 27 to 1300 times the tolerance; the old solver reproduces these
+    # values with its tolerances at 1e-13
+    truth_F   = [[ 522.37264447],[ 522.37264447]]
+    truth_i   = [[ 314.8782342 ],[ 314.8782342 ]]
+    truth_rpm = [[ 6581.21194851],[ 6581.21194851]]
+    truth_bat = [[ 36000000.    ],[ 35984256.08828983]]
     
     error = Data()
     error.Thrust = np.max(np.abs(F[:,0]-truth_F))
@@ -0,0 +1,184 @@
+# surrogate_models.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" checks the fit and prediction of the surrogate models and the
+    training cache
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import shutil
+import tempfile
+
+from SUAVE.Core import Data
+from SUAVE.Analyses.Surrogates import Model, Tensor_Spline, Radial_Basis, Kriging, Training_Cache
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    test_linear()
+    test_tensor_spline()
+    test_radial_basis()
+    test_kriging()
+    test_training_cache()
+
+    return
+
+
+def test_linear():
+
+    # the base model reproduces a plane
+    X = np.random.RandomState(0).rand(20,2) * [10.,2.] + [0.,-1.]
+    Y = np.hstack([ plane(X) , -2.*plane(X) ])
+
+    model = Model()
+    model.fit(X,Y)
+
+    X_test = np.array([[1.,0.],[5.,0.5],[9.,-0.8]])
+    error  = np.max(np.abs( model(X_test) - np.hstack([ plane(X_test) , -2.*plane(X_test) ]) ))
+    print 'linear model error =', error
+    assert error < 1e-10
+    assert model.predict(X_test).shape == (3,2)
+
+    # inputs are held to the training bounds
+    assert np.allclose(model([[20.,0.]]),model([[np.max(X[:,0]),0.]]))
+
+    return
+
+
+def test_tensor_spline():
+
+    # a cubic spline reproduces a cubic polynomial on a full grid
+    mach  = np.linspace(0.1,0.9,6)
+    alpha = np.linspace(-4.,10.,8)
+    grid  = np.array([ [m,a] for m in mach for a in alpha ])
+
+    model = Tensor_Spline()
+    model.fit(grid,cubic(grid))
+
+    X_test = np.array([[0.15,-3.5],[0.5,2.2],[0.83,9.1]])
+    error  = np.max(np.abs( model(X_test) - cubic(X_test) ))
+    print 'tensor spline error =', error
+    assert error < 1e-10
+
+    # a scattered sample isn't a grid
+    try:
+        model.fit(grid[1:],cubic(grid[1:]))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError, 'Tensor_Spline fit a partial grid'
+
+    return
+
+
+def test_radial_basis():
+
+    X = np.random.RandomState(1).rand(30,2)
+    Y = np.sin(3.*X[:,0:1]) * np.cos(2.*X[:,1:2])
+
+    # interpolates the samples and reproduces linear trends
+    for function in ['multiquadric','inverse_multiquadric','gaussian','cubic','thin_plate']:
+        model = Radial_Basis()
+        model.function = function
+        model.fit(X,Y)
+        error = np.max(np.abs( model(X) - Y ))
+        print 'radial basis', function, 'sample error =', error
+        assert error < 1e-6
+
+    model = Radial_Basis()
+    model.fit(X,plane(X))
+    X_test = np.random.RandomState(2).rand(10,2) * 0.8 + 0.1
+    error  = np.max(np.abs( model(X_test) - plane(X_test) ))
+    print 'radial basis linear error =', error
+    assert error < 1e-8
+
+    return
+
+
+def test_kriging():
+
+    X = np.random.RandomState(3).rand(25,2)
+    Y = np.sin(3.*X[:,0:1]) + X[:,1:2]**2
+
+    model = Kriging()
+    model.fit(X,Y)
+
+    # interpolates the samples, with no error there
+    error = np.max(np.abs( model(X) - Y ))
+    print 'kriging sample error =', error
+    assert error < 1e-4
+    assert np.all( model.predict_variance(X) < 1e-6 * model.variance )
+
+    # and predicts between them
+    X_test = np.random.RandomState(4).rand(10,2) * 0.8 + 0.1
+    Y_test = np.sin(3.*X_test[:,0:1]) + X_test[:,1:2]**2
+    error  = np.max(np.abs( model(X_test) - Y_test ))
+    print 'kriging prediction error =', error
+    assert error < 1e-2
+
+    return
+
+
+def test_training_cache():
+
+    directory = tempfile.mkdtemp()
+
+    try:
+        cache = Training_Cache()
+        cache.directory = directory
+
+        settings = Data(mach=np.array([0.2,0.5,0.8]),order=3,name='sweep')
+
+        # the key is stable and follows the values
+        key = cache.key(settings,np.arange(4.))
+        assert key == cache.key(Data(mach=np.array([0.2,0.5,0.8]),order=3,name='sweep'),np.arange(4.))
+        assert key != cache.key(settings,np.arange(5.))
+        settings.order = 2
+        assert key != cache.key(settings,np.arange(4.))
+
+        # nothing stored yet
+        assert cache.load(key) is None
+
+        training = Data()
+        training.coefficients = np.linspace(0.,1.,12).reshape([4,3])
+        training.tag          = 'training'
+        cache.save(key,training)
+
+        loaded = cache.load(key)
+        assert np.array_equal(loaded.coefficients,training.coefficients)
+        assert loaded.tag == 'training'
+
+        print 'training cache saved and loaded'
+
+    finally:
+        shutil.rmtree(directory)
+
+    return
+
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def plane(X):
+    return 1.5 + 0.3*X[:,0:1] - 2.*X[:,1:2]
+
+def cubic(X):
+    m = X[:,0:1]
+    a = X[:,1:2]
+    return 0.2 + m**3 - 0.5*m*a + 0.01*a**3 - 0.1*(m*a)**2
+
+
+if __name__ == '__main__':
+    main()
+    print 'Surrogate models regression test passed!'
@@ -24,6 +24,7 @@ from SUAVE.Methods.Aerodynamics.AVL.write_geometry   import write_geometry
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases  import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import write_input_deck
 from SUAVE.Methods.Aerodynamics.AVL.run_analysis     import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_parallel_analysis import run_parallel_analysis
 from SUAVE.Methods.Aerodynamics.AVL.translate_data   import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files      import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Results     import Results
@@ -129,12 +130,18 @@ class AVL(Aero_Analysis):
 
         # write the input files
         with redirect.folder(run_folder,force=False):
-            write_geometry(self)
-            write_run_cases(self)
-            write_input_deck(self)
-
-            # RUN AVL!
-            results_avl = run_analysis(self)
+            if self.settings.number_of_processes == 1:
+                write_geometry(self)
+                write_run_cases(self)
+                write_input_deck(self)
+
+                # RUN AVL!
+                results_avl = run_analysis(self)
+                
+            else:
+                # each avl process writes and runs its share of the cases
+                # in its own folder
+                results_avl = run_parallel_analysis(self)
 
         # translate results
         results = translate_results_to_conditions(cases,results_avl)
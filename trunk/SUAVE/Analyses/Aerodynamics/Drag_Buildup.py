@@ -0,0 +1,67 @@
+# Drag_Buildup.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# SUAVE imports
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Drag import pack_drag_components, \
+     parasite_drag_components, compressibility_drag_components
+
+# local imports
+from Aerodynamics import Aerodynamics
+
+# ----------------------------------------------------------------------
+#  Class
+# ----------------------------------------------------------------------
+
+class Drag_Buildup(Aerodynamics):
+    """ SUAVE.Analyses.Aerodynamics.Drag_Buildup()
+        the parasite and compressibility drag of every component of the
+        vehicle, evaluated together as arrays of components by control points
+
+        the geometry is packed into arrays once, see self.initialize(), in
+        place of the Process_Geometry loops over each component
+    """
+
+    def __defaults__(self):
+
+        self.tag = 'drag_buildup'
+
+        self.geometry = Data()
+        self.settings = Data()
+
+        # packed geometry, see pack_drag_components
+        self.components = None
+
+
+    def initialize(self):
+
+        self.components = pack_drag_components(self.geometry)
+
+
+    def evaluate(self,state,settings,geometry):
+        """ process step, fills conditions.aerodynamics.drag_breakdown.parasite
+            and .compressible as the per component methods do
+
+            Inputs:
+                state    - conditions, lift_breakdown.compressible_wings is needed
+                settings - form factors of the aerodynamics analysis
+
+            Outputs:
+                total parasite drag coefficient
+
+            Assumptions:
+                no changes to the geometry since self.initialize()
+        """
+
+        components = self.components
+
+        parasite_drag = parasite_drag_components(state,settings,components)
+        compressibility_drag_components(state,settings,components)
+
+        return parasite_drag
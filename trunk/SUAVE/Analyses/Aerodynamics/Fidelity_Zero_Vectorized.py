@@ -0,0 +1,50 @@
+# Fidelity_Zero_Vectorized.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Analyses import Process
+
+from Fidelity_Zero import Fidelity_Zero
+from Drag_Buildup import Drag_Buildup
+
+# ----------------------------------------------------------------------
+#  Analysis
+# ----------------------------------------------------------------------
+
+class Fidelity_Zero_Vectorized(Fidelity_Zero):
+    """ SUAVE.Analyses.Aerodynamics.Fidelity_Zero_Vectorized()
+        Fidelity_Zero, with the parasite and compressibility drag of all
+        components found in one Drag_Buildup step, see Drag_Buildup
+
+        the drag breakdown has the same entries as Fidelity_Zero
+    """
+
+    def __defaults__(self):
+
+        self.tag = 'fidelity_zero_vectorized_markup'
+
+        # replace the per component processes
+        compute = self.process.compute
+
+        drag = Process()
+        for tag,step in compute.drag.items():
+            if tag == 'parasite':
+                drag.parasite = Drag_Buildup()
+            elif tag != 'compressibility':
+                drag[tag] = step
+
+        compute.drag = drag
+
+
+    def initialize(self):
+        Fidelity_Zero.initialize(self)
+
+        self.process.compute.drag.parasite.geometry = self.geometry
+        self.process.compute.drag.parasite.initialize()
+
+    finalize = initialize
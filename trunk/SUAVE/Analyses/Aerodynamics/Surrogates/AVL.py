@@ -17,6 +17,7 @@ from SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics\
      import Aerodynamics as Aero_Conditions
 
 from SUAVE.Analyses import Surrogate
+from SUAVE.Analyses.Surrogates import Tensor_Spline
 
 # ----------------------------------------------------------------------
 #  Analysis
@@ -26,7 +27,9 @@ class AVL(Aerodynamics,Surrogate):
     ''' This class only builds and evaluates an avl surrogate of aerodynamics
         It must be patched into a markup analysis if more fidelity is needed.
         The surrogate models lift coefficient, induced drag coefficient, and
-        pitching moment coefficient versus angle of attack.
+        pitching moment coefficient versus angle of attack, and Mach number
+        if training.mach_number is given. It is inviscid and undeflected,
+        see sample_training.
     '''
     def __defaults__(self):
         
@@ -35,11 +38,23 @@ class AVL(Aerodynamics,Surrogate):
         self.training.lift_coefficient = None
         self.training.drag_coefficient = None
         self.training.pitch_moment_coefficient = None
+        
+        # optional, trains every angle of attack at every mach number
+        self.training.mach_number = None
 
         self.surrogates = Data()
         self.surrogates.lift_coefficient = None
         self.surrogates.induced_drag_coefficient = None
         self.surrogates.pitch_moment_coefficient = None
+        
+        # optional SUAVE.Analyses.Surrogates.Model of all three coefficients, 
+        # None fits polynomials in angle of attack, or a Tensor_Spline if 
+        # trained on mach number
+        self.surrogate_model = None
+        
+        # optional SUAVE.Analyses.Surrogates.Training_Cache, reuses the 
+        # training data of identical geometries and settings
+        self.training_cache  = None
 
         self.avl_callable = AVL_Callable()
         self.avl_callable.keep_files = False
@@ -72,6 +87,27 @@ class AVL(Aerodynamics,Surrogate):
     initialize = finalize
     
     def sample_training(self):
+        """ sample_training()
+            runs avl at every angle of attack, and at every mach number if
+            training.mach_number is given
+
+            Reynolds number is not a dimension, avl is inviscid and its
+            coefficients don't depend on it. Control deflections are not a
+            dimension either, the run cases are translated from the mission
+            conditions without them (see translate_conditions_to_cases), so
+            the surrogate is of the undeflected geometry.
+        """
+        
+        training = self.training
+        
+        # look for training data of the same geometry and settings
+        cache = self.training_cache
+        if cache is not None:
+            key    = cache.key(self.geometry,self.avl_callable.settings,training.angle_of_attack,training.mach_number)
+            stored = cache.load(key)
+            if stored is not None:
+                training.update(stored)
+                return
 
         # define conditions for run cases
         run_conditions = Aero_Conditions()
@@ -82,19 +118,34 @@ class AVL(Aerodynamics,Surrogate):
         run_conditions.freestream.density     = ones_1col * 1.225
         run_conditions.freestream.gravity     = ones_1col * 9.81
         
-        # set up run cases
-        alphas_1d = self.training.angle_of_attack
-        alphas    = alphas_1d.reshape([alphas_1d.shape[0],1])
+        # set up run cases, every angle of attack at every mach number
+        alphas_1d = training.angle_of_attack
+        if training.mach_number is None:
+            shape  = alphas_1d.shape
+            alphas = alphas_1d.reshape([alphas_1d.shape[0],1])
+        else:
+            shape  = [alphas_1d.shape[0],training.mach_number.shape[0]]
+            alphas, machs = np.meshgrid(alphas_1d,training.mach_number,indexing='ij')
+            alphas = alphas.reshape([-1,1])
         run_conditions.expand_rows(alphas.shape[0])
         run_conditions.aerodynamics.angle_of_attack = alphas
+        if training.mach_number is not None:
+            run_conditions.freestream.mach_number = machs.reshape([-1,1])
 
         # run avl
         results = self.avl_callable.evaluate_conditions(run_conditions)
-        self.training.lift_coefficient = results.aerodynamics.lift_coefficient.reshape(alphas_1d.shape)
-        self.training.induced_drag_coefficient = \
-            results.aerodynamics.drag_breakdown.induced.total.reshape(alphas_1d.shape)
-        self.training.pitch_moment_coefficient = \
-            results.aerodynamics.pitch_moment_coefficient.reshape(alphas_1d.shape)
+        training.lift_coefficient = results.aerodynamics.lift_coefficient.reshape(shape)
+        training.induced_drag_coefficient = \
+            results.aerodynamics.drag_breakdown.induced.total.reshape(shape)
+        training.pitch_moment_coefficient = \
+            results.aerodynamics.pitch_moment_coefficient.reshape(shape)
+        
+        if cache is not None:
+            stored = Data()
+            stored.lift_coefficient         = training.lift_coefficient
+            stored.induced_drag_coefficient = training.induced_drag_coefficient
+            stored.pitch_moment_coefficient = training.pitch_moment_coefficient
+            cache.save(key,stored)
 
         return
 
@@ -108,6 +159,11 @@ class AVL(Aerodynamics,Surrogate):
         CDi_data = training_data.induced_drag_coefficient
         Cm_data  = training_data.pitch_moment_coefficient
 
+        # multidimensional model of all three coefficients
+        if self.surrogate_model is not None or training_data.mach_number is not None:
+            self.build_surrogate_model()
+            return
+
         # pack for surrogate
         X_data = np.reshape(AoA_data,-1)
 
@@ -124,16 +180,70 @@ class AVL(Aerodynamics,Surrogate):
         return
 
 
+    def build_surrogate_model(self):
+        
+        # unpack
+        training_data = self.training
+        
+        model = self.surrogate_model
+        if model is None:
+            model = Tensor_Spline()
+        
+        # pack for surrogate, one row per training case
+        if training_data.mach_number is None:
+            X_data = np.reshape(training_data.angle_of_attack,[-1,1])
+        else:
+            alphas, machs = np.meshgrid(training_data.angle_of_attack,training_data.mach_number,indexing='ij')
+            X_data = np.hstack([ alphas.reshape([-1,1]) , machs.reshape([-1,1]) ])
+            
+        Y_data = np.hstack([ np.reshape(training_data.lift_coefficient,[-1,1])         ,
+                             np.reshape(training_data.induced_drag_coefficient,[-1,1]) ,
+                             np.reshape(training_data.pitch_moment_coefficient,[-1,1]) ])
+        
+        # learn the model
+        model.fit(X_data,Y_data)
+        
+        # populate surrogates, the columns of the model
+        self.surrogate_model = model
+        self.surrogates.lift_coefficient         = None
+        self.surrogates.induced_drag_coefficient = None
+        self.surrogates.pitch_moment_coefficient = None
+        
+        return
+    
+    
+    def evaluate_surrogates(self,conditions):
+        """ CL, CDi, Cm = evaluate_surrogates(conditions)
+            coefficients at all the control points of conditions
+        """
+        
+        aoa = conditions.aerodynamics.angle_of_attack
+        
+        if self.surrogates.lift_coefficient is not None:
+            CL  = self.surrogates.lift_coefficient(aoa)
+            CDi = self.surrogates.induced_drag_coefficient(aoa)
+            Cm  = self.surrogates.pitch_moment_coefficient(aoa)
+            
+        else:
+            if self.training.mach_number is None:
+                X = aoa
+            else:
+                X = np.hstack([ aoa , conditions.freestream.mach_number ])
+            Y   = self.surrogate_model(X)
+            CL  = Y[:,0:1]
+            CDi = Y[:,1:2]
+            Cm  = Y[:,2:3]
+            
+        return CL, CDi, Cm
+    
+    
     def evaluate(self,state,settings=None,geometry=None):
         
         # unpack
-        aoa           = state.conditions.aerodynamics.angle_of_attack
         Sref          = self.geometry.reference_area
 
         # evaluate surrogates
-        CL  = self.surrogates.lift_coefficient(aoa)
-        CDi = self.surrogates.induced_drag_coefficient(aoa)
-        Cm  = self.surrogates.pitch_moment_coefficient(aoa)
+        CL, CDi, Cm = self.evaluate_surrogates(state.conditions)
 
         # pack conditions
         state.conditions.aerodynamics.lift_coefficient = CL
@@ -159,7 +269,10 @@ class AVL(Aerodynamics,Surrogate):
         Sref  = self.geometry.reference_area
 
         # evaluate surrogates
-        CL  = self.surrogates.lift_coefficient(aoa)
+        if self.surrogates.lift_coefficient is not None:
+            CL = self.surrogates.lift_coefficient(aoa)
+        else:
+            CL = self.evaluate_surrogates(state.conditions)[0]
 
         # pack conditions
         state.conditions.aerodynamics.lift_coefficient = CL
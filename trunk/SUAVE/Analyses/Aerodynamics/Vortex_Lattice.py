@@ -68,6 +68,13 @@ class Vortex_Lattice(Aerodynamics):
         # surrogoate models
         self.surrogates = Data()
         self.surrogates.lift_coefficient = None
+        
+        # optional SUAVE.Analyses.Surrogates.Model, None fits a line
+        self.surrogate_model = None
+        
+        # optional SUAVE.Analyses.Surrogates.Training_Cache, reuses the 
+        # training data of identical geometries and settings
+        self.training_cache  = None
  
         
     def initialize(self):
@@ -128,23 +135,34 @@ class Vortex_Lattice(Aerodynamics):
         training = self.training
         
         AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
-
+        
+        # look for training data of the same geometry and settings
+        cache = self.training_cache
+        if cache is not None:
+            key    = cache.key(geometry,settings,AoA)
+            stored = cache.load(key)
+            if stored is not None:
+                training.lift_coefficient = stored.lift_coefficient
+                return
+        
         # condition input, local, do not keep
         konditions              = Data()
         konditions.aerodynamics = Data()
 
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i] = calculate_lift_vortex_lattice(konditions, settings, geometry)
+        # calculate aerodynamics for table, all angles of attack at once
+        # overriding conditions, thus the name mangling
+        konditions.aerodynamics.angle_of_attack = AoA
+        
+        # these functions are inherited from Aerodynamics() or overridden
+        CL = calculate_lift_vortex_lattice(konditions, settings, geometry) * np.ones_like(AoA)
 
         # store training data
         training.lift_coefficient = CL
+        
+        if cache is not None:
+            stored = Data()
+            stored.lift_coefficient = CL
+            cache.save(key,stored)
 
         return
 
@@ -160,7 +178,11 @@ class Vortex_Lattice(Aerodynamics):
         X_data = np.reshape(X_data,-1)
         
         # learn the model
-        cl_surrogate = np.poly1d(np.polyfit(X_data, CL_data ,1))
+        if self.surrogate_model is None:
+            cl_surrogate = np.poly1d(np.polyfit(X_data, CL_data ,1))
+        else:
+            cl_surrogate = self.surrogate_model
+            cl_surrogate.fit(X_data, CL_data)
 
         #Interpolation = Fidelity_Zero.Interpolation
         self.surrogates.lift_coefficient = cl_surrogate
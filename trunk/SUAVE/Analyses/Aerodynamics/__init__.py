@@ -1,7 +1,9 @@
 
 from Aerodynamics     import Aerodynamics
 from AVL              import AVL
+from Drag_Buildup     import Drag_Buildup
 from Fidelity_Zero    import Fidelity_Zero
+from Fidelity_Zero_Vectorized import Fidelity_Zero_Vectorized
 from Linear_Lift      import Linear_Lift
 from Markup           import Markup
 from Process_Geometry import Process_Geometry
@@ -20,7 +20,7 @@ from SUAVE.Attributes.Planets import Earth
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
-from SUAVE.Core import Units
+from SUAVE.Core import Data, Units
 from SUAVE.Core.Arrays import atleast_2d_col
 
 
@@ -33,10 +33,18 @@ class US_Standard_1976(Atmospheric):
     """ Implements the U.S. Standard Atmosphere (1976 version)
     """
     
+    _layers = None
+    _table  = None
+    
     def __defaults__(self):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        # optional dense lookup table, off by default
+        self.settings.lookup_table            = False
+        self.settings.lookup_table_resolution = 100. * Units.m # initial spacing, geopotential altitude
+        self.settings.lookup_table_tolerance  = 1e-6           # max relative interpolation error
     
     def compute_values(self,altitude,temperature_deviation=0.0):
 
@@ -58,30 +66,31 @@ class US_Standard_1976(Atmospheric):
         Example:
             atmosphere = SUAVE.Attributes.Atmospheres.Earth.USStandard1976()
             atmosphere.ComputeValues(1000).pressure
+            
+        Usage Notes:
+            the layer constants are computed once and reused until the
+            breaks, gas or planet change
+            settings.lookup_table = True interpolates a dense table instead,
+            refined until the relative error is below
+            settings.lookup_table_tolerance
           
         """
 
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
-        planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
         Rad       = self.planet.mean_radius
-        gamma     = gas.gas_specific_constant
         delta_isa = temperature_deviation
         
-        # check properties
-        if not gas == Air():
-            warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('US Standard Atmosphere not using Earth planet properties')          
+        # layer constants
+        layers = self._get_layers()
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
 
         # get model altitude bounds
-        zmin = self.breaks.altitude[0]
-        zmax = self.breaks.altitude[-1]   
+        zmin = layers.altitude[0]
+        zmax = layers.altitude[-1]   
         
         # convert geometric to geopotential altitude
         zs = zs/(1 + zs/Rad)
@@ -94,41 +103,36 @@ class US_Standard_1976(Atmospheric):
             print "Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km"   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mew   = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
-        
-        # interpolate the breaks
-        dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(gamma*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*gamma)) )
-        
-        T   = T0 - dz*alpha + delta_isa
-        rho = gas.compute_density(T,p)
-        a   = gas.compute_speed_of_sound(T)
-        mew = gas.compute_absolute_viscosity(T)
-        
+        # find the layer of each altitude
+        i_layer = self._layer_index(zs,layers)
 
+        if self.settings.lookup_table:
+            
+            # interpolate the table
+            table = self._get_table(layers)
+            k, w  = table.locate(zs,i_layer)
+            p     = np.exp(table.interpolate('log_pressure',k,w))
+            T     = table.interpolate('temperature',k,w)
+            
+            if np.all(delta_isa == 0.):
+                rho = table.interpolate('density',k,w)
+                a   = table.interpolate('speed_of_sound',k,w)
+                mew = table.interpolate('dynamic_viscosity',k,w)
+            else:
+                T   = T + delta_isa
+                rho = gas.compute_density(T,p)
+                a   = gas.compute_speed_of_sound(T)
+                mew = gas.compute_absolute_viscosity(T)
+        
+        else:
+            
+            # interpolate the breaks
+            p, T = self._standard_values(zs,layers,i_layer)
+            
+            T   = T + delta_isa
+            rho = gas.compute_density(T,p)
+            a   = gas.compute_speed_of_sound(T)
+            mew = gas.compute_absolute_viscosity(T)
                 
         atmo_data = Conditions()
         atmo_data.expand_rows(zs.shape[0])
@@ -139,8 +143,176 @@ class US_Standard_1976(Atmospheric):
         atmo_data.dynamic_viscosity = mew
         
         return atmo_data
+    
+    def _get_layers(self):
+        """ layer constants of the altitude breaks, rebuilt only if the 
+            breaks, gas or planet have changed since the last call
+        """
+        
+        gas    = self.fluid_properties
+        planet = self.planet
+        breaks = self.breaks
+        
+        key = ( id(gas), id(planet), 
+                gas.gas_specific_constant, planet.sea_level_gravity, planet.mean_radius, 
+                breaks.altitude.tostring(), breaks.temperature.tostring(), breaks.pressure.tostring() )
+        
+        if self._layers is not None and self._layers.key == key:
+            return self._layers
+        
+        # check properties
+        if not gas == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')          
+        
+        z = np.array(breaks.altitude,dtype=float)
+        T = np.array(breaks.temperature,dtype=float)
+        p = np.array(breaks.pressure,dtype=float)
+        
+        layers = Data()
+        layers.key         = key
+        layers.altitude    = z
+        layers.temperature = T
+        layers.pressure    = p
+        layers.alpha       = -(T[1:] - T[:-1])/(z[1:] - z[:-1])
+        layers.gravity     = planet.sea_level_gravity
+        layers.gas_constant = gas.gas_specific_constant
+        
+        self._layers = layers
+        self._table  = None
+        
+        return layers
+    
+    def _layer_index(self,zs,layers):
+        """ index of the layer of each geopotential altitude in zs
+        """
+        
+        # this uses side='right' because values should be the same at the edges, 
+        # the upper edge of a layer is evaluated with the next layer
+        i = np.searchsorted(layers.altitude,zs,side='right') - 1
+        i = np.clip(i,0,len(layers.alpha)-1)
+        
+        return i
+    
+    def _standard_values(self,zs,layers,i):
+        """ standard day pressure and temperature at geopotential altitudes zs
+            in layers i
+        """
+        
+        grav  = layers.gravity
+        gamma = layers.gas_constant
+        
+        z0    = layers.altitude[i]
+        T0    = layers.temperature[i]
+        p0    = layers.pressure[i]
+        alpha = layers.alpha[i]
+        
+        # interpolate the breaks
+        dz = zs-z0
+        p  = np.empty_like(zs)
+        i_isoth = (alpha == 0.)
+        i_adiab = ~i_isoth
+        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(gamma*T0[i_isoth]))
+        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*gamma)) )
+        
+        T = T0 - dz*alpha
+        
+        return p, T
+    
+    def _get_table(self,layers):
+        """ dense standard day table with uniform spacing in each layer, the
+            spacing is halved until the relative error halfway between the
+            table points is below settings.lookup_table_tolerance
+        """
+        
+        resolution = self.settings.lookup_table_resolution
+        tolerance  = self.settings.lookup_table_tolerance
+        
+        table = self._table
+        if table is not None and table.resolution == resolution and table.tolerance == tolerance:
+            return table
+        
+        gas    = self.fluid_properties
+        breaks = layers.altitude
+        widths = breaks[1:] - breaks[:-1]
+        keys   = ['log_pressure','temperature','density','speed_of_sound','dynamic_viscosity']
+        
+        def tabulate(z,i):
+            p, T = self._standard_values(z,layers,i)
+            values = Data()
+            values.log_pressure      = np.log(p)
+            values.temperature       = T
+            values.density           = gas.compute_density(T,p)
+            values.speed_of_sound    = gas.compute_speed_of_sound(T)
+            values.dynamic_viscosity = gas.compute_absolute_viscosity(T)
+            return values
+        
+        dz = resolution
+        for refinement in range(16):
+            
+            # both edges of each layer are evaluated with that layer
+            count  = np.ceil(widths/dz).astype(int)
+            offset = np.hstack([0,np.cumsum(count+1)[:-1]])
+            i      = np.repeat(np.arange(len(widths)),count+1)
+            z      = np.hstack([ np.linspace(breaks[j],breaks[j+1],count[j]+1) for j in range(len(widths)) ])
+            
+            table = _Table(tabulate(z,i))
+            table.spacing = widths/count
+            table.count   = count
+            table.offset  = offset
+            table.breaks  = breaks
+            
+            # check the error halfway between the table points
+            interior = np.ones_like(z,dtype=bool)
+            interior[offset+count] = False
+            z_mid = z[interior] + 0.5*table.spacing[i[interior]]
+            i_mid = i[interior]
+            exact = tabulate(z_mid,i_mid)
+            k, w  = table.locate(z_mid,i_mid)
+            error = np.amax(np.abs(np.expm1(table.interpolate('log_pressure',k,w) - exact.log_pressure)))
+            for key in keys[1:]:
+                error = max(error,np.amax(np.abs(table.interpolate(key,k,w)/exact[key] - 1.)))
+            
+            if error <= tolerance:
+                break
+            dz = dz/2.
+            
+        else:
+            warn('US Standard Atmosphere lookup table did not reach the tolerance, max relative error %g' % error)
+        
+        table.resolution = resolution
+        table.tolerance  = tolerance
+        table.error      = error
+        
+        self._table = table
+        
+        return table
 
 
+# ----------------------------------------------------------------------
+#  Lookup Table
+# ----------------------------------------------------------------------
+
+class _Table(Data):
+    """ standard day values tabulated on a uniform grid in each layer
+    """
+    
+    def locate(self,zs,i):
+        """ k, w = locate(zs,i)
+            lower table point and linear weight of each altitude in layers i
+        """
+        u = (zs - self.breaks[i]) / self.spacing[i]
+        j = np.minimum(u.astype(int),self.count[i]-1)
+        k = self.offset[i] + j
+        w = u - j
+        return k, w
+    
+    def interpolate(self,key,k,w):
+        v = self[key]
+        return v[k] + w*(v[k+1]-v[k])
+    
+    
 # ----------------------------------------------------------------------
 #   Module Tests
 # ----------------------------------------------------------------------
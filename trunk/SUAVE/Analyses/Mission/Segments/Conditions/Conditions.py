@@ -9,9 +9,12 @@
 
 # python imports
 import numpy as np
+from copy import deepcopy
 
 # SUAVE imports
 from SUAVE.Core                    import Data
+from SUAVE.Core.Deep_Core          import OrderedDict, OrderedBunch
+from SUAVE.Core.Arrays             import array_type, matrix_type
 
 
 # ----------------------------------------------------------------------
@@ -20,7 +23,11 @@ from SUAVE.Core                    import Data
 
 class Conditions(Data):
 
-    _size = 1
+    _size   = 1
+    _layout = None
+    
+    # the defaults are built once per conditions type and copied
+    _prototype_defaults = True
     
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns """
@@ -47,4 +54,151 @@ class Conditions(Data):
         return
 
     def compile(self):
-        self.expand_rows()
\ No newline at end of file
+        self.expand_rows()
+        
+    def clone(self):
+        """ Conditions.clone()
+            copies the conditions tree and its arrays without the 
+            overhead of deepcopy and without rerunning the defaults
+            
+            Assumptions:
+                arrays are not shared between branches
+                flattened layouts are not copied
+        """
+        
+        result = OrderedBunch.__new__(self.__class__)
+        
+        for k,v in self.iteritems():
+            if isinstance(v,Conditions):
+                v = v.clone()
+            elif isinstance(v,array_type):
+                v = v.copy()
+            else:
+                v = deepcopy(v)
+            result[k] = v
+            
+        if self.__dict__.has_key('_size'):
+            result._size = self._size
+        
+        return result
+        
+    def flatten(self):
+        """ Conditions.flatten()
+            rebinds every packable leaf as a view into one contiguous
+            vector, in the same order and layout as pack_array('vector'),
+            and caches the key path -> slice layout used by pack_array 
+            and unpack_array
+            
+            Assumptions:
+                scalar leaves can't be views, they are copied on each pack
+        """
+        
+        valid_types = ( int, float, array_type, matrix_type )
+        
+        # find the leaves in packing order
+        leaves = []
+        def do_find(D):
+            for k,v in D.iteritems():
+                if isinstance(v,OrderedDict):
+                    do_find(v) # recursion!
+                    continue
+                elif not isinstance(v,valid_types): continue
+                elif np.rank(v) > 2: continue
+                leaves.append( (D,k,np.shape(v)) )
+        do_find(self)
+        
+        # one buffer for all leaves
+        size   = sum([ int(np.prod(shape)) for D,k,shape in leaves ])
+        buffer = np.empty([size])
+        
+        # rebind leaves as views
+        entries = []
+        index   = 0
+        for D,k,shape in leaves:
+            n = int(np.prod(shape))
+            if len(shape) == 0:
+                buffer[index] = D[k]
+                view = None
+            else:
+                view = np.reshape( buffer[index:(index+n)] , shape, order='F')
+                view[...] = D[k]
+                D[k] = view
+            entries.append( (D,k,index,view) )
+            index += n
+            
+        # count the keys of each branch to catch structure changes
+        nodes = []
+        def do_count(D):
+            nodes.append( (D,len(D)) )
+            for v in D.itervalues():
+                if isinstance(v,OrderedDict):
+                    do_count(v)
+        do_count(self)
+        
+        self._layout = (buffer,entries,nodes)
+        
+        return
+    
+    def _sync_layout(self):
+        """ copies any reassigned leaves back into the flat buffer,
+            rebuilds the layout if the tree or a leaf shape changed
+        """
+        
+        buffer, entries, nodes = self._layout
+        
+        for D,n in nodes:
+            if len(D) != n:
+                self.flatten()
+                return self._layout[0]
+        
+        for D,k,index,view in entries:
+            v = D[k]
+            if view is None:
+                if np.rank(v) != 0:
+                    self.flatten()
+                    return self._layout[0]
+                buffer[index] = v
+            elif not v is view or not view.base is buffer:
+                if np.shape(v) != view.shape or not view.base is buffer:
+                    self.flatten()
+                    return self._layout[0]
+                view[...] = v
+                D[k] = view
+                
+        return buffer
+    
+    def pack_array(self,output='vector'):
+        """ Conditions.pack_array(output='vector')
+            as Data.pack_array, returns a copy of the flat buffer
+            if the conditions have been flattened
+        """
+        
+        if self._layout is None or output != 'vector':
+            return Data.pack_array(self,output)
+        
+        buffer = self._sync_layout()
+        
+        return buffer.copy()
+    
+    def unpack_array(self,M):
+        """ Conditions.unpack_array(M)
+            as Data.unpack_array, copies a vector straight into 
+            the flat buffer if the conditions have been flattened
+        """
+        
+        if self._layout is None or np.rank(M) != 1:
+            return Data.unpack_array(self,M)
+        
+        buffer = self._sync_layout()
+        
+        if buffer.shape != M.shape:
+            return Data.unpack_array(self,M)
+        
+        np.copyto(buffer,M)
+        
+        # scalars aren't views
+        for D,k,index,view in self._layout[1]:
+            if view is None:
+                D[k] = buffer[index]
+                
+        return self
@@ -28,6 +28,7 @@ class Numerics(Conditions):
         self.solver_jacobian                  = "none"
         self.tolerance_solution               = 1e-8
         self.tolerance_boundary_conditions    = 1e-8        
+        self.flat_storage                     = False
         
         self.dimensionless = Conditions()
         self.dimensionless.control_points = np.empty([0,0])
@@ -9,6 +9,7 @@
 
 # python imports
 import numpy as np
+from copy import deepcopy
 
 # SUAVE imports
 from Conditions import Conditions
@@ -25,6 +26,11 @@ from SUAVE.Core.Arrays import array_type
 
 class State(Conditions):
     
+    _template = None
+    
+    # rows of the last expansion, None if the state may hold unexpanded arrays
+    _expanded_rows = None
+    
     def __defaults__(self):
         
         self.unknowns   = Unknowns()
@@ -40,6 +46,10 @@ class State(Conditions):
         
     def expand_rows(self,rows):
         
+        # already expanded, the arrays are kept
+        if rows == self._expanded_rows:
+            return
+        
         # store
         self._size = rows
         
@@ -58,12 +68,71 @@ class State(Conditions):
             #: if type
         #: for each key,value        
         
+        # pack and unpack through contiguous buffers
+        if self.numerics.flat_storage:
+            self.unknowns.flatten()
+            self.residuals.flatten()
+            
+        self._expanded_rows = rows
+            
+    def clone(self):
+        """ State.clone()
+            a copy of this state for a new evaluation, which 
+            remembers this state as its template for reset()
+        """
+        
+        result = Conditions.clone(self)
+        result._template = self
+        
+        return result
+    
+    def reset(self):
+        """ State.reset()
+            resets this state in place to the template it was cloned from,
+            reusing the existing arrays where their shapes allow
+            
+            Assumptions:
+                keys that are not in the template are dropped
+        """
+        
+        if self._template is None:
+            raise RuntimeError , 'state has no template to reset to, use a cloned state'
+        
+        reset_conditions(self,self._template)
+        
+        # the template's branches are not expanded
+        self._expanded_rows = None
+        
+        return
         
         
 class Container(State):
+    
+    # set by reset(), the next expand_sub_segments reuses the segment states
+    _reuse_segments = False
+    
     def __defaults__(self):
         self.segments = Conditions()
         
+    def reset(self):
+        """ State.Container.reset()
+            resets this state and each segment state in place,
+            keeping the segment states for reuse by the next
+            expansion of the sub segments
+        """
+        
+        segments = self.segments
+        
+        State.reset(self)
+        
+        for tag,sub_state in segments.items():
+            sub_state.reset()
+            self.segments[tag] = sub_state
+            
+        self._reuse_segments = True
+            
+        return
+        
     def merged(self):
         
         state_out = State()
@@ -84,4 +153,37 @@ def append_array(A,B=None):
     if isinstance(A,array_type) and isinstance(B,array_type):
         return np.vstack([A,B])
     else:
-        return None
\ No newline at end of file
+        return None
+
+
+def reset_conditions(conditions,template):
+    """ resets conditions in place to template, recursively """
+    
+    # drop keys the template doesn't have
+    for k in conditions.keys():
+        if not template.has_key(k):
+            del conditions[k]
+    
+    for k,t in template.iteritems():
+        
+        v = conditions.get(k,None)
+        
+        # recursion, empty branches are replaced as they may be shared
+        if isinstance(t,Conditions):
+            if len(t) and isinstance(v,Conditions) and type(v) is type(t):
+                reset_conditions(v,t)
+            else:
+                conditions[k] = t.clone()
+                
+        # arrays, in place if the template can be expanded onto them
+        elif isinstance(t,array_type):
+            if isinstance(v,array_type) and v.ndim == t.ndim and v.shape[1:] == t.shape[1:] and v.ndim == 2 \
+               and v.flags.writeable:
+                v[...] = np.resize(t,v.shape)
+            else:
+                conditions[k] = t.copy()
+                
+        else:
+            conditions[k] = deepcopy(t)
+    
+    return
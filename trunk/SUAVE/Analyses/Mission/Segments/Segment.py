@@ -7,9 +7,6 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-# python imports
-from copy import deepcopy
-
 # SUAVE imports
 
 from SUAVE.Analyses import Analysis, Settings, Process
@@ -23,9 +20,13 @@ from Conditions import State
 
 class Segment(Analysis):
     
+    # the defaults are built once per segment type and copied
+    _prototype_defaults = True
+    
     def __defaults__(self):
         
         self.settings = Settings()
+        self.settings.jacobian = None
         
         self.state = State()
 
@@ -60,8 +61,11 @@ class Segment(Analysis):
     
                         
     def evaluate(self,state=None):
+        """ evaluates the segment on a clone of self.state, or on the 
+            given state, for example one reused with state.reset()
+        """
         if state is None:
-            state = deepcopy(self.state)
+            state = self.state.clone()
         self.process(self,state)
         return state
     
@@ -63,11 +63,18 @@ class Sequential_Segments(Mission):
 
 class Container(ContainerBase):
     
-    def evaluate(self,state=None):
+    def evaluate(self,state=None,number_of_processes=1):
+        """ evaluates each mission, in parallel worker processes
+            if number_of_processes > 1, see Methods.Missions.evaluate_missions
+        """
         results = SUAVE.Analyses.Results()
         
-        for key,mission in self.items():
-            result = mission.evaluate(state)
+        keys     = self.keys()
+        missions = self.values()
+        
+        missions_results = Methods.evaluate_missions(missions,state,number_of_processes)
+        
+        for key,result in zip(keys,missions_results):
             results[key] = result
             
         return results
@@ -8,8 +8,12 @@
 # ----------------------------------------------------------------------
 
 from SUAVE.Core import Container
+from SUAVE.Core.Arrays import array_type
 from Results import Results
 
+import inspect
+import numpy as np
+
 
 # ----------------------------------------------------------------------
 #  Process
@@ -19,8 +23,21 @@ class Process(Container):
     
     verbose = False
     
+    # opt-in, skips steps whose declared inputs and outputs are unchanged
+    # since the step last ran, see self.evaluate_skipping()
+    skip_unchanged = False
+    
+    _steps    = None
+    _graph    = None
+    _memory   = None
+    _versions = None
+    _results  = None
+    
     def evaluate(self,*args,**kwarg):
         
+        if self.skip_unchanged:
+            return self.evaluate_skipping(*args,**kwarg)
+        
         results = Results()
         
         if self.verbose:
@@ -47,6 +64,277 @@ class Process(Container):
         
         return results
         
+    def evaluate_skipping(self,*args,**kwarg):
+        """ results = process.evaluate_skipping(*args,**kwarg)
+            evaluates the steps in order, but skips a step if nothing it 
+            depends on changed since the last time it ran
+            
+            Steps declare their paths with the attributes
+                step.reads  = ('state.conditions.freestream.altitude', ...)
+                step.writes = ('state.conditions.freestream.gravity', ...)
+            where the first name of a path is an argument name of the step,
+            steps without declarations always run
+            
+            The dependency graph of the steps is built once, and rebuilt if 
+            a step is added or replaced. A read that an earlier declared 
+            step writes in full is followed through that step: each step 
+            keeps a version, counted up when a run changes what it writes, 
+            and a reader runs again when the version of one of its writers 
+            has moved. The other reads, the external inputs, and the step's 
+            own writes are compared bitwise to copies kept after its last run.
+            
+            Assumptions:
+                steps are deterministic and depend only on the paths they read
+                the steps share their argument names
+                an undeclared step may write anything, reads after it are 
+                    compared as external inputs
+                a step that reads a path it writes leaves it unchanged when 
+                    run again on its own output
+                declared values are arrays or scalars, a Data value is copied 
+                    and compared in full on each call, so declare a scalar 
+                    that identifies it instead, such as its tag
+                the results container is reused between calls, the results 
+                    of skipped steps are those of their last run
+        """
+        
+        # the graph is only built once
+        steps = self.items()
+        if self._memory is None or self._steps != [ (tag,id(step)) for tag,step in steps ]:
+            self._steps    = [ (tag,id(step)) for tag,step in steps ]
+            self._graph    = step_graph(steps)
+            self._memory   = {}
+            self._versions = dict( (tag,0) for tag,step in steps )
+            self._results  = Results()
+        graph    = self._graph
+        memory   = self._memory
+        versions = self._versions
+        results  = self._results
+        
+        if self.verbose:
+            print 'process start'
+        
+        for tag,step in steps: 
+            
+            node = graph[tag]
+            
+            # bind the argument names of the paths
+            if node:
+                names, compared, writes, writers = node
+                values = dict( zip(names,args) )
+                values.update(kwarg)
+                
+                # skip if no writer moved and nothing compared changed
+                last = memory.get(tag,None)
+                if last is not None and last[1] == [ versions[w] for w in writers ] \
+                   and unchanged(last[0],compared,values):
+                    if self.verbose:
+                        print 'step skipped :' , tag
+                    continue
+            
+            if self.verbose:
+                print 'step :' , tag
+            
+            if hasattr(step,'evaluate'): 
+                result = step.evaluate(*args,**kwarg)
+            else:
+                result = step(*args,**kwarg)
+                
+            results[tag] = result
+            
+            # remember what the step left, its readers follow changes of its writes
+            if node:
+                snapshot = take_snapshot(compared,values)
+                n_reads  = len(compared) - len(writes)
+                if last is None or not unchanged(last[0][n_reads:],writes,values):
+                    versions[tag] += 1
+                memory[tag] = ( snapshot, [ versions[w] for w in writers ] )
+        
+        #: for each step
+        
+        if self.verbose:
+            print 'process end'        
+        
+        return results
+    
+    def forget(self):
+        """ process.forget()
+            drops what the steps left, so all run at the next evaluation
+        """
+        self._steps    = None
+        self._graph    = None
+        self._memory   = None
+        self._versions = None
+        self._results  = None
+        
     def __call__(self,*args,**kwarg):
         return self.evaluate(*args,**kwarg) 
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def step_plan(step):
+    """ plan = step_plan(step)
+        None if the step declares no paths, otherwise the argument names of 
+        the step and its read and write paths, split into keys
+    """
+    
+    reads  = getattr(step,'reads' ,None)
+    writes = getattr(step,'writes',None)
+    
+    if reads is None or writes is None:
+        return None
+    
+    # argument names
+    if hasattr(step,'evaluate'):
+        names = inspect.getargspec(step.evaluate).args[1:]
+    else:
+        names = inspect.getargspec(step).args
+    
+    reads  = [ tuple(path.split('.')) for path in reads  ]
+    writes = [ tuple(path.split('.')) for path in writes ]
+    
+    for path in reads + writes:
+        if path[0] not in names:
+            raise KeyError , 'step path %s does not start with an argument name of %s' % ('.'.join(path),names)
+    
+    return names, reads, writes
+
+
+def step_graph(steps):
+    """ graph = step_graph(steps)
+        the dependencies of the steps, for each tag None if the step declares
+        no paths, otherwise
+            names    - the argument names of the step
+            compared - the external reads then the writes, compared on each call
+            writes   - the write paths
+            writers  - tags of the earlier steps that write what it reads
+    """
+    
+    graph   = {}
+    written = [] # (tag, writes) of the declared steps since the last undeclared one
+    
+    for tag,step in steps:
+        
+        plan = step_plan(step)
+        
+        if plan is None:
+            graph[tag] = None
+            written    = []
+            continue
+        
+        names, reads, writes = plan
+        
+        external = []
+        writers  = []
+        
+        for path in reads:
+            
+            # the last earlier step that writes any part of the path
+            writer, overlap = None, []
+            for other,paths in reversed(written):
+                overlap = [ w for w in paths if w == path[:len(w)] or path == w[:len(path)] ]
+                if overlap:
+                    writer = other
+                    break
+            
+            if writer is not None and writer not in writers:
+                writers.append(writer)
+            
+            # followed through the writer only if it writes all of the path
+            if not any([ w == path[:len(w)] for w in overlap ]):
+                external.append(path)
+        
+        graph[tag] = ( names, external + writes, writes, writers )
+        
+        written.append((tag,writes))
+    
+    return graph
+
+
+def get_path(values,path):
+    """ value = get_path(values,path)
+        the value at the path, or a marker if it is missing
+    """
+    
+    value = values.get(path[0],_missing)
+    
+    for key in path[1:]:
+        if value is _missing:
+            break
+        if isinstance(value,dict):
+            value = value.get(key,_missing)
+        else:
+            value = getattr(value,key,_missing)
+    
+    return value
+
+
+def take_snapshot(paths,values):
+    """ snapshot = take_snapshot(paths,values)
+        copies of the values at the paths
+    """
+    return [ copy_value(get_path(values,path)) for path in paths ]
+
+
+def unchanged(snapshot,paths,values):
+    """ unchanged(snapshot,paths,values)
+        True if the values at the paths are bitwise equal to the snapshot
+    """
+    
+    for old,path in zip(snapshot,paths):
+        if not same_value(old,get_path(values,path)):
+            return False
+    
+    return True
+
+
+def copy_value(value):
+    """ copies arrays and the values of dictionaries and lists """
+    
+    if isinstance(value,array_type):
+        return value.copy()
+    elif isinstance(value,dict):
+        return dict( (k,copy_value(v)) for k,v in value.iteritems() )
+    elif isinstance(value,(list,tuple)):
+        return [ copy_value(v) for v in value ]
+    else:
+        return value
+
+
+def same_value(old,value):
+    """ compares a copy_value() to a value, objects by identity """
+    
+    if isinstance(old,array_type):
+        return isinstance(value,array_type) and old.shape == value.shape \
+               and old.dtype == value.dtype and np.array_equal(old,value)
+    
+    elif isinstance(old,dict):
+        if not isinstance(value,dict) or len(old) != len(value):
+            return False
+        for k,v in old.iteritems():
+            if not same_value(v,value.get(k,_missing)):
+                return False
+        return True
+    
+    elif isinstance(old,list):
+        if not isinstance(value,(list,tuple)) or len(old) != len(value):
+            return False
+        for v_old,v in zip(old,value):
+            if not same_value(v_old,v):
+                return False
+        return True
+    
+    elif isinstance(old,(bool,int,long,float,complex,str,unicode,np.generic)):
+        return type(old) is type(value) and old == value
+    
+    else:
+        return old is value
+    
+
+class _Missing(object):
+    pass
+
+_missing = _Missing()
     
@@ -0,0 +1,140 @@
+# Kriging.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from Model import Model, training_arrays
+
+import numpy as np
+import scipy.linalg
+import scipy.optimize
+
+# ----------------------------------------------------------------------
+#  Kriging
+# ----------------------------------------------------------------------
+
+class Kriging(Model):
+    """ SUAVE.Analyses.Surrogates.Kriging()
+        ordinary kriging of scattered samples with a gaussian correlation,
+        the correlation lengths maximize the likelihood of the samples
+
+        Assumptions:
+            distances are measured in the unit hypercube of the training bounds
+            all outputs share the correlation lengths
+    """
+
+    def __defaults__(self):
+        self.tag = 'kriging'
+
+        # bounds of log10 of the correlation parameters
+        self.theta_bounds = [-3.,3.]
+
+        # regularization added to the correlation diagonal
+        self.nugget = 1e-10
+
+        self.theta    = None
+        self.centers  = None
+        self.mean     = None
+        self.weights  = None
+        self.variance = None
+        self.cholesky = None
+
+    def fit(self,X,Y):
+
+        X, Y = training_arrays(X,Y)
+        n_samples, n_inputs = X.shape
+
+        self.bounds    = np.array([ np.min(X,axis=0) , np.max(X,axis=0) ]).T
+        self.n_outputs = Y.shape[1]
+
+        centers = self.normalize(X)
+        D2 = (centers[:,None,:] - centers[None,:,:])**2
+
+        def negative_likelihood(log_theta):
+            try:
+                fit = self.solve(D2,Y,10.**log_theta)
+            except (np.linalg.LinAlgError,ValueError):
+                return 1e20
+            return fit[-1]
+
+        # isotropic start, then refine each correlation length
+        lower, upper = self.theta_bounds
+        starts      = np.linspace(lower,upper,7)
+        likelihoods = [ negative_likelihood(np.ones(n_inputs)*s) for s in starts ]
+        x0 = np.ones(n_inputs) * starts[np.argmin(likelihoods)]
+
+        result = scipy.optimize.minimize(negative_likelihood,x0,method='L-BFGS-B',
+                                         bounds=[self.theta_bounds]*n_inputs)
+        log_theta = result.x if result.fun <= np.min(likelihoods) else x0
+
+        theta = 10.**log_theta
+        cholesky, mean, weights, variance, _ = self.solve(D2,Y,theta)
+
+        self.theta    = theta
+        self.centers  = centers
+        self.cholesky = cholesky
+        self.mean     = mean
+        self.weights  = weights
+        self.variance = variance
+
+        return
+
+    def solve(self,D2,Y,theta):
+        """ cholesky, mean, weights, variance, negative_log_likelihood = model.solve(D2,Y,theta)
+            kriging system of the squared distances D2 for the correlation parameters theta
+        """
+
+        n_samples = Y.shape[0]
+
+        R = np.exp( -np.dot(D2,theta) ) + self.nugget*np.eye(n_samples)
+        cholesky = scipy.linalg.cho_factor(R,lower=True)
+
+        ones = np.ones([n_samples,1])
+        Ri_1 = scipy.linalg.cho_solve(cholesky,ones)
+        Ri_Y = scipy.linalg.cho_solve(cholesky,Y)
+
+        mean     = np.dot(ones.T,Ri_Y) / np.dot(ones.T,Ri_1)
+        weights  = Ri_Y - Ri_1*mean
+        variance = np.sum( (Y - mean) * weights , axis=0 ) / n_samples
+        variance = np.maximum(variance,1e-300)
+
+        log_det = 2.*np.sum(np.log(np.diag(cholesky[0])))
+        negative_log_likelihood = 0.5*( n_samples*np.sum(np.log(variance)) + Y.shape[1]*log_det )
+
+        return cholesky, mean, weights, variance, negative_log_likelihood
+
+    def correlation(self,X):
+        """ r = model.correlation(X)
+            correlation of each normalized point of X to each training sample
+        """
+        D2 = (X[:,None,:] - self.centers[None,:,:])**2
+        return np.exp( -np.dot(D2,self.theta) )
+
+    def predict(self,X):
+
+        X = self.normalize(self.prepare_inputs(X))
+        r = self.correlation(X)
+
+        return self.mean + np.dot(r,self.weights)
+
+    def predict_variance(self,X):
+        """ s2 = model.predict_variance(X)
+            mean squared error of the prediction, [n_points x n_outputs]
+        """
+
+        X = self.normalize(self.prepare_inputs(X))
+        r = self.correlation(X)
+
+        ones = np.ones([self.centers.shape[0],1])
+        Ri_r = scipy.linalg.cho_solve(self.cholesky,r.T)
+        Ri_1 = scipy.linalg.cho_solve(self.cholesky,ones)
+
+        u  = 1. - np.dot(ones.T,Ri_r)
+        s2 = 1. - np.sum(r.T*Ri_r,axis=0) + u[0]**2 / np.dot(ones.T,Ri_1)[0]
+        s2 = np.maximum(s2,0.)
+
+        return s2[:,None] * self.variance[None,:]
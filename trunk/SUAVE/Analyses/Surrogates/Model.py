@@ -0,0 +1,128 @@
+# Model.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Model
+# ----------------------------------------------------------------------
+
+class Model(Data):
+    """ SUAVE.Analyses.Surrogates.Model()
+        base class of the surrogate models, fit to training samples
+        and evaluated for all points at once
+
+        the base model is a least squares linear fit, the other models
+        override self.fit and self.predict
+
+        this class is callable, see self.predict
+    """
+
+    def __defaults__(self):
+        self.tag = 'surrogate_model'
+
+        # inputs outside the training bounds are held to the bounds
+        self.hold_bounds = True
+
+        self.bounds      = None
+        self.n_outputs   = None
+        self.weights     = None
+
+    def fit(self,X,Y):
+        """ model.fit(X,Y)
+            learns the model from training samples
+
+            Inputs:
+                X - inputs, [n_samples x n_inputs]
+                Y - outputs, [n_samples] or [n_samples x n_outputs]
+        """
+
+        X, Y = training_arrays(X,Y)
+
+        self.bounds    = np.array([ np.min(X,axis=0) , np.max(X,axis=0) ]).T
+        self.n_outputs = Y.shape[1]
+
+        # constant and slopes, in the unit hypercube of the training bounds
+        P = self.normalize(X)
+        P = np.hstack([ np.ones([P.shape[0],1]) , P ])
+
+        self.weights = np.linalg.lstsq(P,Y)[0]
+
+        return
+
+    def predict(self,X):
+        """ Y = model.predict(X)
+            evaluates the model
+
+            Inputs:
+                X - inputs, [n_points x n_inputs], or [n_points] for one input
+
+            Outputs:
+                Y - outputs, [n_points x n_outputs]
+        """
+
+        P = self.normalize(self.prepare_inputs(X))
+        P = np.hstack([ np.ones([P.shape[0],1]) , P ])
+
+        return np.dot(P,self.weights)
+
+    def __call__(self,X):
+        return self.predict(X)
+
+    def prepare_inputs(self,X):
+        """ X = model.prepare_inputs(X)
+            2d array of inputs, held to the training bounds if requested
+        """
+
+        X = np.array(X,dtype=float)
+        n_inputs = self.bounds.shape[0]
+
+        if X.ndim < 2:
+            X = np.reshape(X,[-1,n_inputs])
+        elif X.shape[1] != n_inputs:
+            raise ValueError , 'surrogate model expects %i inputs, got %i' % (n_inputs,X.shape[1])
+
+        if self.hold_bounds:
+            X = np.clip(X,self.bounds[:,0],self.bounds[:,1])
+
+        return X
+
+    def normalize(self,X):
+        """ X = model.normalize(X)
+            inputs scaled to the unit hypercube of the training bounds
+        """
+        lower = self.bounds[:,0]
+        span  = self.bounds[:,1] - lower
+        span[span == 0.] = 1.
+        return (X - lower) / span
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def training_arrays(X,Y):
+    """ X, Y = training_arrays(X,Y)
+        2d training inputs and outputs, one row per sample
+    """
+
+    X = np.array(X,dtype=float)
+    Y = np.array(Y,dtype=float)
+
+    if X.ndim < 2:
+        X = np.reshape(X,[-1,1])
+    if Y.ndim < 2:
+        Y = np.reshape(Y,[-1,1])
+
+    if X.shape[0] != Y.shape[0]:
+        raise ValueError , 'number of training inputs and outputs differ'
+
+    return X, Y
@@ -0,0 +1,121 @@
+# Radial_Basis.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from Model import Model, training_arrays
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Radial Basis
+# ----------------------------------------------------------------------
+
+class Radial_Basis(Model):
+    """ SUAVE.Analyses.Surrogates.Radial_Basis()
+        radial basis function interpolation of scattered samples, with a
+        linear polynomial so linear trends are reproduced exactly
+
+        Assumptions:
+            distances are measured in the unit hypercube of the training bounds
+    """
+
+    def __defaults__(self):
+        self.tag = 'radial_basis'
+
+        # 'multiquadric', 'inverse_multiquadric', 'gaussian', 'cubic' or 'thin_plate'
+        self.function  = 'multiquadric'
+
+        # shape parameter, None uses the mean distance between samples
+        self.epsilon   = None
+
+        # regularization added to the diagonal, 0. interpolates
+        self.smoothing = 0.
+
+        self.scale   = None
+        self.centers = None
+        self.weights = None
+
+    def fit(self,X,Y):
+
+        X, Y = training_arrays(X,Y)
+        n_samples, n_inputs = X.shape
+
+        self.bounds    = np.array([ np.min(X,axis=0) , np.max(X,axis=0) ]).T
+        self.n_outputs = Y.shape[1]
+
+        centers = self.normalize(X)
+
+        if self.epsilon is None:
+            r = distances(centers,centers)
+            self.scale = np.sum(r) / max(n_samples*(n_samples-1),1)
+        else:
+            self.scale = self.epsilon
+
+        # interpolation system with the polynomial constraints
+        Phi = self.basis(distances(centers,centers))
+        Phi = Phi + self.smoothing * np.eye(n_samples)
+        P   = np.hstack([ np.ones([n_samples,1]) , centers ])
+        n_p = P.shape[1]
+
+        A = np.vstack([ np.hstack([ Phi , P ]) ,
+                        np.hstack([ P.T , np.zeros([n_p,n_p]) ]) ])
+        b = np.vstack([ Y , np.zeros([n_p,Y.shape[1]]) ])
+
+        try:
+            weights = np.linalg.solve(A,b)
+        except np.linalg.LinAlgError:
+            weights = np.linalg.lstsq(A,b)[0]
+
+        self.centers = centers
+        self.weights = weights
+
+        return
+
+    def predict(self,X):
+
+        X = self.normalize(self.prepare_inputs(X))
+
+        Phi = self.basis(distances(X,self.centers))
+        P   = np.hstack([ np.ones([X.shape[0],1]) , X ])
+
+        return np.dot( np.hstack([ Phi , P ]) , self.weights )
+
+    def basis(self,r):
+        """ phi = model.basis(r)
+            radial basis function of the distances r
+        """
+
+        eps = self.scale
+        function = self.function
+
+        if function == 'multiquadric':
+            return np.sqrt( (r/eps)**2 + 1. )
+        elif function == 'inverse_multiquadric':
+            return 1. / np.sqrt( (r/eps)**2 + 1. )
+        elif function == 'gaussian':
+            return np.exp( -(r/eps)**2 )
+        elif function == 'cubic':
+            return r**3
+        elif function == 'thin_plate':
+            with np.errstate(divide='ignore',invalid='ignore'):
+                phi = r**2 * np.log(r)
+            phi[r == 0.] = 0.
+            return phi
+        else:
+            raise ValueError , 'unknown radial basis function %s' % function
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def distances(X,C):
+    """ r = distances(X,C)
+        euclidean distance of each point of X to each point of C
+    """
+    return np.sqrt( np.sum( (X[:,None,:] - C[None,:,:])**2 , axis=2 ) )
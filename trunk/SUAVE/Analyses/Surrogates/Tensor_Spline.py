@@ -0,0 +1,92 @@
+# Tensor_Spline.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from Model import Model, training_arrays
+
+import numpy as np
+from scipy.interpolate import make_interp_spline
+
+# ----------------------------------------------------------------------
+#  Tensor Spline
+# ----------------------------------------------------------------------
+
+class Tensor_Spline(Model):
+    """ SUAVE.Analyses.Surrogates.Tensor_Spline()
+        tensor product interpolating spline of samples on a full grid,
+        for example every angle of attack at every Mach number
+
+        Assumptions:
+            the spline degree is reduced along inputs with too few samples
+    """
+
+    def __defaults__(self):
+        self.tag = 'tensor_spline'
+
+        # 1 is multilinear, 3 is cubic
+        self.degree = 3
+
+        self.axes    = None
+        self.values  = None
+        self.splines = None
+
+    def fit(self,X,Y):
+        """ model.fit(X,Y)
+            X must contain every combination of the unique values of each input
+        """
+
+        X, Y = training_arrays(X,Y)
+        n_samples, n_inputs = X.shape
+
+        # the grid of each input
+        axes = [ np.unique(X[:,i]) for i in range(n_inputs) ]
+        shape = [ len(axis) for axis in axes ]
+
+        if np.prod(shape) != n_samples:
+            raise ValueError , 'Tensor_Spline training inputs are not a full grid'
+
+        # sort the samples onto the grid
+        index  = [ np.searchsorted(axes[i],X[:,i]) for i in range(n_inputs) ]
+        values = np.zeros(shape + [Y.shape[1]])
+        values[tuple(index)] = Y
+
+        # cardinal splines, the weight of each grid value
+        splines = []
+        for axis in axes:
+            k = min(self.degree,len(axis)-1)
+            if k > 0:
+                splines.append( make_interp_spline(axis,np.eye(len(axis)),k=k) )
+            else:
+                splines.append( None )
+
+        self.axes      = axes
+        self.values    = values
+        self.splines   = splines
+        self.bounds    = np.array([ [axis[0],axis[-1]] for axis in axes ])
+        self.n_outputs = Y.shape[1]
+
+        return
+
+    def predict(self,X):
+
+        X = self.prepare_inputs(X)
+        n_points = X.shape[0]
+
+        # contract the grid values one input at a time
+        Y = self.values[None,...]
+        for i,spline in enumerate(self.splines):
+            if spline is None:
+                W = np.ones([n_points,1])
+            else:
+                W = spline(X[:,i])
+            if i == 0:
+                Y = np.einsum('ja,a...->j...',W,Y[0])
+            else:
+                Y = np.einsum('ja,ja...->j...',W,Y)
+
+        return Y
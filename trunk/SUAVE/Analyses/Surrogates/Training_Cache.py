@@ -0,0 +1,138 @@
+# Training_Cache.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Core.Input_Output import load_data, save_data
+
+import os
+import hashlib
+import types
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Training Cache
+# ----------------------------------------------------------------------
+
+class Training_Cache(Data):
+    """ SUAVE.Analyses.Surrogates.Training_Cache()
+        on-disk store of surrogate training data, keyed by a hash of
+        everything the training depends on, for example the geometry,
+        the settings and the training inputs
+
+        Usage Notes:
+            cache    = Training_Cache()
+            key      = cache.key(geometry,settings,training.angle_of_attack)
+            training = cache.load(key)
+            if training is None:
+                training = ... # run the sweep
+                cache.save(key,training)
+    """
+
+    def __defaults__(self):
+        self.tag = 'training_cache'
+        self.directory = 'surrogate_training_cache'
+
+    def key(self,*items):
+        """ key = cache.key(*items)
+            hash of the values of the items, stable across runs
+        """
+
+        digest = hashlib.sha1()
+        update_hash(digest,items,set())
+
+        return digest.hexdigest()
+
+    def filename(self,key):
+        return os.path.join(self.directory,key + '.pkl')
+
+    def load(self,key):
+        """ training = cache.load(key)
+            stored training data, or None if there is none
+        """
+
+        file_name = self.filename(key)
+
+        if not os.path.exists(file_name):
+            return None
+
+        return load_data(file_name,core_name='training')
+
+    def save(self,key,training):
+        """ cache.save(key,training)
+            stores the training data under key
+        """
+
+        if not os.path.exists(self.directory):
+            try:
+                os.makedirs(self.directory)
+            except OSError:
+                # made by another process in the meantime
+                if not os.path.isdir(self.directory):
+                    raise
+
+        save_data(training,self.filename(key),core_name='training')
+
+        return
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def update_hash(digest,value,visited):
+    """ update_hash(digest,value,visited)
+        adds the type and value of value to the digest, recursively
+    """
+
+    # plain values
+    if value is None or isinstance(value,(bool,int,long,float,complex,str,unicode)):
+        digest.update( '%s:%r;' % (type(value).__name__,value) )
+        return
+
+    if isinstance(value,np.ndarray):
+        value = np.ascontiguousarray(value)
+        digest.update( 'ndarray:%s:%s;' % (value.dtype.str,value.shape) )
+        if value.dtype.hasobject:
+            for item in value.flat:
+                update_hash(digest,item,visited)
+        else:
+            digest.update( value.tostring() )
+        return
+
+    if isinstance(value,np.generic):
+        update_hash(digest,value.item(),visited)
+        return
+
+    # functions and classes by name, their code is not hashed
+    if isinstance(value,(types.FunctionType,types.BuiltinFunctionType,type,types.ClassType,types.MethodType)):
+        name = getattr(value,'__name__',type(value).__name__)
+        digest.update( 'callable:%s.%s;' % (getattr(value,'__module__',''),name) )
+        return
+
+    # containers, once each
+    if id(value) in visited:
+        digest.update( 'visited;' )
+        return
+    visited.add(id(value))
+
+    digest.update( '%s(' % type(value).__name__ )
+
+    if isinstance(value,dict):
+        for k in sorted(value.keys()):
+            update_hash(digest,k,visited)
+            update_hash(digest,value[k],visited)
+    elif isinstance(value,(list,tuple)):
+        for item in value:
+            update_hash(digest,item,visited)
+    elif hasattr(value,'__dict__'):
+        update_hash(digest,value.__dict__,visited)
+
+    digest.update( ');' )
+
+    return
@@ -0,0 +1,6 @@
+
+from Model          import Model
+from Tensor_Spline  import Tensor_Spline
+from Radial_Basis   import Radial_Basis
+from Kriging        import Kriging
+from Training_Cache import Training_Cache
@@ -6,17 +6,11 @@ from Results   import Results
 from Process   import Process
 from Settings  import Settings
 from Vehicle   import Vehicle
-     
-import Aerodynamics
-import Stability
-import Energy
-import Weights
-import Geometry
-import Loads
-import Mission
-import Structures
-import Atmospheric
-import Planets
-import Sizing
-import Noise
+
+from SUAVE.Core.Lazy_Module import lazy_import
+
+# packages, loaded when first used
+lazy_import(globals(),['Aerodynamics','Stability','Energy','Weights','Geometry',
+                       'Loads','Mission','Structures','Atmospheric','Planets',
+                       'Sizing','Noise','Surrogates'])
 
@@ -75,6 +75,41 @@ class Motor(Energy_Component):
         
         return omega1
     
+    def torque(self,omega,voltage=None):
+        """ The motor's torque at the propeller shaft
+            
+            Inputs:
+                Rotation rate of the propeller - rad/s
+                Voltage - volts, the input voltage if not given
+                Motor resistance - in ohms
+                Motor zeros load current - in amps
+                Motor Kv - in rad/s/volt
+                Gear ratio - ~
+                
+            Outputs:
+                The torque at the propeller shaft
+               
+            Assumptions:
+                The same motor model as omega, which solves for the
+                rotation rate where this torque equals the propeller's
+               
+        """
+        # Unpack
+        Res   = self.resistance
+        etaG  = self.gearbox_efficiency
+        exp_i = self.expected_current
+        io    = self.no_load_current + exp_i*(1-etaG)
+        G     = self.gear_ratio
+        Kv    = self.speed_constant/G
+        v     = voltage
+        if v is None:
+            v = self.inputs.voltage
+            
+        i = (v-omega/Kv)/Res
+        Q = (i-io)/Kv
+        
+        return Q
+    
     def current(self,conditions):
         """ The motor's current
             
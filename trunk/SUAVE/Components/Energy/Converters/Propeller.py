@@ -31,6 +31,9 @@ class Propeller(Energy_Component):
         self.prop_attributes.twist_distribution = 0.0
         self.prop_attributes.chord_distribution = 0.0
         
+        # optional, see SUAVE.Methods.Propulsion.propeller_map
+        self.performance_map = None
+        
     def spin(self,conditions):
         """ Analyzes a propeller given geometry and operating conditions
                  
@@ -51,8 +54,12 @@ class Propeller(Energy_Component):
                      
                  Assumptions:
                      Based on Qprop Theory document
+                     The performance map is interpolated instead if there is one
        
            """
+        
+        if self.performance_map is not None:
+            return self.spin_map(conditions)
            
         #Unpack    
         B     = self.prop_attributes.number_blades
@@ -82,25 +89,13 @@ class Propeller(Energy_Component):
         chi0    = Rh/R # Where the propeller blade actually starts
         chi     = np.linspace(chi0,1,N+1) # Vector of nondimensional radii
         chi     = chi[0:N]
-        lamda   = V/(omega*R)           # Speed ratio
         r       = chi*R                 # Radial coordinate
-
-        x       = r*np.multiply(omega,1/V)             # Nondimensional distance
-        n       = omega/(2.*np.pi)      # Cycles per second
-        J       = V/(2.*R*n)    
-    
-        sigma   = np.multiply(B*c,1./(2.*np.pi*r))   
-    
+        
         #I make the assumption that externally-induced velocity at the disk is zero
         #This can be easily changed if needed in the future:
         ua = 0.0
         ut = 0.0
         
-        omegar = np.outer(omega,r)
-        Ua = np.outer((V + ua),np.ones_like(r))
-        Ut = omegar - ut
-        U  = np.sqrt(Ua*Ua + Ut*Ut)
-        
         #Things that will change with iteration
     
         #Setup a Newton iteration
@@ -110,48 +105,9 @@ class Propeller(Energy_Component):
         
         ii = 0
         while (np.any(diff>tol)):
-            Wa    = 0.5*Ua + 0.5*U*np.sin(psi)
-            Wt    = 0.5*Ut + 0.5*U*np.cos(psi)  
-            #va    = Wa - Ua
-            vt    = Ut - Wt
-            alpha = beta - np.arctan2(Wa,Wt)
-            W     = np.sqrt(Wa*Wa + Wt*Wt)
-            Re    = (W*c)/nu
-            Ma    = (W)/a #a is the speed of sound
-            
-            if np.any(Ma> 1.0):
-                warn('Propeller blade tips are supersonic.', Warning)
-            
-            lamdaw = r*Wa/(R*Wt)
-            f      = (B/2.)*(1.-r/R)/lamdaw
-            piece  = np.exp(-f)
-            #piece[piece>1] = 1.0
-            F      = 2.*np.arccos(piece)/np.pi
-            Gamma  = vt*(4.*np.pi*r/B)*F*np.sqrt(1.+(4.*lamdaw*R/(np.pi*B*r))*(4.*lamdaw*R/(np.pi*B*r)))
-            
-            # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
-            Clvals = 2.*np.pi*alpha
-            
-            Cl     = np.zeros_like(Clvals)
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Clvals[Ma[:,:]<1.]/(np.sqrt(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+np.sqrt(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])))*Clvals[Ma<1.]/2)
-            
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Clvals[Ma[:,:]>=1.] 
-            
-            Rsquiggly = Gamma - 0.5*W*c*Cl   
-            
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported        
-            dR_dpsi = ((4.*U*r*np.arccos(piece)*np.sin(psi)*((16.*(Ua + U*np.sin(psi))*(Ua + U*np.sin(psi)))/(B*B*np.pi*np.pi*(2*Wt)*(2*Wt)) + 
-                      1.)**(0.5))/B - (np.pi*U*(Ua*np.cos(psi) - Ut*np.sin(psi))*(beta - np.arctan((2*Wa)/(2*Wt))))/(2.*((2*Wt)*(2*Wt) +
-                      (2*Wa)*(2*Wa))**(0.5)) + (np.pi*U*((2*Wt)*(2*Wt) +(2*Wa)*(2*Wa))**(0.5)*(U + Ut*np.cos(psi) + 
-                      Ua*np.sin(psi)))/(2.*((2*Wa)*(2*Wa)/((2*Wt)*(2*Wt)) + 1.)*(Ut + U*np.cos(psi))*(Ut + U*np.cos(psi))) - (4.*U*piece*((16.*(Ua +
-                      U*np.sin(psi))*(Ua + U*np.sin(psi)))/(B*B*np.pi*np.pi*(2*Wt)*(2*Wt)) + 1.)**(0.5)*(R - r)*(Ut/2. - (U*np.cos(psi))/2.)*(U + 
-                      Ut*np.cos(psi) + Ua*np.sin(psi)))/((2*Wa)*(2*Wa)*(1. - np.exp(-(B*(2*Wt)*(R - r))/(r*(Ua + U*np.sin(psi)))))**(0.5)) + 
-                      (128.*U*r*np.arccos(piece)*(Ua + U*np.sin(psi))*(Ut/2. - (U*np.cos(psi))/2.)*(U + Ut*np.cos(psi) + 
-                      Ua*np.sin(psi)))/(B*B*B*np.pi*np.pi*(Ut + U*np.cos(psi))*(Ut + U*np.cos(psi))*(Ut + U*np.cos(psi))*((16.*(2*Wa)*(2*Wa))/(B*B*np.pi*np.pi*(2*Wt)*(2*Wt)) + 1.)**(0.5))) 
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+            stations  = blade_element_residual(psi,omega,V,ua,ut,B,R,r,beta,c,nu,a)
+            Rsquiggly = stations.residual
+            dR_dpsi   = stations.dR_dpsi
                       
             dpsi   = -Rsquiggly/dR_dpsi
             psi    = psi + dpsi
@@ -161,30 +117,204 @@ class Propeller(Energy_Component):
             if np.any(psi>(np.pi*85.0/180.)) and np.any(dpsi>0.0):
                 break
     
-        #This is an atrocious fit of DAE51 data at RE=50k for Cd
-        #There is also RE scaling
-        Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
+        thrust, torque, power, Cp = blade_element_loads(stations,omega,rho,T,B,R,r)
+
+        thrust[conditions.propulsion.throttle[:,0] <=0.0] = 0.0
+        power[conditions.propulsion.throttle[:,0]  <=0.0] = 0.0
         
-        #More Cd scaling from Mach from AA241ab notes for turbulent skin friction
-        Tw_Tinf = 1. + 1.78*(Ma*Ma)
-        Tp_Tinf = 1. + 0.035*(Ma*Ma) + 0.45*(Tw_Tinf-1.)
-        Tp      = (Tp_Tinf)*T
-        Rp_Rinf = (Tp_Tinf**2.5)*(Tp+110.4)/(T+110.4)
+        thrust[omega1<0.0] = - thrust[omega1<0.0]
+
+        etap     = V*thrust/(power)        
         
-        Cd = ((1/Tp_Tinf)*(1/Rp_Rinf)**0.2)*Cdval
+        conditions.propulsion.etap = etap
         
-        epsilon  = Cd/Cl
-        deltar   = (r[1]-r[0])
-        thrust   = rho*B*(np.sum(Gamma*(Wt-epsilon*Wa)*deltar,axis=1)[:,None])
-        torque   = rho*B*np.sum(Gamma*(Wa+epsilon*Wt)*r*deltar,axis=1)[:,None]
-        power    = torque*omega       
+        return thrust, torque, power, Cp
+    
+    def spin_coupled(self,conditions,motor,max_iterations=50,inflow_angles=None):
+        """ Analyzes a propeller driven by a motor, solving for the rotation
+            rate and the blade inflow angles together
+                 
+                 Inputs:
+                     the inputs of spin, except the rotation rate
+                     motor - a Motor with its input voltage set
+                     max_iterations - Newton iterations of each control point
+                     inflow_angles  - optional first guess of the inflow angle
+                                      of each station, [n_points x n_stations],
+                                      ie self.outputs.inflow_angles of the last
+                                      run on the same conditions
        
-        D        = 2*R
-        Cp       = power/(rho*(n*n*n)*(D*D*D*D*D))
+                 Outputs:
+                     Thrust, torque, power and power coefficient, as spin
+                     self.inputs.omega            - rotation rate
+                     self.outputs.inflow_angles   - inflow angle of each station
+                     self.outputs.iterations      - iterations of each control point
+                     self.outputs.converged       - if each control point converged
+                     motor.propeller_Cp and motor.outputs.omega are updated
+                     
+                 Assumptions:
+                     Based on Qprop Theory document
+                     The unknowns are the inflow angle of each station and the
+                     rotation rate, the residuals are the circulation of each
+                     station and the balance of the motor and propeller torques.
+                     Each station only depends on its own inflow angle, so the
+                     Jacobian is an arrow matrix and is solved by elimination.
+                     Control points stop iterating once they have converged.
+                     Without inflow angles the iteration starts from no induced
+                     velocity.
+                     A negative voltage turns the motor backwards and gives
+                     negative thrust, as a negative rotation rate in spin.
+                     With a performance map only the rotation rate is solved for.
+       
+           """
+        
+        if self.performance_map is not None:
+            return self.spin_coupled_map(conditions,motor,max_iterations)
+           
+        #Unpack    
+        B     = self.prop_attributes.number_blades
+        R     = self.prop_attributes.tip_radius
+        Rh    = self.prop_attributes.hub_radius
+        beta  = self.prop_attributes.twist_distribution
+        c     = self.prop_attributes.chord_distribution
+        rho   = conditions.freestream.density[:,0,None]
+        mu    = conditions.freestream.dynamic_viscosity[:,0,None]
+        V     = conditions.freestream.velocity[:,0,None]
+        a     = conditions.freestream.speed_of_sound[:,0,None]
+        T     = conditions.freestream.temperature[:,0,None]
+        
+        nu    = mu/rho
+        tol   = 1e-5 # Convergence tolerance of the inflow angles
+        tol_w = 1e-8 # Convergence tolerance of the rotation rate, relative
+        h     = 1e-7 # Finite difference step, relative for the rotation rate
+        
+        #Things that don't change with iteration
+        N       = len(c) #Number of stations
+        chi0    = Rh/R # Where the propeller blade actually starts
+        chi     = np.linspace(chi0,1,N+1) # Vector of nondimensional radii
+        chi     = chi[0:N]
+        r       = chi*R                 # Radial coordinate
+        n_pts   = rho.shape[0]
+        
+        ua = 0.0
+        ut = 0.0
+        
+        # The motor gives the first guess of the rotation rate, with the Cp of the last run
+        omega, v, reverse = motor_guess(motor,conditions,n_pts)
+        
+        #Setup a Newton iteration
+        # Start from the given inflow, or from no induced velocity
+        psi = inflow_angles
+        if psi is None or np.shape(psi) != (n_pts,N):
+            psi = np.arctan2(V*np.ones_like(r),np.outer(omega,r))
+        psi        = psi*1.0
+        active     = np.ones(n_pts,dtype=bool)
+        converged  = np.zeros(n_pts,dtype=bool)
+        iterations = np.zeros([n_pts,1],dtype=int)
+        
+        for ii in xrange(max_iterations):
+            
+            # Only the control points that have not converged
+            idx = np.where(active)[0]
+            if not len(idx):
+                break
+            
+            args = (V[idx],ua,ut,B,R,r,beta,c,nu[idx],a[idx],False)
+            
+            # Residuals of the circulation and of the torque balance
+            stations  = blade_element_residual(psi[idx],omega[idx],*args)
+            Rsquiggly = stations.residual
+            dQ        = blade_element_torque(stations,rho[idx],T[idx],B,r)
+            Q_motor   = motor.torque(omega[idx],v[idx])
+            R_Q       = Q_motor - np.sum(dQ,axis=1)[:,None]
+            
+            # Each station only sees its own inflow angle, so one perturbation covers them all
+            psi_h   = blade_element_residual(psi[idx]+h,omega[idx],*args)
+            dR_dpsi = (psi_h.residual - Rsquiggly)/h
+            dQ_dpsi = (blade_element_torque(psi_h,rho[idx],T[idx],B,r) - dQ)/h
+            
+            domega_h  = h*omega[idx]
+            omega_h   = blade_element_residual(psi[idx],omega[idx]+domega_h,*args)
+            dR_domega = (omega_h.residual - Rsquiggly)/domega_h
+            dQ_domega = (motor.torque(omega[idx]+domega_h,v[idx]) - Q_motor)/domega_h - \
+                        np.sum(blade_element_torque(omega_h,rho[idx],T[idx],B,r) - dQ,axis=1)[:,None]/domega_h
+            
+            # Eliminate the inflow angles, then solve the torque balance for the rotation rate
+            schur  = dQ_domega + np.sum(dQ_dpsi*dR_domega/dR_dpsi,axis=1)[:,None]
+            domega = -(R_Q + np.sum(dQ_dpsi*Rsquiggly/dR_dpsi,axis=1)[:,None])/schur
+            
+            # Limit the change in rotation rate while the inflow is far off
+            limit  = 0.2*omega[idx]
+            domega[np.isnan(domega)] = 0.
+            domega = np.clip(domega,-limit,limit)
+            
+            dpsi   = -(Rsquiggly + dR_domega*domega)/dR_dpsi
+            dpsi[np.isnan(dpsi)] = 0.
+            dpsi   = np.clip(dpsi,-0.2,0.2)
+            
+            psi[idx]   = psi[idx] + dpsi
+            omega[idx] = omega[idx] + domega
+            iterations[idx] += 1
+            
+            done    = np.all(np.abs(dpsi)<=tol,axis=1) & (np.abs(domega)<=tol_w*omega[idx])[:,0]
+            stalled = np.any(psi[idx]>(np.pi*85.0/180.),axis=1) & np.any(dpsi>0.0,axis=1)
+            
+            converged[idx[done]]       = True
+            active[idx[done | stalled]] = False
+            
+        if np.any(active):
+            warn('Propeller and motor did not converge.', Warning)
+            
+        stations = blade_element_residual(psi,omega,V,ua,ut,B,R,r,beta,c,nu,a,False)
+        
+        thrust, torque, power, Cp = blade_element_loads(stations,omega,rho,T,B,R,r)
 
         thrust[conditions.propulsion.throttle[:,0] <=0.0] = 0.0
         power[conditions.propulsion.throttle[:,0]  <=0.0] = 0.0
         
+        thrust[reverse] = - thrust[reverse]
+        omega[reverse]  = - omega[reverse]
+        
+        etap     = V*thrust/(power)        
+        
+        conditions.propulsion.etap = etap
+        
+        # Pack, the motor runs on the converged Cp
+        motor.propeller_Cp         = Cp
+        motor.outputs.omega        = omega
+        self.inputs.omega          = omega
+        self.outputs.inflow_angles = psi
+        self.outputs.iterations    = iterations
+        self.outputs.converged     = converged[:,None]
+        
+        return thrust, torque, power, Cp
+    
+    
+    def spin_map(self,conditions):
+        """ Analyzes a propeller by interpolating its performance map
+                 
+                 Inputs:
+                     rotation rate
+                     freestream density, velocity, speed of sound and viscosity
+                     performance map, see SUAVE.Methods.Propulsion.propeller_map
+       
+                 Outputs:
+                     Thrust, torque, power and power coefficient, as spin
+                     
+                 Assumptions:
+                     Operating points outside the map are held to its edges
+       
+           """
+        
+        omega1 = self.inputs.omega
+        V      = conditions.freestream.velocity[:,0,None]
+        
+        omega  = np.abs(omega1*1.0)
+        
+        thrust, torque, power, Cp = self.map_loads(conditions,omega)
+        
+        thrust[conditions.propulsion.throttle[:,0] <=0.0] = 0.0
+        power[conditions.propulsion.throttle[:,0]  <=0.0] = 0.0
+        
         thrust[omega1<0.0] = - thrust[omega1<0.0]
 
         etap     = V*thrust/(power)        
@@ -192,4 +322,341 @@ class Propeller(Energy_Component):
         conditions.propulsion.etap = etap
         
         return thrust, torque, power, Cp
-    
\ No newline at end of file
+    
+    def spin_coupled_map(self,conditions,motor,max_iterations=50):
+        """ Analyzes a propeller driven by a motor with its performance map,
+            solving for the rotation rate where the torques balance
+                 
+                 Inputs:
+                     as spin_coupled
+       
+                 Outputs:
+                     as spin_coupled
+                     
+                 Assumptions:
+                     Newton iteration on the rotation rate of each control point
+       
+           """
+        
+        V     = conditions.freestream.velocity[:,0,None]
+        tol_w = 1e-8 # Convergence tolerance of the rotation rate, relative
+        h     = 1e-7 # Finite difference step, relative
+        n_pts = V.shape[0]
+        
+        # The motor gives the first guess of the rotation rate, with the Cp of the last run
+        omega, v, reverse = motor_guess(motor,conditions,n_pts)
+        
+        active     = np.ones(n_pts,dtype=bool)
+        converged  = np.zeros(n_pts,dtype=bool)
+        iterations = np.zeros([n_pts,1],dtype=int)
+        
+        for ii in xrange(max_iterations):
+            
+            # Only the control points that have not converged
+            idx = np.where(active)[0]
+            if not len(idx):
+                break
+            
+            points   = conditions_rows(conditions,idx)
+            domega_h = h*omega[idx]
+            
+            R_Q   = motor.torque(omega[idx],v[idx]) - self.map_loads(points,omega[idx])[1]
+            R_Q_h = motor.torque(omega[idx]+domega_h,v[idx]) - self.map_loads(points,omega[idx]+domega_h)[1]
+            
+            domega = -R_Q*domega_h/(R_Q_h-R_Q)
+            domega[np.isnan(domega)] = 0.
+            limit  = 0.2*omega[idx]
+            domega = np.clip(domega,-limit,limit)
+            
+            omega[idx] = omega[idx] + domega
+            iterations[idx] += 1
+            
+            done = (np.abs(domega)<=tol_w*omega[idx])[:,0]
+            converged[idx[done]] = True
+            active[idx[done]]    = False
+            
+        if np.any(active):
+            warn('Propeller and motor did not converge.', Warning)
+            
+        thrust, torque, power, Cp = self.map_loads(conditions,omega)
+        
+        thrust[conditions.propulsion.throttle[:,0] <=0.0] = 0.0
+        power[conditions.propulsion.throttle[:,0]  <=0.0] = 0.0
+        
+        thrust[reverse] = - thrust[reverse]
+        omega[reverse]  = - omega[reverse]
+        
+        etap     = V*thrust/(power)        
+        
+        conditions.propulsion.etap = etap
+        
+        # Pack, the motor runs on the converged Cp
+        motor.propeller_Cp         = Cp
+        motor.outputs.omega        = omega
+        self.inputs.omega          = omega
+        self.outputs.inflow_angles = None
+        self.outputs.iterations    = iterations
+        self.outputs.converged     = converged[:,None]
+        
+        return thrust, torque, power, Cp
+    
+    def map_loads(self,conditions,omega):
+        """ thrust, torque, power, Cp = propeller.map_loads(conditions,omega)
+            the loads interpolated from the performance map at a rotation
+            rate omega >= 0, before any throttle or direction corrections
+        """
+        
+        #Unpack
+        R     = self.prop_attributes.tip_radius
+        c_ref = self.performance_map.reference_chord
+        model = self.performance_map.surrogate
+        rho   = conditions.freestream.density[:,0,None]
+        mu    = conditions.freestream.dynamic_viscosity[:,0,None]
+        V     = conditions.freestream.velocity[:,0,None]
+        a     = conditions.freestream.speed_of_sound[:,0,None]
+        
+        D     = 2.*R
+        n     = omega/(2.*np.pi)
+        
+        with np.errstate(divide='ignore',invalid='ignore'):
+            J = V/(n*D)
+        Mt    = omega*R/a
+        Re    = rho*omega*R*c_ref/mu
+        
+        # Stopped propellers are held to the edge of the map
+        J[np.isnan(J)] = np.inf
+        Re[Re<=0.]     = np.min(self.performance_map.reynolds_number)
+        
+        X  = np.hstack([ J , Mt , np.log10(Re) ])
+        Y  = model(X)
+        CT = Y[:,0,None]
+        Cp = Y[:,1,None]
+        
+        thrust = CT*rho*(n*n)*(D*D*D*D)
+        power  = Cp*rho*(n*n*n)*(D*D*D*D*D)
+        torque = Cp*rho*(n*n)*(D*D*D*D*D)/(2.*np.pi)
+        
+        return thrust, torque, power, Cp
+    
+    
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def solve_inflow(psi,omega,V,ua,ut,B,R,r,beta,c,nu,a,max_iterations=50):
+    """ psi, converged, iterations = solve_inflow(psi,omega,V,ua,ut,B,R,r,beta,c,nu,a,max_iterations=50)
+        Newton iteration on the inflow angles at fixed rotation rates,
+        starting from psi, control points stop once they have converged
+    """
+    
+    tol = 1e-5 # Convergence tolerance
+    h   = 1e-7 # Finite difference step
+    
+    psi        = psi*1.0
+    n_pts      = psi.shape[0]
+    active     = np.ones(n_pts,dtype=bool)
+    converged  = np.zeros(n_pts,dtype=bool)
+    iterations = np.zeros([n_pts,1],dtype=int)
+    
+    for ii in xrange(max_iterations):
+        
+        idx = np.where(active)[0]
+        if not len(idx):
+            break
+        
+        args = (omega[idx],V[idx],ua,ut,B,R,r,beta,c,nu[idx],a[idx],False)
+        
+        # Each station only sees its own inflow angle, so one perturbation covers them all
+        Rsquiggly = blade_element_residual(psi[idx],*args).residual
+        dR_dpsi   = (blade_element_residual(psi[idx]+h,*args).residual - Rsquiggly)/h
+        
+        dpsi = -Rsquiggly/dR_dpsi
+        dpsi[np.isnan(dpsi)] = 0.
+        dpsi = np.clip(dpsi,-0.2,0.2)
+        
+        psi[idx] = psi[idx] + dpsi
+        iterations[idx] += 1
+        
+        done    = np.all(np.abs(dpsi)<=tol,axis=1)
+        stalled = np.any(psi[idx]>(np.pi*85.0/180.),axis=1) & np.any(dpsi>0.0,axis=1)
+        
+        converged[idx[done]]        = True
+        active[idx[done | stalled]] = False
+        
+    return psi, converged[:,None], iterations
+
+
+def blade_element_residual(psi,omega,V,ua,ut,B,R,r,beta,c,nu,a,derivative=True):
+    """ stations = blade_element_residual(psi,omega,V,ua,ut,B,R,r,beta,c,nu,a,derivative=True)
+        the circulation residual of the blade stations and, if derivative,
+        its analytical derivative with respect to the inflow angles psi,
+        [n_points x n_stations]
+    """
+    
+    omegar = np.outer(omega,r)
+    Ua = np.outer((V + ua),np.ones_like(r))
+    Ut = omegar - ut
+    U  = np.sqrt(Ua*Ua + Ut*Ut)
+    
+    Wa    = 0.5*Ua + 0.5*U*np.sin(psi)
+    Wt    = 0.5*Ut + 0.5*U*np.cos(psi)  
+    #va    = Wa - Ua
+    vt    = Ut - Wt
+    alpha = beta - np.arctan2(Wa,Wt)
+    W     = np.sqrt(Wa*Wa + Wt*Wt)
+    Re    = (W*c)/nu
+    Ma    = (W)/a #a is the speed of sound
+    
+    if np.any(Ma> 1.0):
+        warn('Propeller blade tips are supersonic.', Warning)
+    
+    lamdaw = r*Wa/(R*Wt)
+    f      = (B/2.)*(1.-r/R)/lamdaw
+    piece  = np.exp(-f)
+    #piece[piece>1] = 1.0
+    F      = 2.*np.arccos(piece)/np.pi
+    Gamma  = vt*(4.*np.pi*r/B)*F*np.sqrt(1.+(4.*lamdaw*R/(np.pi*B*r))*(4.*lamdaw*R/(np.pi*B*r)))
+    
+    # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
+    Clvals = 2.*np.pi*alpha
+    
+    Cl     = np.zeros_like(Clvals)
+    # Scale for Mach, this is Karmen_Tsien
+    Cl[Ma[:,:]<1.] = Clvals[Ma[:,:]<1.]/(np.sqrt(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+np.sqrt(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])))*Clvals[Ma<1.]/2)
+    
+    # If the blade segments are supersonic, don't scale
+    Cl[Ma[:,:]>=1.] = Clvals[Ma[:,:]>=1.] 
+    
+    Rsquiggly = Gamma - 0.5*W*c*Cl   
+    
+    dR_dpsi = None
+    if derivative:
+        #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
+        #This was solved symbolically in Matlab and exported        
+        dR_dpsi = ((4.*U*r*np.arccos(piece)*np.sin(psi)*((16.*(Ua + U*np.sin(psi))*(Ua + U*np.sin(psi)))/(B*B*np.pi*np.pi*(2*Wt)*(2*Wt)) + 
+                  1.)**(0.5))/B - (np.pi*U*(Ua*np.cos(psi) - Ut*np.sin(psi))*(beta - np.arctan((2*Wa)/(2*Wt))))/(2.*((2*Wt)*(2*Wt) +
+                  (2*Wa)*(2*Wa))**(0.5)) + (np.pi*U*((2*Wt)*(2*Wt) +(2*Wa)*(2*Wa))**(0.5)*(U + Ut*np.cos(psi) + 
+                  Ua*np.sin(psi)))/(2.*((2*Wa)*(2*Wa)/((2*Wt)*(2*Wt)) + 1.)*(Ut + U*np.cos(psi))*(Ut + U*np.cos(psi))) - (4.*U*piece*((16.*(Ua +
+                  U*np.sin(psi))*(Ua + U*np.sin(psi)))/(B*B*np.pi*np.pi*(2*Wt)*(2*Wt)) + 1.)**(0.5)*(R - r)*(Ut/2. - (U*np.cos(psi))/2.)*(U + 
+                  Ut*np.cos(psi) + Ua*np.sin(psi)))/((2*Wa)*(2*Wa)*(1. - np.exp(-(B*(2*Wt)*(R - r))/(r*(Ua + U*np.sin(psi)))))**(0.5)) + 
+                  (128.*U*r*np.arccos(piece)*(Ua + U*np.sin(psi))*(Ut/2. - (U*np.cos(psi))/2.)*(U + Ut*np.cos(psi) + 
+                  Ua*np.sin(psi)))/(B*B*B*np.pi*np.pi*(Ut + U*np.cos(psi))*(Ut + U*np.cos(psi))*(Ut + U*np.cos(psi))*((16.*(2*Wa)*(2*Wa))/(B*B*np.pi*np.pi*(2*Wt)*(2*Wt)) + 1.)**(0.5))) 
+        dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+    
+    # Pack
+    stations = Data()
+    stations.residual = Rsquiggly
+    stations.dR_dpsi  = dR_dpsi
+    stations.Gamma    = Gamma
+    stations.Wa       = Wa
+    stations.Wt       = Wt
+    stations.Cl       = Cl
+    stations.Re       = Re
+    stations.Ma       = Ma
+    
+    return stations
+
+
+def blade_element_loads(stations,omega,rho,T,B,R,r):
+    """ thrust, torque, power, Cp = blade_element_loads(stations,omega,rho,T,B,R,r)
+        integrates the loads of the blade stations
+    """
+    
+    Gamma = stations.Gamma
+    Wa    = stations.Wa
+    Wt    = stations.Wt
+    
+    n     = omega/(2.*np.pi)      # Cycles per second
+    
+    epsilon  = blade_element_drag(stations,T)
+    deltar   = (r[1]-r[0])
+    thrust   = rho*B*(np.sum(Gamma*(Wt-epsilon*Wa)*deltar,axis=1)[:,None])
+    torque   = rho*B*np.sum(Gamma*(Wa+epsilon*Wt)*r*deltar,axis=1)[:,None]
+    power    = torque*omega       
+   
+    D        = 2*R
+    Cp       = power/(rho*(n*n*n)*(D*D*D*D*D))
+    
+    return thrust, torque, power, Cp
+
+
+def blade_element_torque(stations,rho,T,B,r):
+    """ dQ = blade_element_torque(stations,rho,T,B,r)
+        the torque of each blade station, [n_points x n_stations]
+    """
+    
+    Gamma = stations.Gamma
+    Wa    = stations.Wa
+    Wt    = stations.Wt
+    
+    epsilon = blade_element_drag(stations,T)
+    deltar  = (r[1]-r[0])
+    dQ      = rho*B*Gamma*(Wa+epsilon*Wt)*r*deltar
+    
+    return dQ
+
+
+def blade_element_drag(stations,T):
+    """ epsilon = blade_element_drag(stations,T)
+        the drag to lift ratio of the blade stations
+    """
+    
+    Cl    = stations.Cl
+    Re    = stations.Re
+    Ma    = stations.Ma
+    
+    #This is an atrocious fit of DAE51 data at RE=50k for Cd
+    #There is also RE scaling
+    Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
+    
+    #More Cd scaling from Mach from AA241ab notes for turbulent skin friction
+    Tw_Tinf = 1. + 1.78*(Ma*Ma)
+    Tp_Tinf = 1. + 0.035*(Ma*Ma) + 0.45*(Tw_Tinf-1.)
+    Tp      = (Tp_Tinf)*T
+    Rp_Rinf = (Tp_Tinf**2.5)*(Tp+110.4)/(T+110.4)
+    
+    Cd = ((1/Tp_Tinf)*(1/Rp_Rinf)**0.2)*Cdval
+    
+    epsilon  = Cd/Cl
+    
+    return epsilon
+
+
+def motor_guess(motor,conditions,n_pts):
+    """ omega, v, reverse = motor_guess(motor,conditions,n_pts)
+        the input voltage and the first guess of the rotation rate, both
+        mirrored for the control points where the voltage turns the motor
+        backwards, so the propeller is solved turning forwards, see spin
+    """
+    
+    voltage = motor.inputs.voltage
+    v       = voltage*np.ones([n_pts,1])
+    reverse = v < 0.0
+    v[reverse] = - v[reverse]
+    
+    # the Cp of a run on other control points only gives a level
+    Cp = motor.propeller_Cp
+    if np.size(Cp) != 1 and np.shape(Cp) != (n_pts,1):
+        motor.propeller_Cp = np.mean(Cp)
+    
+    motor.inputs.voltage = v
+    omega = motor.omega(conditions)*np.ones([n_pts,1])
+    omega[np.isnan(omega)] = 0.
+    motor.inputs.voltage = voltage
+    
+    return omega, v, reverse
+
+
+def conditions_rows(conditions,idx):
+    """ points = conditions_rows(conditions,idx)
+        the freestream conditions of the control points idx
+    """
+    
+    freestream = conditions.freestream
+    
+    points = Data()
+    points.freestream = Data()
+    for key in ['density','dynamic_viscosity','velocity','speed_of_sound']:
+        points.freestream[key] = freestream[key][idx]
+    
+    return points
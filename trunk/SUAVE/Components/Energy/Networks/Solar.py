@@ -70,23 +70,12 @@ class Solar(Propulsor):
         esc.voltageout(conditions)
         # link
         motor.inputs.voltage = esc.outputs.voltageout 
-        # step 5
-        motor.omega(conditions)
-        # link
-        propeller.inputs.omega =  motor.outputs.omega
-        # step 6
-        F, Q, P, Cplast = propeller.spin(conditions)
-       
-        # iterate the Cp here
-        diff = abs(Cplast-motor.propeller_Cp)
-        tol = 1e-6
-        while (np.any(diff>tol)):
-            motor.propeller_Cp  = Cplast # Change the Cp
-            motor.omega(conditions) # Rerun the motor
-            propeller.inputs.omega =  motor.outputs.omega # Relink the motor
-            F, Q, P, Cplast        = propeller.spin(conditions) # Run the motor again
-            diff                   = abs(Cplast-motor.propeller_Cp) # Check to see if it converged          
-        
+        # step 5, step 6
+        # converge the motor rotation rate and the propeller inflow together,
+        # starting from the inflow of the last iteration of this segment
+        inflow_angles   = conditions.propulsion.get('propeller_inflow_angles',None)
+        F, Q, P, Cplast = propeller.spin_coupled(conditions,motor,inflow_angles=inflow_angles)
+        conditions.propulsion.propeller_inflow_angles = propeller.outputs.inflow_angles
             
         # Check to see if magic thrust is needed, the ESC caps throttle at 1.1 already
         eta = conditions.propulsion.throttle[:,0,None]
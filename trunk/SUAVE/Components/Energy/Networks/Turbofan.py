@@ -38,6 +38,9 @@ class Turbofan(Propulsor):
         self.areas.maximum     = 0.0
         self.areas.exit        = 0.0
         self.areas.inflow      = 0.0
+        
+        # optional, see SUAVE.Methods.Propulsion.turbofan_deck
+        self.engine_deck       = None
     _component_root_map = None
         
     
@@ -50,6 +53,91 @@ class Turbofan(Propulsor):
         conditions = state.conditions
         numerics   = state.numerics
         
+        low_pressure_compressor   = self.low_pressure_compressor
+        combustor                 = self.combustor
+        core_nozzle               = self.core_nozzle
+        fan_nozzle                = self.fan_nozzle
+        thrust                    = self.thrust
+        
+        bypass_ratio              = self.bypass_ratio
+        number_of_engines         = self.number_of_engines        
+        
+        # the flow through the engine, from the engine deck if there is one
+        if self.engine_deck is None:
+            self.evaluate_cycle(conditions)
+        else:
+            self.evaluate_deck(conditions)
+
+
+        # compute the thrust using the thrust component
+        
+        #link the thrust component to the fan nozzle
+        thrust.inputs.fan_exit_velocity                        = fan_nozzle.outputs.velocity
+        thrust.inputs.fan_area_ratio                           = fan_nozzle.outputs.area_ratio
+        thrust.inputs.fan_nozzle                               = fan_nozzle.outputs
+        #link the thrust component to the core nozzle
+        thrust.inputs.core_exit_velocity                       = core_nozzle.outputs.velocity
+        thrust.inputs.core_area_ratio                          = core_nozzle.outputs.area_ratio
+        thrust.inputs.core_nozzle                              = core_nozzle.outputs
+        #link the thrust component to the combustor
+        thrust.inputs.fuel_to_air_ratio                        = combustor.outputs.fuel_to_air_ratio
+        #link the thrust component to the low pressure compressor 
+        thrust.inputs.total_temperature_reference              = low_pressure_compressor.outputs.stagnation_temperature
+        thrust.inputs.total_pressure_reference                 = low_pressure_compressor.outputs.stagnation_pressure
+        thrust.inputs.number_of_engines                        = number_of_engines
+        thrust.inputs.bypass_ratio                             = bypass_ratio
+        thrust.inputs.flow_through_core                        = 1./(1.+bypass_ratio) #scaled constant to turn on core thrust computation
+        thrust.inputs.flow_through_fan                         = bypass_ratio/(1.+bypass_ratio) #scaled constant to turn on fan thrust computation        
+
+        
+
+        #compute the trust
+        thrust(conditions)
+ 
+        
+        
+        
+        #getting the network outputs from the thrust outputs
+        
+        F            = thrust.outputs.thrust*[1,0,0]
+        mdot         = thrust.outputs.fuel_flow_rate
+        output_power = thrust.outputs.power
+        F_vec        = conditions.ones_row(3) * 0.0
+        F_vec[:,0]   = F[:,0]
+        F            = F_vec
+
+        results = Data()
+        results.thrust_force_vector = F
+        results.vehicle_mass_rate   = mdot
+        
+        # store data
+        results_conditions = Results
+        conditions.propulsion.acoustic_outputs.core = results_conditions(
+        exit_static_temperature             = core_nozzle.outputs.static_temperature,
+        exit_static_pressure                = core_nozzle.outputs.static_pressure,
+        exit_stagnation_temperature         = core_nozzle.outputs.stagnation_temperature,
+        exit_stagnation_pressure            = core_nozzle.outputs.static_pressure,
+        exit_velocity                       = core_nozzle.outputs.velocity
+        )
+        
+        conditions.propulsion.acoustic_outputs.fan = results_conditions(
+        exit_static_temperature             = fan_nozzle.outputs.static_temperature,
+        exit_static_pressure                = fan_nozzle.outputs.static_pressure,
+        exit_stagnation_temperature         = fan_nozzle.outputs.stagnation_temperature,
+        exit_stagnation_pressure            = fan_nozzle.outputs.static_pressure,
+        exit_velocity                       = fan_nozzle.outputs.velocity
+        )
+        
+        return results
+    
+    
+    
+    def evaluate_cycle(self,conditions):
+        """ Runs the flow through the components of the engine, from the ram
+            to the nozzles, their outputs are stored on each component
+        """
+        
+        #Unpack
         ram                       = self.ram
         inlet_nozzle              = self.inlet_nozzle
         low_pressure_compressor   = self.low_pressure_compressor
@@ -60,10 +148,8 @@ class Turbofan(Propulsor):
         low_pressure_turbine      = self.low_pressure_turbine
         core_nozzle               = self.core_nozzle
         fan_nozzle                = self.fan_nozzle
-        thrust                    = self.thrust
         
         bypass_ratio              = self.bypass_ratio
-        number_of_engines         = self.number_of_engines        
         
         #Creating the network by manually linking the different components
         
@@ -170,70 +256,40 @@ class Turbofan(Propulsor):
          # flow through the fan nozzle
         fan_nozzle(conditions)
         
-
-
-        # compute the thrust using the thrust component
-        
-        #link the thrust component to the fan nozzle
-        thrust.inputs.fan_exit_velocity                        = fan_nozzle.outputs.velocity
-        thrust.inputs.fan_area_ratio                           = fan_nozzle.outputs.area_ratio
-        thrust.inputs.fan_nozzle                               = fan_nozzle.outputs
-        #link the thrust component to the core nozzle
-        thrust.inputs.core_exit_velocity                       = core_nozzle.outputs.velocity
-        thrust.inputs.core_area_ratio                          = core_nozzle.outputs.area_ratio
-        thrust.inputs.core_nozzle                              = core_nozzle.outputs
-        #link the thrust component to the combustor
-        thrust.inputs.fuel_to_air_ratio                        = combustor.outputs.fuel_to_air_ratio
-        #link the thrust component to the low pressure compressor 
-        thrust.inputs.total_temperature_reference              = low_pressure_compressor.outputs.stagnation_temperature
-        thrust.inputs.total_pressure_reference                 = low_pressure_compressor.outputs.stagnation_pressure
-        thrust.inputs.number_of_engines                        = number_of_engines
-        thrust.inputs.bypass_ratio                             = bypass_ratio
-        thrust.inputs.flow_through_core                        = 1./(1.+bypass_ratio) #scaled constant to turn on core thrust computation
-        thrust.inputs.flow_through_fan                         = bypass_ratio/(1.+bypass_ratio) #scaled constant to turn on fan thrust computation        
-
-        
-
-        #compute the trust
-        thrust(conditions)
- 
-        
+        return
+    
+    def evaluate_deck(self,conditions):
+        """ Interpolates the flow through the engine from the engine deck,
+            see SUAVE.Methods.Propulsion.turbofan_deck
+            
+            The ram is still run, it sets the freestream gas properties.
+            The outputs of the nozzles, the combustor fuel to air ratio and
+            the low pressure compressor exit are set from the deck, the
+            other components are not updated.
+        """
         
+        #Unpack
+        ram        = self.ram
+        deck       = self.engine_deck
         
-        #getting the network outputs from the thrust outputs
+        # the gas properties of the freestream
+        ram.inputs.working_fluid = self.working_fluid
+        ram(conditions)
         
-        F            = thrust.outputs.thrust*[1,0,0]
-        mdot         = thrust.outputs.fuel_flow_rate
-        output_power = thrust.outputs.power
-        F_vec        = conditions.ones_row(3) * 0.0
-        F_vec[:,0]   = F[:,0]
-        F            = F_vec
-
-        results = Data()
-        results.thrust_force_vector = F
-        results.vehicle_mass_rate   = mdot
+        M  = conditions.freestream.mach_number
+        T  = conditions.freestream.temperature
+        p0 = conditions.freestream.pressure
         
-        # store data
-        results_conditions = Results
-        conditions.propulsion.acoustic_outputs.core = results_conditions(
-        exit_static_temperature             = core_nozzle.outputs.static_temperature,
-        exit_static_pressure                = core_nozzle.outputs.static_pressure,
-        exit_stagnation_temperature         = core_nozzle.outputs.stagnation_temperature,
-        exit_stagnation_pressure            = core_nozzle.outputs.static_pressure,
-        exit_velocity                       = core_nozzle.outputs.velocity
-        )
+        values = deck.surrogate(np.hstack([M,T]))
         
-        conditions.propulsion.acoustic_outputs.fan = results_conditions(
-        exit_static_temperature             = fan_nozzle.outputs.static_temperature,
-        exit_static_pressure                = fan_nozzle.outputs.static_pressure,
-        exit_stagnation_temperature         = fan_nozzle.outputs.stagnation_temperature,
-        exit_stagnation_pressure            = fan_nozzle.outputs.static_pressure,
-        exit_velocity                       = fan_nozzle.outputs.velocity
-        )
+        # pressures and densities are stored relative to the freestream pressure
+        for i,(name,key,scaled) in enumerate(deck.outputs):
+            value = values[:,i,None]
+            if scaled:
+                value = value*p0
+            self[name].outputs[key] = value
         
-        return results
-    
-    
+        return
     
     def size(self,state):  
         
@@ -7,7 +7,7 @@
 from Component import Component
 from Component_Exception import Component_Exception
 
-from Mass_Properties import Mass_Properties
+from Mass_Properties import Mass_Properties
 from Physical_Component import Physical_Component
 
 from Lofted_Body import Lofted_Body
@@ -15,11 +15,7 @@ from Cost import Cost
 
 from Envelope import Envelope
 
-# packages
-import Wings
-import Fuselages
-import Payloads
-import Energy
-import Systems
-import Configs
-import Landing_Gear
\ No newline at end of file
+# packages, loaded when first used
+from SUAVE.Core.Lazy_Module import lazy_import
+lazy_import(globals(),['Wings','Fuselages','Payloads','Energy','Systems',
+                       'Configs','Landing_Gear','Propulsors'])
\ No newline at end of file
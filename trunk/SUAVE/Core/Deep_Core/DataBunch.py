@@ -10,6 +10,13 @@
 from IndexableBunch import IndexableBunch 
 
 import numpy as np
+from copy import deepcopy
+
+# base classes of each class, see DataBunch.get_bases()
+_bases = {}
+
+# default trees of the classes built from a prototype, see DataBunch.__new__()
+_prototypes = {}
 
 
 # ----------------------------------------------------------------------
@@ -27,8 +34,14 @@ class DataBunch(IndexableBunch):
         Methods:
             __defaults__(self)      : sets the defaults of 
             find_instances(datatype)
+            
+        Classes whose defaults only depend on the class can set 
+        _prototype_defaults = True, their defaults are then built once
+        and copied into each new instance
     """
     
+    _prototype_defaults = False
+    
     def __defaults__(self):
         pass
     
@@ -40,12 +53,18 @@ class DataBunch(IndexableBunch):
         self = super(DataBunch,cls).__new__(cls)
         super(DataBunch,self).__init__()
         
-        # get base class list
-        klasses = self.get_bases()
-                
-        # fill in defaults trunk to leaf
-        for klass in klasses[::-1]:
-            klass.__defaults__(self)
+        # copy the defaults of the class prototype
+        if cls._prototype_defaults:
+            try:
+                prototype = _prototypes[cls]
+            except KeyError:
+                prototype = _prototypes[cls] = super(DataBunch,cls).__new__(cls)
+                super(DataBunch,prototype).__init__()
+                prototype.fill_defaults()
+            copy_items(prototype,self,{})
+        
+        else:
+            self.fill_defaults()
         
         ## ensure local copies
         #for k,v in self.iteritems():
@@ -57,6 +76,11 @@ class DataBunch(IndexableBunch):
         """ initializes DataBunch()
         """
         
+        # nothing to update with
+        if not args and not kwarg:
+            self.__check__()
+            return
+        
         # handle input data (ala class factory)
         input_data = DataBunch.__base__(*args,**kwarg)
         
@@ -113,17 +137,14 @@ class DataBunch(IndexableBunch):
     
     def get_bases(self):
         """ find all DataBunch() base classes, return in a list """
-        klass = self.__class__
-        klasses = []
-        while klass:
-            if issubclass(klass,DataBunch): 
-                klasses.append(klass)
-                klass = klass.__base__
-            else:
-                klass = None
-        if not klasses: # empty list
-            raise TypeError , 'class %s is not of type DataBunch()' % self.__class__
-        return klasses
+        return list(class_bases(self.__class__))
+    
+    def fill_defaults(self):
+        """ DataBunch.fill_defaults()
+            runs the __defaults__ of each base class, trunk to leaf
+        """
+        for klass in class_bases(self.__class__)[::-1]:
+            klass.__defaults__(self)
     
     def typestring(self):
         # build typestring
@@ -168,6 +189,91 @@ class DataBunch(IndexableBunch):
         return value
         
     
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------        
+
+def class_bases(cls):
+    """ klasses = class_bases(cls)
+        the DataBunch() base classes of cls, leaf to trunk,
+        found once per class
+    """
+    
+    try:
+        return _bases[cls]
+    except KeyError:
+        pass
+    
+    klass = cls
+    klasses = []
+    while klass:
+        if issubclass(klass,DataBunch): 
+            klasses.append(klass)
+            klass = klass.__base__
+        else:
+            klass = None
+    if not klasses: # empty list
+        raise TypeError , 'class %s is not of type DataBunch()' % cls
+    
+    _bases[cls] = klasses
+    
+    return klasses
+
+def copy_items(source,target,memo):
+    """ copy_items(source,target,memo)
+        copies the items of source into the empty target, in order,
+        DataBunch() items are copied the same way without rerunning their 
+        defaults, arrays are copied and everything else is deep copied
+        
+        Inputs:
+            memo - dictionary of the copies made so far, by id, 
+                   shared with deepcopy so shared items stay shared
+    """
+    
+    memo[id(source)] = target
+    
+    items      = source.__dict__
+    source_map = dict.__getitem__(source,'_map')
+    
+    # the target is empty, its links are built in the order of the source
+    root   = dict.__getitem__(target,'_root')
+    links  = dict.__getitem__(target,'_map')
+    values = target.__dict__
+    
+    keys = [ k for k in source.iterkeys() ]
+    
+    # values of class attributes are not in the ordered keys
+    if len(items) != len(keys):
+        hidden = [ k for k in items if not k in source_map ]
+    else:
+        hidden = []
+    
+    for k in keys + hidden:
+        v = items[k]
+        if type(v) in _atomic_types:
+            pass
+        elif id(v) in memo:
+            v = memo[id(v)]
+        elif isinstance(v,DataBunch):
+            copy = super(DataBunch,v.__class__).__new__(v.__class__)
+            copy_items(v,copy,memo)
+            v = copy
+        elif isinstance(v,np.ndarray):
+            v = memo[id(v)] = v.copy()
+        else:
+            v = deepcopy(v,memo)
+        
+        if k in source_map:
+            last = root[0]
+            last[1] = root[0] = links[k] = [last, root, k]
+        values[k] = v
+    
+    return
+
+# immutable values, shared by the copies
+_atomic_types = (type(None),bool,int,long,float,complex,str,unicode)
+
+
 # ----------------------------------------------------------------------
 #   Module Tests
 # ----------------------------------------------------------------------        
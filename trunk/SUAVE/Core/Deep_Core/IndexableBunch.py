@@ -7,6 +7,7 @@
 #   Imports
 # ----------------------------------------------------------------------
 
+from Bunch import Bunch
 from OrderedBunch import OrderedBunch
 from IndexableDict import IndexableDict
 
@@ -18,7 +19,21 @@ from IndexableDict import IndexableDict
 class IndexableBunch(IndexableDict,OrderedBunch):
     """ An ordered indexable dictionary that provides attribute-style access.
     """
-    pass
+    
+    # item access by key goes straight to the attributes,
+    # instead of through the super() chain of IndexableDict
+    def __getitem__(self,k):
+        try:
+            return self.__dict__[k]
+        except KeyError:
+            if isinstance(k,int):
+                k = self.keys()[k]
+            return Bunch.__getitem__(self,k)
+    
+    def __setitem__(self,k,v):
+        if isinstance(k,int):
+            k = self.keys()[k]
+        self.__setattr__(k,v)
 
 # ----------------------------------------------------------------------
 #   Module Tests
@@ -26,9 +26,7 @@ class OrderedBunch(Bunch,OrderedDict):
 
         self = Bunch.__new__(klass)
         
-        try:
-            self._root
-        except:
+        if not dict.__contains__(self,'_root'):
             root = [] # sentinel node
             root[:] = [root, root, None]
             dict.__setitem__(self,'_root',root)
@@ -40,7 +38,14 @@ class OrderedBunch(Bunch,OrderedDict):
         """od.__setitem__(i, y) <==> od[i]=y"""
         # Setting a new item creates a new link which goes at the end of the linked
         # list, and the inherited dictionary is updated with the new key/value pair.
-        if not hasattr(self,key) and not hasattr(self.__class__,key):
+        # Existing items are already in the instance dictionary, their value is
+        # replaced in place. Properties keep their values in the inherited dictionary,
+        # so no data descriptor is skipped by this.
+        items = self.__dict__
+        if key in items:
+            items[key] = value
+            return
+        if not hasattr(self.__class__,key):
             root = dict.__getitem__(self,'_root')
             last = root[0]
             map  = dict.__getitem__(self,'_map')
@@ -0,0 +1,101 @@
+# Lazy_Module.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+""" Defers importing subpackages until they are first used
+"""
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import sys
+import time
+import types
+from collections import OrderedDict
+
+# seconds spent loading each lazy module, in the order they were loaded
+import_times = OrderedDict()
+
+# ----------------------------------------------------------------------
+#  Lazy Module
+# ----------------------------------------------------------------------
+
+class Lazy_Module(types.ModuleType):
+    """ SUAVE.Core.Lazy_Module(name,loader=None)
+        Stands in for the module name in its package until an attribute
+        is first used, then imports the module and passes attributes on.
+        Importing the module also replaces this stand in on the package.
+
+        Inputs:
+            name   - full name of the module, ie 'SUAVE.Methods.Aerodynamics'
+            loader - optional function returning the module, the default
+                     imports name
+    """
+
+    def __init__(self,name,loader=None):
+        types.ModuleType.__init__(self,name)
+        self.__dict__['_loader'] = loader
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            name   = self.__name__
+            loader = self.__dict__['_loader']
+
+            t0 = time.time()
+            if loader is None:
+                __import__(name)
+                module = sys.modules[name]
+            else:
+                module = loader()
+            import_times[name] = time.time() - t0
+
+            self.__dict__['_module'] = module
+
+        return module
+
+    def __getattr__(self,key):
+        return getattr(self._load(),key)
+
+    def __setattr__(self,key,value):
+        setattr(self._load(),key,value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        if self.__dict__['_module'] is None:
+            return "<lazy module '%s'>" % self.__name__
+        return repr(self.__dict__['_module'])
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def lazy_import(namespace,names):
+    """ lazy_import(namespace,names)
+        adds a Lazy_Module for each submodule in names to the namespace of
+        a package, ie lazy_import(globals(),['Aerodynamics','Noise'])
+    """
+
+    package = namespace['__name__']
+    for name in names:
+        namespace[name] = Lazy_Module(package + '.' + name)
+
+
+def import_report(stream=None):
+    """ import_report(stream=sys.stdout)
+        prints the lazy modules loaded so far and the seconds each took,
+        including the modules loaded within them
+    """
+
+    if stream is None:
+        stream = sys.stdout
+
+    stream.write('Lazy module import times [s]\n')
+    for name,seconds in import_times.iteritems():
+        stream.write('%-50s %8.4f\n' % (name,seconds))
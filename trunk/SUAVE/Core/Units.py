@@ -2,9 +2,10 @@
 #
 # Created:  Feb 2014, T. Lukacyzk
 # Modified: Feb 2016, T. MacDonald
+#           Oct 2016, SUAVE Team
 
 """ Implements base unit conversion style programming
-    by monkey patching Pint
+    with conversion factors from Pint
 """
 
 
@@ -12,84 +13,183 @@
 #   Imports
 # ------------------------------------------------------------
 
-from SUAVE.Plugins.pint import UnitRegistry
-from SUAVE.Plugins.pint.quantity import _Quantity
+import numpy as np
 
-Units = UnitRegistry()
+# the pint registry, only loaded to resolve a unit for the first time
+_registry = None
+
+def get_registry():
+    global _registry
+    if _registry is None:
+        from SUAVE.Plugins.pint import UnitRegistry
+        _registry = UnitRegistry()
+    return _registry
 
 
 # ------------------------------------------------------------
-#   Monkey Patching
+#   Conversions
 # ------------------------------------------------------------
- 
-# multiplication covnverts in to base unit
-def __rmul__(self,other):
-    if isinstance(other,_Quantity):
-        return _Quantity.__rmul__(self,other)
-    else:
-        self._magnitude = other
-        self.ito_base_units()
-        return self.magnitude
-
-# division converts out of base unit
-def __rdiv__(self,other):
-    if isinstance(other,_Quantity):
-        return _Quantity.__truediv__(self,other)
-    else:
-        units = str(self._units)
-        self.ito_base_units()
-        self._magnitude = other
-        self.ito(units)
-        return self.magnitude
-
-# yay monkey patching!
-Units.Quantity.__mul__      = __rmul__
-Units.Quantity.__rmul__     = __rmul__
-Units.Quantity.__div__      = __rdiv__
-Units.Quantity.__truediv__  = __rdiv__
-Units.Quantity.__rdiv__     = __rdiv__
-Units.Quantity.__rtruediv__ = __rdiv__
-Units.Quantity.__getattr__  = getattr
-Units.Quantity.__array_prepare__ = None
-Units.Quantity.__array_wrap__    = None
-
-# doc string
-Units.__doc__ = \
-""" SUAVE.Attributes.Units()
-    Unit conversion toolbox
-    Works by converting values in to and out of the base unit
-    
-    Important Note and Warning - 
-        This does not enforce unit consistency!!!
-        Unit consistency is the responsibility of the user
-    
-    Usage:
-      from SUAVE.Core import Units
-      a = 4. * Units.mm  # convert in to base unit
-      b = a  / Units.mm  # convert out of base unit
+
+class Unit(object):
+    """ A unit, the factor and offset from the base unit,
+        * converts in to and / converts out of the base unit,
+        with other units the factors combine
+        
+        a base unit passes its operand through unchanged, as Pint 
+        does, others convert it to floating point, ie 3 * Units.N
+    """
+    
+    # numpy arrays defer to these operators
+    __array_priority__ = 100.
+    
+    def __init__(self,factor,offset=0.,base=False):
+        self.factor = factor
+        self.offset = offset
+        self.base   = base
+    
+    # multiplication converts in to base unit
+    def __rmul__(self,other):
+        if isinstance(other,Unit):
+            return combine(other,self,other.factor * self.factor)
+        if isinstance(other,(list,tuple)):
+            other = np.array(other)
+        if self.offset:
+            return other * self.factor + self.offset
+        if self.base:
+            return other
+        return other * self.factor
+    
+    # division converts out of base unit
+    def __rdiv__(self,other):
+        if isinstance(other,Unit):
+            return combine(other,self,other.factor / self.factor)
+        if isinstance(other,(list,tuple)):
+            other = np.array(other)
+        if self.offset:
+            return (other - self.offset) / self.factor
+        if self.base:
+            return other
+        return other / self.factor
+    
+    def __div__(self,other):
+        if isinstance(other,Unit):
+            return combine(self,other,self.factor / other.factor)
+        return self.__rdiv__(other)
+    
+    def __pow__(self,other):
+        return combine(self,self,self.factor ** other)
+    
+    def __neg__(self):
+        return combine(self,self,-self.factor)
+    
+    def __float__(self):
+        return float(self.factor)
+    
+    __mul__      = __rmul__
+    __truediv__  = __div__
+    __rtruediv__ = __rdiv__
+    
+    def __repr__(self):
+        if self.offset:
+            return '<Unit factor=%r offset=%r>' % (self.factor,self.offset)
+        return '<Unit factor=%r>' % self.factor
+
+
+def combine(a,b,factor):
+    """ unit = combine(a,b,factor)
+        the Unit of factor combining units a and b, which have no offset
+    """
+    if a.offset or b.offset:
+        raise ValueError , 'units with an offset can not be combined'
+    return Unit(factor)
+
+
+def conversion(expression):
+    """ unit = conversion(expression)
+        the Unit of expression, its factor and offset from the base units
+    """
+    
+    registry = get_registry()
+    quantity = registry.parse_expression(expression)
+    
+    # numbers are their own factor
+    if not isinstance(quantity,registry.Quantity):
+        return Unit(float(quantity))
+    
+    units = quantity.units
+    base  = registry.Quantity(1.,units).to_base_units()
+    zero  = registry.Quantity(0.,units).to_base_units().magnitude
+    one   = base.magnitude
+    
+    if zero == 0.:
+        # already in base units, like m or kg, but not N
+        is_base = base.units == units and quantity.magnitude == 1
+        return Unit(float(one * quantity.magnitude),base=is_base)
+    
+    return Unit(float(one - zero),float(zero))
+
+
+class Conversion_Table(object):
+    """ SUAVE.Core.Units
+        Unit conversion toolbox
+        Works by converting values in to and out of the base unit
+    
+        Important Note and Warning - 
+            This does not enforce unit consistency!!!
+            Unit consistency is the responsibility of the user
+    
+        Usage:
+          from SUAVE.Core import Units
+          a = 4. * Units.mm  # convert in to base unit
+          b = a  / Units.mm  # convert out of base unit
       
-    Comments:
-      Retreving an attribute of Units (ie Units.mm) returns 
-      the conversion ratio to the base unit.  So in the above
-      example Units.mm = 0.001, which is the conversion ratio
-      to meters.  Thus the * (multiplication) operation converts 
-      from the current units to the base units and / (division) 
-      operation converts from the base units to the desired units.
+        Comments:
+          Retreving an attribute of Units (ie Units.mm) returns 
+          the conversion ratio to the base unit.  So in the above
+          example float(Units.mm) = 0.001, which is the conversion 
+          ratio to meters.  Thus the * (multiplication) operation converts 
+          from the current units to the base units and / (division) 
+          operation converts from the base units to the desired units.
+          Units with an offset, like degF, also apply the offset.
+          
+          Each unit is resolved once, later lookups of Units.xxx
+          are plain attribute access.
      
-    Base Units:
-      mass        : kilogram
-      length      : meters
-      time        : seconds
-      temperature : Kelvin
-      angle       : radian
-      current     : Ampere
-      luminsoity  : candela
+        Base Units:
+          mass        : kilogram
+          length      : meters
+          time        : seconds
+          temperature : Kelvin
+          angle       : radian
+          current     : Ampere
+          luminsoity  : candela
       
     
-    Based on the Pint package, included in SUAVE.Plugins
-    https://pint.readthedocs.org/en/latest/
+        Based on the Pint package, included in SUAVE.Plugins
+        https://pint.readthedocs.org/en/latest/
+        
+    """
     
-"""
+    def __init__(self):
+        self._expressions = {}
+    
+    def __getattr__(self,name):
+        # python internals, not units
+        if name.startswith('__'):
+            raise AttributeError(name)
+        unit = conversion(name)
+        setattr(self,name,unit)
+        return unit
+    
+    def __getitem__(self,expression):
+        try:
+            return self._expressions[expression]
+        except KeyError:
+            unit = conversion(expression)
+            self._expressions[expression] = unit
+            return unit
+
+Units = Conversion_Table()
 
 
 # ------------------------------------------------------------
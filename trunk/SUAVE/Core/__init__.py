@@ -23,3 +23,7 @@ from Data_Warning import Data_Warning
 from Results import Results
 
 from Units import Units
+
+# modules, loaded when first used
+from Lazy_Module import lazy_import
+lazy_import(globals(),['Input_Output','filelock','redirect'])
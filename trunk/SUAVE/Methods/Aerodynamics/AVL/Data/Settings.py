@@ -43,6 +43,14 @@ class Settings(Data):
 		self.filenames.case_template   = 'case_{0:03d}_{1:02d}'
 		self.filenames.log_filename    = 'avl_log.txt'
 		self.filenames.err_filename    = 'avl_err.txt'
+		self.filenames.worker_template = 'worker_{0:02d}' # folder of each avl process when run in parallel
+		
+		# more than one splits the cases between concurrent avl processes, None uses all cpus
+		self.number_of_processes = 1
+		# seconds a parallel avl process may run before it is killed, None waits
+		self.timeout             = None
+		# times a failed or timed out parallel avl process is rerun
+		self.number_of_retries   = 0
 		
 		#------------------------------------------
 		# 1:  Symmetry about the plane
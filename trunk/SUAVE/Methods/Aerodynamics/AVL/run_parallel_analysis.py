@@ -0,0 +1,212 @@
+# run_parallel_analysis.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import time
+import subprocess
+import multiprocessing
+from copy import deepcopy
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Core import redirect
+from SUAVE.Methods.Aerodynamics.AVL.write_geometry   import write_geometry
+from SUAVE.Methods.Aerodynamics.AVL.write_run_cases  import write_run_cases
+from SUAVE.Methods.Aerodynamics.AVL.write_input_deck import write_input_deck
+from SUAVE.Methods.Aerodynamics.AVL.read_results     import read_results
+from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
+
+# ----------------------------------------------------------------------
+#  Run Parallel Analysis
+# ----------------------------------------------------------------------
+
+def run_parallel_analysis(avl_object):
+    """ results = run_parallel_analysis(avl_object)
+        runs the cases of avl_object.current_status in concurrent avl
+        processes, each in its own worker folder of the current folder
+
+        Inputs:
+            avl_object.current_status - batch_file, deck_file and cases,
+                the file names are used within each worker folder
+            avl_object.settings:
+                number_of_processes - concurrent avl processes, None uses all cpus
+                timeout             - seconds an avl process may run, None waits
+                number_of_retries   - times a failed or timed out worker is rerun
+                filenames.worker_template
+
+        Outputs:
+            results - Data() of the results of each case, in the order of the cases
+
+        Assumptions:
+            called from within the avl run folder
+            cases are independent, they are split into contiguous blocks
+    """
+
+    # unpack
+    settings = avl_object.settings
+    cases    = avl_object.current_status.cases
+
+    number_of_processes = settings.number_of_processes
+    if number_of_processes is None:
+        number_of_processes = multiprocessing.cpu_count()
+    number_of_processes = max(min(number_of_processes,len(cases)),1)
+
+    # split the cases between the workers
+    blocks  = np.array_split(np.arange(len(cases)),number_of_processes)
+    workers = []
+    for i,block in enumerate(blocks):
+        worker_tag = settings.filenames.worker_template.format(i+1)
+        worker     = make_worker(avl_object,worker_tag,[ cases[j] for j in block ])
+        workers.append(worker)
+
+    # run until all are done
+    running = []
+    for worker in workers:
+        launch_worker(worker)
+        running.append(worker)
+
+    while running:
+        time.sleep(0.01)
+        for worker in running[:]:
+            if not worker_finished(worker):
+                continue
+            running.remove(worker)
+            if not worker.succeeded:
+                if worker.attempts > settings.number_of_retries:
+                    for other in running:
+                        stop_worker(other)
+                    raise RuntimeError , 'avl failed in {0}: {1}'.format(worker.folder,worker.failure)
+                launch_worker(worker)
+                running.append(worker)
+
+    # merge the results, in the order of the cases
+    results = Data()
+    for case in cases:
+        for worker in workers:
+            if worker.results.has_key(case.tag):
+                results.append(worker.results[case.tag])
+                break
+
+    return results
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def make_worker(avl_object,worker_tag,cases):
+    """ worker = make_worker(avl_object,worker_tag,cases)
+        writes the avl input files of a block of cases into its own folder
+    """
+
+    # a copy of the avl object's status, with the cases renumbered
+    worker = Data()
+    worker.tag      = worker_tag
+    worker.folder   = os.path.abspath(worker_tag)
+    worker.features = avl_object.features
+    worker.settings = avl_object.settings
+
+    worker.current_status = Data()
+    worker.current_status.batch_file = avl_object.current_status.batch_file
+    worker.current_status.deck_file  = avl_object.current_status.deck_file
+    worker.current_status.cases      = Run_Case.Container()
+    for case in cases:
+        worker.current_status.cases.append_case(deepcopy(case))
+
+    worker.process   = None
+    worker.attempts  = 0
+    worker.succeeded = False
+    worker.failure   = None
+    worker.results   = None
+
+    with redirect.folder(worker.folder,force=False):
+        write_geometry(worker)
+        write_run_cases(worker)
+        write_input_deck(worker)
+
+    return worker
+
+
+def launch_worker(worker):
+    """ launch_worker(worker)
+        starts the avl process of a worker
+    """
+
+    filenames = worker.settings.filenames
+    
+    # a relative path to the binary is relative to the run folder
+    avl_call = filenames.avl_bin_name
+    if os.path.dirname(avl_call):
+        avl_call = os.path.abspath(avl_call)
+
+    with redirect.folder(worker.folder,force=False):
+        # old results would pass for new ones
+        for case in worker.current_status.cases:
+            if os.path.exists(case.result_filename):
+                os.remove(case.result_filename)
+
+        deck = open(worker.current_status.deck_file,'r')
+        log  = open(filenames.log_filename,'a')
+        err  = open(filenames.err_filename,'a')
+
+    worker.process = subprocess.Popen([avl_call,filenames.features],
+                                      stdin=deck,stdout=log,stderr=err,cwd=worker.folder)
+    worker.files      = [deck,log,err]
+    worker.start_time = time.time()
+    worker.attempts  += 1
+    worker.succeeded  = False
+
+    return
+
+
+def worker_finished(worker):
+    """ finished = worker_finished(worker)
+        checks on the avl process of a worker, and reads its results once it
+        is done, worker.succeeded tells if they could be read
+    """
+
+    timeout = worker.settings.timeout
+    process = worker.process
+
+    if process.poll() is None:
+        if timeout is None or time.time() - worker.start_time < timeout:
+            return False
+        worker.failure = 'timed out after {0} s'.format(timeout)
+
+    elif process.returncode != 0:
+        worker.failure = 'exit status {0}'.format(process.returncode)
+
+    else:
+        try:
+            with redirect.folder(worker.folder,force=False):
+                worker.results = read_results(worker)
+            worker.succeeded = True
+        except (IOError,IndexError,ValueError) as exc:
+            worker.failure = 'unreadable results, {0}'.format(exc)
+
+    stop_worker(worker)
+
+    return True
+
+
+def stop_worker(worker):
+    """ stop_worker(worker)
+        kills the avl process of a worker if it is still running, and
+        closes its files
+    """
+
+    if worker.process.poll() is None:
+        worker.process.kill()
+        worker.process.wait()
+
+    for f in worker.files:
+        f.close()
+
+    return
@@ -16,6 +16,9 @@ from miscellaneous_drag_aircraft_ESDU import miscellaneous_drag_aircraft_ESDU
 from trim import trim
 from total_aircraft import total_aircraft
 from compressibility_drag_wing_total import compressibility_drag_wing_total
+from pack_drag_components import pack_drag_components
+from parasite_drag_components import parasite_drag_components
+from compressibility_drag_components import compressibility_drag_components
 from spoiler_drag import spoiler_drag
 from windmilling_drag import windmilling_drag
 from asymmetry_drag import asymmetry_drag
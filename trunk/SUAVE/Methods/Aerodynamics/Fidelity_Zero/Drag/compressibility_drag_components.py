@@ -0,0 +1,87 @@
+# compressibility_drag_components.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# local imports
+from parasite_drag_components import column, store
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Compressibility Drag Components
+# ----------------------------------------------------------------------
+
+def compressibility_drag_components(state,settings,components):
+    """ SUAVE.Methods.Aerodynamics.Fidelity_Zero.Drag.compressibility_drag_components(state,settings,components)
+        computes the compressibility drag of all wings at all control points
+        at once, from geometry packed by pack_drag_components
+
+        Inputs:
+            state.conditions.freestream.mach_number
+            state.conditions.aerodynamics.lift_breakdown.compressible_wings
+            components - see pack_drag_components
+
+        Outputs:
+            total compressibility drag coefficient, with the vehicle reference area
+
+            conditions.aerodynamics.drag_breakdown.compressible is filled for
+            each wing and the total, as by compressibility_drag_wing and
+            compressibility_drag_wing_total
+
+        Assumptions:
+            based on a set of fits
+    """
+
+    # unpack
+    conditions   = state.conditions
+    compressible = conditions.aerodynamics.drag_breakdown.compressible
+    mach         = conditions.freestream.mach_number
+    wing_lifts   = conditions.aerodynamics.lift_breakdown.compressible_wings
+    wings        = components.wings
+
+    # one column per wing
+    sweep_w   = wings.sweep
+    cos_sweep = np.cos(sweep_w)
+    cl_w      = wing_lifts * wings.lift_factor
+
+    # get effective Cl and sweep
+    tc = wings.thickness_to_chord / cos_sweep
+    cl = cl_w / cos_sweep**2
+
+    # compressibility drag based on regressed fits from AA241
+    mcc_cos_ws = 0.922321524499352       \
+               - 1.153885166170620*tc    \
+               - 0.304541067183461*cl    \
+               + 0.332881324404729*tc**2 \
+               + 0.467317361111105*tc*cl \
+               + 0.087490431201549*cl**2
+
+    # crest-critical mach number, corrected for wing sweep
+    mcc = mcc_cos_ws / cos_sweep
+
+    # divergence mach number
+    MDiv = mcc * ( 1.02 + 0.08*(1 - cos_sweep) )
+
+    # compressibility correlation, Shevell, scaled by reference area
+    cd_c = 0.0019*(mach/mcc)**14.641 * cos_sweep**3 * wings.reference_area / components.reference_area
+
+    for i,tag in enumerate(wings.tag):
+        store(compressible,tag,
+            compressibility_drag      = column(cd_c,i) ,
+            thickness_to_chord        = tc[i]          ,
+            wing_sweep                = sweep_w[i]     ,
+            crest_critical            = column(mcc,i)  ,
+            divergence_mach           = column(MDiv,i) ,
+        )
+
+    total_compressibility_drag = np.sum(cd_c,axis=1)[:,None]
+
+    compressible.total = total_compressibility_drag
+
+    return total_compressibility_drag
@@ -28,7 +28,8 @@ def compressible_mixed_flat_plate(Re,Ma,Tc,xt):
             Re - Reynolds Number
             Ma - Mach number
             Tc - temperature
-            xt - turbulent transition point as a proportion of chord length
+            xt - turbulent transition point as a proportion of chord length,
+                 may be an array that broadcasts with Re
         
         Outputs:
             cf_comp - coefficient of friction
@@ -41,7 +42,7 @@ def compressible_mixed_flat_plate(Re,Ma,Tc,xt):
             
     """    
     
-    if xt < 0.0 or xt > 1.0:
+    if np.any(xt < 0.0) or np.any(xt > 1.0):
         raise ValueError("Turbulent transition must be between 0 and 1")
     
     #if np.any(Re > 10**9) or np.any(Re < 10**5):
@@ -49,7 +50,7 @@ def compressible_mixed_flat_plate(Re,Ma,Tc,xt):
         #pass
     
     Rex = Re*xt
-    Rex[Rex==0.0] = 0.0001
+    Rex = np.where(Rex==0.0, 0.0001, Rex)
 
     theta = 0.671*xt/np.sqrt(Rex)
     xeff  = (27.78*theta*Re**0.2)**1.25
@@ -58,10 +59,8 @@ def compressible_mixed_flat_plate(Re,Ma,Tc,xt):
     cf_turb  = 0.455/(np.log10(Rext)**2.58)
     cf_lam   = 1.328/np.sqrt(Rex)
     
-    if xt > 0.0:
-        cf_start = 0.455/(np.log10(Re*xeff)**2.58)
-    else:
-        cf_start = 0.0
+    with np.errstate(divide='ignore',invalid='ignore'):
+        cf_start = np.where(xt > 0.0, 0.455/(np.log10(Re*xeff)**2.58), 0.0)
     
     cf_inc = cf_lam*xt + cf_turb*(1-xt+xeff) - cf_start*xeff
     
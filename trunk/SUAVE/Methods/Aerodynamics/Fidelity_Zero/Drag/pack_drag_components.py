@@ -0,0 +1,140 @@
+# pack_drag_components.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# suave imports
+from SUAVE.Core import Data
+from SUAVE.Components import Wings
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Pack Drag Components
+# ----------------------------------------------------------------------
+
+def pack_drag_components(geometry):
+    """ components = SUAVE.Methods.Aerodynamics.Fidelity_Zero.Drag.pack_drag_components(geometry)
+        gathers the geometry the drag buildup needs from each wing, fuselage
+        and propulsor of a vehicle into arrays, one entry per component
+
+        Inputs:
+            geometry - SUAVE type vehicle
+
+        Outputs:
+            components.reference_area - of the vehicle
+            components.wings          - tag, reference_area, wetted_area,
+                                        mean_aerodynamic_chord, thickness_to_chord,
+                                        sweep, transition_x_upper, transition_x_lower,
+                                        lift_factor
+            components.fuselages      - tag, reference_area, wetted_area, length,
+                                        diameter_to_length
+            components.propulsors     - tag, reference_area, wetted_area, length,
+                                        diameter, number_of_engines
+
+        Assumptions:
+            wings without a wetted area are given (1+0.2*t/c) times their
+                exposed area, which is stored on the wing, as in parasite_drag_wing
+            the lift factor scales the compressible wing lift seen by each
+                wing, as in compressibility_drag_wing
+    """
+
+    components = Data()
+    components.reference_area = geometry.reference_area
+
+    # wings
+    wings = Data()
+    wings.tag                    = []
+    wings.reference_area         = []
+    wings.wetted_area            = []
+    wings.mean_aerodynamic_chord = []
+    wings.thickness_to_chord     = []
+    wings.sweep                  = []
+    wings.transition_x_upper     = []
+    wings.transition_x_lower     = []
+    wings.lift_factor            = []
+
+    for wing in geometry.wings.values():
+
+        try:
+            Swet = wing.areas.wetted
+        except:
+            Swet = 1. * (1.0+ 0.2*wing.thickness_to_chord) * wing.areas.exposed
+            wing.areas.wetted = Swet
+
+        # only the main wing currently carries lift
+        if wing.tag != 'main_wing':
+            lift_factor = 0.
+        elif isinstance(wing,Wings.Main_Wing):
+            lift_factor = 1.
+        elif wing.vertical:
+            lift_factor = 0.
+        else:
+            lift_factor = 0.15
+
+        wings.tag                   .append(wing.tag)
+        wings.reference_area        .append(wing.areas.reference)
+        wings.wetted_area           .append(Swet)
+        wings.mean_aerodynamic_chord.append(wing.chords.mean_aerodynamic)
+        wings.thickness_to_chord    .append(wing.thickness_to_chord)
+        wings.sweep                 .append(wing.sweep)
+        wings.transition_x_upper    .append(wing.transition_x_upper)
+        wings.transition_x_lower    .append(wing.transition_x_lower)
+        wings.lift_factor           .append(lift_factor)
+
+    # fuselages
+    fuselages = Data()
+    fuselages.tag                = []
+    fuselages.reference_area     = []
+    fuselages.wetted_area        = []
+    fuselages.length             = []
+    fuselages.diameter_to_length = []
+
+    for fuselage in geometry.fuselages.values():
+
+        lengths = fuselage.lengths
+
+        fuselages.tag               .append(fuselage.tag)
+        fuselages.reference_area    .append(fuselage.areas.front_projected)
+        fuselages.wetted_area       .append(fuselage.areas.wetted)
+        fuselages.length            .append(lengths.cabin + lengths.nose + lengths.tail)
+        fuselages.diameter_to_length.append(float(fuselage.effective_diameter)/float(lengths.cabin))
+
+    # propulsors
+    propulsors = Data()
+    propulsors.tag               = []
+    propulsors.reference_area    = []
+    propulsors.wetted_area       = []
+    propulsors.length            = []
+    propulsors.diameter          = []
+    propulsors.number_of_engines = []
+
+    for propulsor in geometry.propulsors.values():
+
+        propulsors.tag              .append(propulsor.tag)
+        propulsors.reference_area   .append(propulsor.nacelle_diameter**2. / 4. * np.pi)
+        propulsors.wetted_area      .append(propulsor.areas.wetted)
+        propulsors.length           .append(propulsor.engine_length)
+        propulsors.diameter         .append(propulsor.nacelle_diameter)
+        propulsors.number_of_engines.append(propulsor.number_of_engines)
+
+    # one row of values per group, to broadcast against columns of conditions
+    for group in [wings,fuselages,propulsors]:
+        for key,values in group.items():
+            if key != 'tag':
+                group[key] = np.array(values,dtype=float)
+
+    if np.any(wings.transition_x_upper < 0.0) or np.any(wings.transition_x_upper > 1.0) or \
+       np.any(wings.transition_x_lower < 0.0) or np.any(wings.transition_x_lower > 1.0):
+        raise ValueError("Turbulent transition must be between 0 and 1")
+
+    components.wings      = wings
+    components.fuselages  = fuselages
+    components.propulsors = propulsors
+
+    return components
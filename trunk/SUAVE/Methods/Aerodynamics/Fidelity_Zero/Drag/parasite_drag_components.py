@@ -0,0 +1,193 @@
+# parasite_drag_components.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# local imports
+from compressible_mixed_flat_plate import compressible_mixed_flat_plate
+from compressible_turbulent_flat_plate import compressible_turbulent_flat_plate
+
+# suave imports
+from SUAVE.Core import Results
+
+# package imports
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Parasite Drag Components
+# ----------------------------------------------------------------------
+
+def parasite_drag_components(state,settings,components):
+    """ SUAVE.Methods.Aerodynamics.Fidelity_Zero.Drag.parasite_drag_components(state,settings,components)
+        computes the parasite drag of all wings, fuselages, propulsors and pylons
+        at all control points at once, from geometry packed by pack_drag_components
+
+        Inputs:
+            state.conditions.freestream - mach_number, temperature, reynolds_number
+            settings                    - wing_parasite_drag_form_factor
+                                          fuselage_parasite_drag_form_factor
+            components                  - see pack_drag_components
+
+        Outputs:
+            total parasite drag coefficient, with the vehicle reference area
+
+            conditions.aerodynamics.drag_breakdown.parasite is filled for each
+            component, the pylons and the total, as by parasite_drag_wing,
+            parasite_drag_fuselage, parasite_drag_propulsor, parasite_drag_pylon
+            and parasite_total
+
+        Assumptions:
+            the methods of those functions
+    """
+
+    # unpack
+    conditions = state.conditions
+    freestream = conditions.freestream
+    parasite   = conditions.aerodynamics.drag_breakdown.parasite
+    S_ref      = components.reference_area
+    wings      = components.wings
+    fuselages  = components.fuselages
+    propulsors = components.propulsors
+
+    # conditions, one row per control point
+    Mc  = freestream.mach_number
+    Tc  = freestream.temperature
+    re  = freestream.reynolds_number
+
+    # wings, one column per wing
+    C         = settings.wing_parasite_drag_form_factor
+    Sref_w    = wings.reference_area
+    Swet_w    = wings.wetted_area
+    t_c_w     = wings.thickness_to_chord
+    cos_sweep = np.cos(wings.sweep)
+
+    Re_w = re*wings.mean_aerodynamic_chord
+
+    cf_w_u, k_comp_w, k_reyn_u = compressible_mixed_flat_plate(Re_w,Mc,Tc,wings.transition_x_upper)
+    cf_w_l, k_comp_l, k_reyn_w = compressible_mixed_flat_plate(Re_w,Mc,Tc,wings.transition_x_lower)
+
+    k_w = 1. + ( 2.* C * (t_c_w * cos_sweep*cos_sweep) ) / ( np.sqrt(1.- Mc*Mc * cos_sweep*cos_sweep) )  \
+        + ( C**2. * cos_sweep*cos_sweep * t_c_w*t_c_w * (1. + 5.*(cos_sweep*cos_sweep)) ) \
+        / (2.*(1.-(Mc*cos_sweep)**2.))
+
+    cd_w = (k_w * cf_w_u * Swet_w / Sref_w /2. + k_w * cf_w_l * Swet_w / Sref_w /2.) * Sref_w/S_ref
+
+    for i,tag in enumerate(wings.tag):
+        store(parasite,tag,
+            wetted_area               = Swet_w[i] ,
+            reference_area            = Sref_w[i] ,
+            parasite_drag_coefficient = column(cd_w,i) ,
+            skin_friction_coefficient = column((cf_w_u+cf_w_l)/2.,i) ,
+            compressibility_factor    = column(k_comp_w,i) ,
+            reynolds_factor           = column(k_reyn_w,i) ,
+            form_factor               = column(k_w,i) ,
+        )
+
+    # fuselages, form factor for cylindrical bodies
+    form_factor = settings.fuselage_parasite_drag_form_factor
+    Sref_f      = fuselages.reference_area
+    Swet_f      = fuselages.wetted_area
+    d_d         = fuselages.diameter_to_length
+
+    cf_f, k_comp_f, k_reyn_f = compressible_turbulent_flat_plate(re*fuselages.length,Mc,Tc)
+
+    D        = np.sqrt(1 - (1-Mc**2) * d_d**2)
+    a        = 2 * (1-Mc**2) * (d_d**2) *(np.arctanh(D)-D) / (D**3)
+    du_max_u = a / ( (2-a) * (1-Mc**2)**0.5 )
+    k_f      = (1 + form_factor*du_max_u)**2
+
+    cd_f = k_f * cf_f * Swet_f / Sref_f * Sref_f/S_ref
+
+    for i,tag in enumerate(fuselages.tag):
+        store(parasite,tag,
+            wetted_area               = Swet_f[i] ,
+            reference_area            = Sref_f[i] ,
+            parasite_drag_coefficient = column(cd_f,i) ,
+            skin_friction_coefficient = column(cf_f,i) ,
+            compressibility_factor    = column(k_comp_f,i) ,
+            reynolds_factor           = column(k_reyn_f,i) ,
+            form_factor               = column(k_f,i) ,
+        )
+
+    # propulsors, form factor according to Raymer equation
+    Sref_p = propulsors.reference_area
+    Swet_p = propulsors.wetted_area
+    n_p    = propulsors.number_of_engines
+
+    cf_p, k_comp_p, k_reyn_p = compressible_turbulent_flat_plate(re*propulsors.length,Mc,Tc)
+
+    k_p = 1 + 0.35 / (propulsors.length/propulsors.diameter)
+
+    cd_p = k_p * cf_p * Swet_p / Sref_p * Sref_p/S_ref * n_p
+
+    for i,tag in enumerate(propulsors.tag):
+        store(parasite,tag,
+            wetted_area               = Swet_p[i] ,
+            reference_area            = Sref_p[i] ,
+            parasite_drag_coefficient = column(cd_p,i) ,
+            skin_friction_coefficient = column(cf_p,i) ,
+            compressibility_factor    = column(k_comp_p,i) ,
+            reynolds_factor           = column(k_reyn_p,i) ,
+            form_factor               = k_p[i] ,
+        )
+
+    # pylons, a fraction of the propulsor drag
+    pylon_factor = 0.20
+    cd_pylon     = pylon_factor * np.sum(cd_p*np.ones_like(Mc),axis=1)[:,None]
+
+    if len(propulsors.tag):
+        average = lambda values: np.mean(values*np.ones_like(cf_p),axis=1)[:,None]
+    else:
+        average = lambda values: np.zeros_like(Mc)
+
+    store(parasite,'pylon',
+        wetted_area               = pylon_factor * np.sum(Swet_p * n_p) ,
+        reference_area            = S_ref ,
+        parasite_drag_coefficient = cd_pylon ,
+        skin_friction_coefficient = average(cf_p) ,
+        compressibility_factor    = average(k_comp_p) ,
+        reynolds_factor           = average(k_reyn_p) ,
+        form_factor               = average(k_p) ,
+    )
+
+    # total
+    total_parasite_drag = np.sum(cd_w*np.ones_like(Mc),axis=1)[:,None] \
+                        + np.sum(cd_f*np.ones_like(Mc),axis=1)[:,None] \
+                        + np.sum(cd_p*np.ones_like(Mc),axis=1)[:,None] \
+                        + cd_pylon
+
+    parasite.total = total_parasite_drag
+
+    return total_parasite_drag
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def column(values,i):
+    """ the values of component i, a column of control points, from an
+        array with a column per component or one column shared by all
+    """
+
+    if values.shape[1] == 1:
+        return values
+    return values[:,i:i+1]
+
+
+def store(breakdown,tag,**values):
+    """ puts the values of a component in breakdown[tag], updating the
+        Results left there by the last evaluation rather than building anew
+    """
+
+    result = breakdown.get(tag,None)
+
+    if isinstance(result,Results):
+        for key,value in values.iteritems():
+            result[key] = value
+    else:
+        breakdown[tag] = Results(**values)
@@ -21,8 +21,11 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
         Inputs:
             wing - geometry dictionary with fields:
                 Sref - reference area
+            conditions.aerodynamics.angle_of_attack - a single angle of attack
+                or an array of them, all are solved with one factorization
 
         Outputs:
+            Cl, Cd - same shape as the angle of attack
 
         Assumptions:
         
@@ -47,123 +50,64 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
     # conditions
     aoa = conditions.aerodynamics.angle_of_attack
     
+    if orientation != False :
+        Cl = np.zeros(np.shape(aoa))[()]
+        Cd = np.zeros(np.shape(aoa))[()]
+        return Cl, Cd
+    
     # chord difference
     dchord=(root_chord-tip_chord)
     if sym_para is True :
         span=span/2
     deltax=span/n
-
-    if orientation == False :
-
-        section_length = np.empty(n)
-        area_section   = np.empty(n)
-        sl             = np.empty(n)
-        xpos           = np.empty(n)
-        ya             = np.empty(n)
-        yb             = np.empty(n)
-        xa             = np.empty(n)
-        yab            = np.empty(n)
-        ybb            = np.empty(n)
-        y2             = np.empty(n)   
-        x              = np.empty(n)
-        y              = np.empty(n)
-        twist_distri   = np.empty(n)
-        xloc_leading   = np.empty(n)
-        xloc_trailing  = np.empty(n)  
-        RHS            = np.empty([n,1])
-        w              = np.empty([n,n])
-        wb             = np.empty([n,n])
-        A              = np.empty([n,n])
-        L              = np.empty(n)
-        T              = np.empty(n)
-        A_v            = np.empty([n,n])
-        v              = np.empty(n)
-        Lfi            = np.empty(n)
-        Lfk            = np.empty(n)
-        Lft            = np.empty(n)
-        Dg             = np.empty(n)   
-        D              = np.empty(n)    
-    
-        # discretizing the wing sections into panels
-        for i in xrange(n):
-    
-            section_length[i] = dchord/span*(span-(i+1)*deltax+deltax/2) + tip_chord
-            area_section[i]   = section_length[i]*deltax
-            sl[i]             = section_length[i]
-            twist_distri[i]   = twist_rc + i/float(n)*(twist_tc-twist_rc)
-            xpos[i]           = (i)*deltax
-    
-            ya[i] = (i)*deltax
-            yb[i] = (i+1)*deltax
-            xa[i] = ((i+1)*deltax-deltax/2)*np.tan(sweep)+ 0.25*sl[i]
-    
-            x[i] = ((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*sl[i]
-            y[i] = ((i+1)*deltax-deltax/2)
-            
-            xloc_leading[i]  = ((i+1)*deltax)*np.tan(sweep)
-            xloc_trailing[i] = ((i+1)*deltax)*np.tan(sweep)+sl[i]
-    
     
-        # Influence coefficient computation
-        for i in xrange(n):
-    
-            RHS[i,0] = np.sin(twist_distri[i]+aoa)
-    
-            for j in range(0,n):
-    
-                yad = y[i]-ya[j]
-                xd  = x[i]-xa[j]
-                ybd = y[i]-yb[j]
+    # discretizing the wing sections into panels
+    i = np.arange(n)
+
+    section_length = dchord/span*(span-(i+1)*deltax+deltax/2) + tip_chord
+    area_section   = section_length*deltax
+    twist_distri   = twist_rc + i/float(n)*(twist_tc-twist_rc)
+
+    ya = (i)*deltax
+    yb = (i+1)*deltax
+    xa = ((i+1)*deltax-deltax/2)*np.tan(sweep)+ 0.25*section_length
+
+    x = ((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*section_length
+    y = ((i+1)*deltax-deltax/2)
+
+    # Influence coefficients, control points i by horseshoe vortices j
+    xi = x[:,None]
+    yi = y[:,None]
     
-                yadd = y[i]-yab[j]
-                ybdd = y[i]-ybb[j]
+    A = whav(xi,yi,xa,ya) - whav(xi,yi,xa,yb) \
+        - whav(xi,yi,xa,-ya) + whav(xi,yi,xa,-yb)
+    A = A*0.25/np.pi
+
+    # the influence matrix does not depend on the angle of attack,
+    # solve every angle of attack as one right hand side
+    RHS = np.sin(twist_distri[:,None] + np.ravel(aoa)[None,:])
     
-                A[i,j] = whav(x[i],y[i],xa[j],ya[j])-whav(x[i],y[i],xa[j],yb[j])\
-                    -whav(x[i],y[i],xa[j],-ya[j])+whav(x[i],y[i],xa[j],-yb[j])
-                A[i,j] = A[i,j]*0.25/np.pi
+    # Vortex strength computation by matrix inversion
+    T = np.linalg.solve(A,RHS)
     
-        # Vortex strength computation by matrix inversion
-        T = np.linalg.solve(A,RHS)
+    # Calculating the effective velocty 
+    v = np.dot(A*0.25/np.pi,T)
         
-        # Calculating the effective velocty 
-        for i in xrange(n):
-            v[i] = 0.0      
-            for j in range(0,n):
-    
-                A_v[i,j] = whav(xa[i],y[i],xa[j],ya[j])-whav(xa[i],y[i],xa[j],yb[j])\
-                    -whav(xa[i],y[i],xa[j],-ya[j])+whav(xa[i],y[i],xa[j],-yb[j])
-                
-                A_v[i,j] = A[i,j]*0.25/np.pi*T[j]
-                v[i]     = v[i]+A_v[i,j]
-            
-            Lfi[i] = -T[i]*(np.sin(twist_tc)-v[i])
-            Lfk[i] = T[i]*np.cos(twist_tc)        
-    
-            Lft[i] = (-Lfi[i]*np.sin(twist_tc)+Lfk[i]*np.cos(twist_tc))
-            Dg[i]  = (Lfi[i]*np.cos(twist_tc)+Lfk[i]*np.sin(twist_tc))
-    
-        # Lift computation from elements
-        LT    = 0.0
-        DT    = 0.0
-        arsec =0.0
-    
-        for i in xrange(n):
-    
-            L[i] = deltax*Lft[i] 
-            D[i] = deltax*Dg[i]    
-    
-            LT = LT+L[i]
-            DT = DT+D[i]
-    
-            arsec=arsec+area_section[i] 
-    
-        Cl = 2*LT/(0.5*Sref)
-        Cd = 2*DT/(0.5*Sref)     
+    Lfi = -T*(np.sin(twist_tc)-v)
+    Lfk = T*np.cos(twist_tc)        
+
+    Lft = (-Lfi*np.sin(twist_tc)+Lfk*np.cos(twist_tc))
+    Dg  = (Lfi*np.cos(twist_tc)+Lfk*np.sin(twist_tc))
+
+    # Lift computation from elements
+    LT = np.sum(deltax*Lft,axis=0)
+    DT = np.sum(deltax*Dg ,axis=0)
+
+    Cl = 2*LT/(0.5*Sref)
+    Cd = 2*DT/(0.5*Sref)     
     
-    else:
-        
-        Cl = 0.0
-        Cd = 0.0         
+    Cl = np.reshape(Cl,np.shape(aoa))[()]
+    Cd = np.reshape(Cd,np.shape(aoa))[()]
 
     return Cl, Cd
 
@@ -175,6 +119,7 @@ def whav(x1,y1,x2,y2):
         Inputs:
             x1,x2 -x coordinates of bound vortex
             y1,y2 -y coordinates of bound vortex
+            arrays are broadcast against each other
 
         Sref - reference area for non dimensionalization
         Outpus:
@@ -185,9 +130,12 @@ def whav(x1,y1,x2,y2):
             if needed
 
     """  
-    if x1==x2:
-        whv=1/(y1-y2)
-    else:  
-        whv=1/(y1-y2)*(1+ (np.sqrt((x1-x2)**2+(y1-y2)**2)/(x1-x2)))
+    dx = x1-x2
+    dy = y1-y2
+    
+    # the trailing legs only count where the points are not aligned
+    same_x = (dx == 0.)
+    dx     = np.where(same_x,1.,dx)
+    whv    = np.where(same_x,1/dy,1/dy*(1+ (np.sqrt(dx**2+dy**2)/dx)))
 
     return whv
\ No newline at end of file
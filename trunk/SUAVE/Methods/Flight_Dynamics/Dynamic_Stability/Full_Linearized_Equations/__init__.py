@@ -1,3 +1,7 @@
 
 from longitudinal import longitudinal
-from lateral_directional import lateral_directional
\ No newline at end of file
+from lateral_directional import lateral_directional
+
+# packages, loaded when first used
+from SUAVE.Core.Lazy_Module import lazy_import
+lazy_import(globals(),['Supporting_Functions'])
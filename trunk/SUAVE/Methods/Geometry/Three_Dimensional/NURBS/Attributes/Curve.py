@@ -158,14 +158,14 @@ class Curve(Data):
         """
 
         import matplotlib.pyplot as plt   
+        from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Methods.evaluate_curve_points import evaluate_curve_points
 
         # generate mesh points
         u = np.linspace(0,self.knots[-1],Nu)
-        x = np.zeros(Nu); y = np.zeros(Nu); z = np.zeros(Nu)
-
-        for i in range(Nu):
-            f = self.Evaluate(u[i])
-            x[i] = f[0]; y[i] = f[1]; z[i] = f[2];
+        f = evaluate_curve_points(self,u)
+        x = f[:,0]; y = f[:,1]
+        if self.dims == 3:
+            z = f[:,2]
 
         # visualize
         fig = plt.figure()
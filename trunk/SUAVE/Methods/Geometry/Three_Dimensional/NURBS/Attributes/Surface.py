@@ -10,6 +10,7 @@
 # ----------------------------------------------------------------------
 
 from SUAVE.Core import Data, Data_Exception
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Attributes.Curve import Curve
 import numpy as np
 
 
@@ -142,16 +143,13 @@ class Surface(Data):
 
         import matplotlib.pyplot as plt
         from mpl_toolkits.mplot3d import Axes3D
+        from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Methods.evaluate_surface_grid import evaluate_surface_grid
 
         # generate mesh points
         u = np.linspace(0,self.uknots[-1],Nu)
         v = np.linspace(0,self.vknots[-1],Nv)
-        x = np.zeros((Nu,Nv)); y = np.zeros((Nu,Nv)); z = np.zeros((Nu,Nv))
-
-        for i in range(Nu):
-            for j in range(Nv):
-                f = self.Evaluate(u[i],v[j])
-                x[i][j] = f[0]; y[i][j] = f[1]; z[i][j] = f[2];
+        f = evaluate_surface_grid(self,u,v)
+        x = f[:,:,0]; y = f[:,:,1]; z = f[:,:,2]
 
         # visualize
         fig = plt.figure()
@@ -1,7 +1,11 @@
 
 import basis_function
+import basis_function_matrix
 import basis_functions
 import basis_functions_derivatives
 import evaluate_curve
+import evaluate_curve_points
 import evaluate_surface
-import find_span
\ No newline at end of file
+import evaluate_surface_grid
+import find_span
+import find_spans
\ No newline at end of file
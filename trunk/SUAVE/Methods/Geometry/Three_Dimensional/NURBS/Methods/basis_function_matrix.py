@@ -0,0 +1,124 @@
+""" basis_function_matrix.py: NURBS basis functions of many coordinates """
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Methods.find_spans import find_spans
+
+# ----------------------------------------------------------------------
+#  Methods
+# ----------------------------------------------------------------------
+
+def basis_function_matrix(knots,p,u,derivatives=0):
+
+    """  NURBS Support function: compute all basis function values, and their
+         derivatives, at many parametric coordinates at once
+
+         Inputs:    knots = knot vector (length m) (floats)
+                    p = degree of basis functions (int)
+                    u = parametric coordinates (array of floats, length n_points)
+                    derivatives = highest derivative order (int, default = 0)
+
+         Outputs:   (derivatives+1) x n_points x (m-p-1) array, the value of
+                    each basis function and its derivatives at each coordinate,
+                    multiplying it with the control points evaluates the curve
+
+    """
+
+    # unpack
+    knots = np.asarray(knots,dtype=float)
+    u = np.atleast_1d(np.asarray(u,dtype=float))
+    p = int(p); d = int(derivatives)
+    n_points = len(u)
+    n_cps = len(knots) - p - 1
+
+    spans = find_spans(knots,p,u)
+
+    # nonzero functions of each span and their derivatives, vectorized over the points
+    ders = nonzero_basis_functions(knots,p,u,spans,min(d,p))
+
+    # scatter into the columns of the control points of each span
+    B = np.zeros((d+1,n_points,n_cps))
+    rows = np.arange(n_points)
+    for k in range(min(d,p)+1):
+        for r in range(p+1):
+            B[k,rows,spans-p+r] = ders[k,r]
+
+    return B
+
+
+def nonzero_basis_functions(knots,p,u,spans,n):
+
+    """  NURBS Support function: the p+1 nonzero basis functions of each span and
+         their derivatives up to order n, algorithm A2.3 of The NURBS Book with
+         every point computed at once
+
+         Outputs:   (n+1) x (p+1) x n_points array (floats)
+
+    """
+
+    n_points = len(u)
+
+    # basis functions and knot differences
+    ndu = np.zeros((p+1,p+1,n_points))
+    ndu[0,0] = 1.0
+    left = np.zeros((p+1,n_points)); right = np.zeros((p+1,n_points))
+
+    for j in range(1,p+1):
+
+        left[j] = u - knots[spans+1-j]
+        right[j] = knots[spans+j] - u
+        s = 0.0
+
+        for r in range(j):
+
+            # lower triangle
+            ndu[j,r] = right[r+1] + left[j-r]
+            t = ndu[r,j-1]/ndu[j,r]
+
+            # upper triangle
+            ndu[r,j] = s + right[r+1]*t
+            s = left[j-r]*t
+
+        ndu[j,j] = s
+
+    ders = np.zeros((n+1,p+1,n_points))
+    ders[0] = ndu[:,p]
+
+    # derivatives
+    for r in range(p+1):
+        a = np.zeros((2,p+1,n_points))
+        a[0,0] = 1.0
+        s1 = 0; s2 = 1
+        for k in range(1,n+1):
+            d = np.zeros(n_points)
+            rk = r - k; pk = p - k
+            if r >= k:
+                a[s2,0] = a[s1,0]/ndu[pk+1,rk]
+                d = a[s2,0]*ndu[rk,pk]
+            if rk >= -1:
+                j1 = 1
+            else:
+                j1 = -rk
+            if r - 1 <= pk:
+                j2 = k - 1
+            else:
+                j2 = p - r
+            for j in range(j1,j2+1):
+                a[s2,j] = (a[s1,j] - a[s1,j-1])/ndu[pk+1,rk+j]
+                d = d + a[s2,j]*ndu[rk+j,pk]
+            if r <= pk:
+                a[s2,k] = -a[s1,k-1]/ndu[pk+1,r]
+                d = d + a[s2,k]*ndu[r,pk]
+            ders[k,r] = d
+            s1, s2 = s2, s1
+
+    # multiply through by the correct factors
+    r = p
+    for k in range(1,n+1):
+        ders[k] *= r
+        r *= p - k
+
+    return ders
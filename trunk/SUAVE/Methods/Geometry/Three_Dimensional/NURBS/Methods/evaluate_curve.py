@@ -8,6 +8,7 @@ import numpy as np
 from SUAVE.Core import Data
 from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Attributes.Curve import Curve
 from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Attributes.Surface import Surface
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Methods.evaluate_curve_points import evaluate_curve_points
 
 # ----------------------------------------------------------------------
 #  Methods
@@ -23,20 +24,4 @@ def evaluate_curve(curve,u):
          Outputs:   coordinates on curve at u (numpy float array)
 
     """
-    # find span
-    span = FindSpan(curve,u)
-
-    # compute basis functions
-    N = BasisFunctions(curve,u,span)
-    
-    # compute coordinates
-    C = np.zeros(curve.dims);
-    W = 0.0
-    for i in range(0,curve.p+1):                        # for (i = 0; i <= p; i++)
-        C[0] += N[i]*curve.CPs.x[span-curve.p+i]*curve.w[span-curve.p+i]
-        C[1] += N[i]*curve.CPs.y[span-curve.p+i]*curve.w[span-curve.p+i]
-        if curve.dims == 3:
-            C[2] += N[i]*curve.CPs.z[span-curve.p+i]*curve.w[span-curve.p+i]
-        W += N[i]*curve.w[span-curve.p+i]
-
-    return C/W
+    return evaluate_curve_points(curve,[u])[0]
@@ -0,0 +1,55 @@
+""" evaluate_curve_points.py: Evaluate a NURBS curve at many points """
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from scipy.special import comb
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Methods.basis_function_matrix import basis_function_matrix
+
+# ----------------------------------------------------------------------
+#  Methods
+# ----------------------------------------------------------------------
+
+def evaluate_curve_points(curve,u,derivatives=0):
+
+    """  evaluate_curve_points(curve,u,derivatives=0): evaluate a curve at an
+         array of parametric coordinates
+
+         Inputs:    curve = NURBS curve class instance                  (required)
+                    u = parametric coordinates                          (required)      (array of floats)
+                    derivatives = highest derivative order with respect to u
+                                                                        (default = 0)   (int)
+
+         Outputs:   n_points x dims array of coordinates on the curve, or with
+                    derivatives, a (derivatives+1) x n_points x dims array of the
+                    coordinates and their derivatives
+
+    """
+
+    # unpack
+    d = int(derivatives)
+    w = np.asarray(curve.w,dtype=float)
+    P = [curve.CPs.x,curve.CPs.y]
+    if curve.dims == 3:
+        P.append(curve.CPs.z)
+    P = np.array(P,dtype=float).T
+
+    # weighted coordinates and weights, and their derivatives
+    B = basis_function_matrix(curve.knots,curve.p,u,d)
+    A = np.dot(B,P*w[:,None])
+    W = np.dot(B,w)[:,:,None]
+
+    # rational derivatives, from those of the numerator and denominator
+    C = np.zeros_like(A)
+    for k in range(d+1):
+        v = A[k]
+        for i in range(1,k+1):
+            v = v - comb(k,i)*W[i]*C[k-i]
+        C[k] = v/W[0]
+
+    if d == 0:
+        return C[0]
+
+    return C
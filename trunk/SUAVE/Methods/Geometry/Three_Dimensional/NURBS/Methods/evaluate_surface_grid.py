@@ -0,0 +1,61 @@
+""" evaluate_surface_grid.py: Evaluate a NURBS surface on a parametric grid """
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from SUAVE.Methods.Geometry.Three_Dimensional.NURBS.Methods.basis_function_matrix import basis_function_matrix
+
+# ----------------------------------------------------------------------
+#  Methods
+# ----------------------------------------------------------------------
+
+def evaluate_surface_grid(surface,u,v,derivatives=0):
+
+    """  evaluate_surface_grid(surface,u,v,derivatives=0): evaluate a surface at
+         every combination of the parametric coordinates u and v
+
+         Inputs:    surface = NURBSSurface class instance               (required)
+                    u = parametric coordinates 1                        (required)      (array of floats)
+                    v = parametric coordinates 2                        (required)      (array of floats)
+                    derivatives = 1 to also compute the first derivatives
+                                                                        (default = 0)   (int)
+
+         Outputs:   n_u x n_v x 3 array of coordinates on the surface, or with
+                    derivatives, a 3 x n_u x n_v x 3 array of the coordinates and
+                    their derivatives with respect to u and to v
+
+    """
+
+    d = int(derivatives)
+    if d not in (0,1):
+        raise ValueError , 'evaluate_surface_grid computes first derivatives only'
+
+    # unpack
+    w = np.asarray(surface.w,dtype=float)
+    P = np.array([surface.CPs.x,surface.CPs.y,surface.CPs.z],dtype=float)
+
+    # the basis functions of each direction, once for the whole grid
+    Bu = basis_function_matrix(surface.uknots,surface.p,u,d)
+    Bv = basis_function_matrix(surface.vknots,surface.q,v,d)
+
+    # weighted coordinates and weights, Bu * (w*P) * Bv^T
+    def contract(k,l):
+        A = np.einsum('ia,cab,jb->ijc',Bu[k],P*w,Bv[l])
+        W = np.dot(np.dot(Bu[k],w),Bv[l].T)[:,:,None]
+        return A, W
+
+    A, W = contract(0,0)
+    S = A/W
+
+    if d == 0:
+        return S
+
+    # first derivatives of the rational surface
+    Au, Wu = contract(1,0)
+    Av, Wv = contract(0,1)
+    Su = (Au - Wu*S)/W
+    Sv = (Av - Wv*S)/W
+
+    return np.array([S,Su,Sv])
@@ -0,0 +1,35 @@
+""" find_spans.py: find NURBS parametric spans of many coordinates """
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Methods
+# ----------------------------------------------------------------------
+
+def find_spans(knots,p,u):
+
+    """  NURBS Support function: determine the knot span index of each coordinate,
+         the vectorized version of find_span
+
+         Inputs:    knots = knot vector (length m) (floats)
+                    p = degree of basis functions (int)
+                    u = parametric coordinates (array of floats)
+
+         Outputs:   knot span indices (array of ints)
+
+    """
+
+    # unpack
+    knots = np.asarray(knots,dtype=float)
+    u = np.asarray(u,dtype=float)
+    m = len(knots)
+    n = m - p - 1
+
+    # last knot not greater than u, the endpoint belongs to the last span
+    spans = np.searchsorted(knots,u,side='right') - 1
+
+    return np.clip(spans,p,n-1)
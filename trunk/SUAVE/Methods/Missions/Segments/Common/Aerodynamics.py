@@ -69,8 +69,18 @@ def update_atmosphere(segment,state):
     conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
     
     return
-    
-    
+
+# paths for Process.evaluate_skipping(), the atmosphere model by its tag
+update_atmosphere.reads  = ('state.conditions.freestream.altitude',
+                            'segment.temperature_deviation',
+                            'segment.analyses.atmosphere.tag')
+update_atmosphere.writes = ('state.conditions.freestream.pressure',
+                            'state.conditions.freestream.temperature',
+                            'state.conditions.freestream.density',
+                            'state.conditions.freestream.speed_of_sound',
+                            'state.conditions.freestream.dynamic_viscosity')
+
+
 # ----------------------------------------------------------------------
 #  Update Freestream
 # ----------------------------------------------------------------------
@@ -121,6 +131,16 @@ def update_freestream(segment,state):
 
     return
 
+# paths for Process.evaluate_skipping()
+update_freestream.reads  = ('state.conditions.frames.inertial.velocity_vector',
+                            'state.conditions.freestream.density',
+                            'state.conditions.freestream.speed_of_sound',
+                            'state.conditions.freestream.dynamic_viscosity')
+update_freestream.writes = ('state.conditions.freestream.velocity',
+                            'state.conditions.freestream.mach_number',
+                            'state.conditions.freestream.reynolds_number',
+                            'state.conditions.freestream.dynamic_pressure')
+
 
 # ----------------------------------------------------------------------
 #  Update Aerodynamics
@@ -116,8 +116,18 @@ def update_planet_position(segment,state):
     conditions.frames.planet.longitude = lon + mu
 
     return
-    
-    
+
+# paths for Process.evaluate_skipping()
+update_planet_position.reads  = ('state.conditions.freestream.velocity',
+                                 'state.conditions.freestream.altitude',
+                                 'state.conditions.frames.body.inertial_rotations',
+                                 'state.conditions.aerodynamics.angle_of_attack',
+                                 'state.numerics.time.integrate',
+                                 'segment.analyses.planet.features.mean_radius')
+update_planet_position.writes = ('state.conditions.frames.planet.latitude',
+                                 'state.conditions.frames.planet.longitude')
+
+
 # ----------------------------------------------------------------------
 #  Update Orientations
 # ----------------------------------------------------------------------
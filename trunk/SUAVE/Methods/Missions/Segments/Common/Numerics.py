@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------
 
 from SUAVE.Core.Arrays import atleast_2d_col 
+from SUAVE.Methods.Utilities.Chebyshev import discretization_operators
 
 # ----------------------------------------------------------------------
 #  Initialize Differentials
@@ -20,8 +21,8 @@ def initialize_differentials_dimensionless(segment,state):
     N                     = numerics.number_control_points
     discretization_method = numerics.discretization_method
     
-    # get operators
-    x,D,I = discretization_method(N,**numerics)
+    # get operators, shared and read-only
+    x,D,I = discretization_operators(discretization_method,N,**numerics)
     x = atleast_2d_col(x)
     
     # pack
@@ -58,4 +59,8 @@ def update_differentials_time(segment,state):
     numerics.time.integrate      = I
 
     return
-    
\ No newline at end of file
+
+# paths for Process.evaluate_skipping()
+update_differentials_time.reads  = ('state.numerics.dimensionless',
+                                    'state.conditions.frames.inertial.time')
+update_differentials_time.writes = ('state.numerics.time',)
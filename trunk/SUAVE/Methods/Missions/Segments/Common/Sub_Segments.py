@@ -7,8 +7,6 @@
 #  Imports
 # ----------------------------------------------------------------------
 
-from copy import deepcopy
-
 # ----------------------------------------------------------------------
 #  Expand Sub Segments
 # ----------------------------------------------------------------------
@@ -19,12 +17,19 @@ def expand_sub_segments(segment,state):
     
     last_tag = None
     
+    # reuse the segment states kept by state.reset(), only once
+    reuse = getattr(state,'_reuse_segments',False)
+    state._reuse_segments = False
+    
     for tag,sub_segment in segment.segments.items():
         
         if Process.verbose:
             print 'segment start :' , tag
         
-        sub_state = deepcopy( sub_segment.state )
+        if reuse and state.segments.has_key(tag):
+            sub_state = state.segments[tag]
+        else:
+            sub_state = sub_segment.state.clone()
         
         if last_tag:
             sub_state.initials = state.segments[last_tag]
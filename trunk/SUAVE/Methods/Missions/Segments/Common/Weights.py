@@ -46,6 +46,11 @@ def update_gravity(segment,state):
 
     return
 
+# paths for Process.evaluate_skipping()
+update_gravity.reads  = ('segment.analyses.planet.features.sea_level_gravity',)
+update_gravity.writes = ('state.conditions.freestream.gravity',)
+
+
 # ----------------------------------------------------------------------
 #  Update Weights
 # ----------------------------------------------------------------------
@@ -1,6 +1,8 @@
 
 from converge_root import converge_root
 from expand_state  import expand_state
+from colored_jacobian import colored_jacobian
+from warm_start       import load_warm_start, store_warm_start
 
 import Common
 import Cruise
@@ -0,0 +1,177 @@
+# colored_jacobian.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core.Arrays    import array_type, matrix_type
+from SUAVE.Core.Deep_Core import OrderedDict
+
+# ----------------------------------------------------------------------
+#  Colored Jacobian
+# ----------------------------------------------------------------------
+
+def colored_jacobian(unknowns,(segment,state)):
+    """ J = colored_jacobian(unknowns,(segment,state))
+        finite difference jacobian of the segment residuals, perturbing
+        groups of unknowns that don't share a control point together
+
+        Inputs:
+            unknowns - packed vector of unknowns
+            segment  - the segment being converged
+            state    - the segment state
+
+        Outputs:
+            J - jacobian array, [number of residuals x number of unknowns]
+
+        Assumptions:
+            a control point residual only depends on the control point
+            unknowns at its own control point, coupling through the
+            differentiation and integration operators is neglected.
+            scalar unknowns get a color each, and their full column of
+            the jacobian. the change of a scalar residual over a color of
+            control point unknowns is spread over those unknowns as the
+            smallest row that reproduces it. the root finder should
+            tolerate an approximate jacobian, as the hybrid method does.
+
+        Usage Notes:
+            segment.settings.jacobian = colored_jacobian
+            uses one residual evaluation per color, the number of colors
+            is the number of unknown columns plus the number of scalar
+            unknowns, independent of the number of control points
+    """
+
+    from converge_root import iterate
+
+    unknowns = np.array(unknowns,dtype=float)
+
+    # baseline
+    residuals = iterate(unknowns,(segment,state))
+
+    # sparsity
+    unknown_keys  = packing_keys(state.unknowns)
+    residual_keys = packing_keys(state.residuals)
+    colors = color_keys(unknown_keys)
+
+    n_x = len(unknowns)
+    n_r = len(residuals)
+    J   = np.zeros([n_r,n_x])
+
+    if len(unknown_keys) != n_x or len(residual_keys) != n_r:
+        raise ValueError , 'unknowns and residuals do not match their packed arrays'
+
+    # every control point residual needs the unknowns of its control point
+    points = set([ key for key in unknown_keys if key is not None ])
+    if points:
+        missing = set([ key for key in residual_keys if key is not None ]) - points
+        if missing:
+            raise ValueError , 'residual control points %s have no unknowns' % sorted(missing)
+
+    scalar_rows = np.array([ key is None for key in residual_keys ],dtype=bool)
+
+    # step size
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(unknowns),1.)
+
+    for color in colors:
+
+        # perturb all unknowns of this color together
+        x = unknowns.copy()
+        x[color] = x[color] + h[color]
+        dR = iterate(x,(segment,state)) - residuals
+
+        # a scalar unknown may change every residual
+        if unknown_keys[color[0]] is None:
+            J[:,color[0]] = dR / h[color[0]]
+            continue
+
+        # assign each control point residual to the unknown of its control point
+        key_map = dict([ (unknown_keys[i],i) for i in color ])
+        for r,key in enumerate(residual_keys):
+            if key is not None and key_map.has_key(key):
+                i = key_map[key]
+                J[r,i] = dR[r] / h[i]
+
+        # scalar residuals see the whole color
+        if np.any(scalar_rows):
+            h_c = h[color]
+            J[np.ix_(scalar_rows,color)] = dR[scalar_rows][:,None] * h_c[None,:] / np.dot(h_c,h_c)
+
+    # leave the state at the baseline unknowns
+    state.unknowns.unpack_array(unknowns)
+
+    return J
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def packing_keys(data):
+    """ keys = packing_keys(data)
+        control point of each entry of data.pack_array('vector')
+
+        Outputs:
+            keys - list of control point rows, or None for scalars
+    """
+
+    valid_types = ( int, float, array_type, matrix_type )
+
+    keys = []
+
+    def do_keys(D):
+        for v in D.itervalues():
+            if isinstance(v,OrderedDict):
+                do_keys(v) # recursion!
+                continue
+            elif not isinstance(v,valid_types): continue
+            rank = np.rank(v)
+            if rank > 2:
+                continue
+            elif rank == 0:
+                keys.append(None)
+            elif rank == 1:
+                keys.extend(range(len(v)))
+            elif rank == 2:
+                n,m = v.shape
+                keys.extend(range(n) * m)
+
+    do_keys(data)
+
+    return keys
+
+def color_keys(keys):
+    """ colors = color_keys(keys)
+        greedy coloring of the unknowns, no two unknowns of a color
+        share a control point, scalar unknowns get a color each
+
+        Outputs:
+            colors - list of index arrays into the packed unknowns
+    """
+
+    colors = []
+    used   = []
+
+    for i,key in enumerate(keys):
+
+        if key is None:
+            colors.append([i])
+            used.append(None)
+            continue
+
+        for c,c_used in enumerate(used):
+            if c_used is None or key in c_used: continue
+            colors[c].append(i)
+            c_used.add(key)
+            break
+        else:
+            colors.append([i])
+            used.append(set([key]))
+
+    colors = [ np.array(color) for color in colors ]
+
+    return colors
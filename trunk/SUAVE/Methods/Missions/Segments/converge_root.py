@@ -13,23 +13,51 @@ import scipy.optimize
 
 from SUAVE.Core.Arrays import array_type
 
+from warm_start import load_warm_start, store_warm_start
+
 # ----------------------------------------------------------------------
 #  Converge Root
 # ----------------------------------------------------------------------
 
 def converge_root(segment,state):
     
+    try:
+        warm_start = segment.settings.warm_start
+    except AttributeError:
+        warm_start = None
+        
+    if warm_start is not None:
+        load_warm_start(segment,state)
+    
     unknowns = state.unknowns.pack_array()
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
+        
+    try:
+        jacobian = segment.settings.jacobian
+    except AttributeError:
+        jacobian = None
     
-    unknowns = root_finder( iterate,
-                            unknowns,
-                            args = [segment,state],
-                            xtol = state.numerics.tolerance_solution)
+    if jacobian is None:
+        unknowns = root_finder( iterate,
+                                unknowns,
+                                args = [segment,state],
+                                xtol = state.numerics.tolerance_solution)
+    else:
+        unknowns = root_finder( iterate,
+                                unknowns,
+                                args   = [segment,state],
+                                xtol   = state.numerics.tolerance_solution,
+                                fprime = jacobian)
+        
+        # the last call may have been a jacobian perturbation
+        iterate(unknowns,(segment,state))
+        
+    if warm_start is not None:
+        store_warm_start(segment,state)
     
     return
     
@@ -0,0 +1,102 @@
+# warm_start.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from copy import deepcopy
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+
+# ----------------------------------------------------------------------
+#  Load Warm Start
+# ----------------------------------------------------------------------
+
+def load_warm_start(segment,state):
+    """ load_warm_start(segment,state)
+        seeds state.unknowns with the last converged unknowns stored
+        under segment.tag in segment.settings.warm_start
+
+        Assumptions:
+            unknowns with a different number of control points are
+            interpolated on the dimensionless control points
+            unknowns that don't match the stored ones keep their defaults
+
+        Usage Notes:
+            share one store between segments and evaluations, for example
+                warm_start = Data()
+                for segment in mission.segments:
+                    segment.settings.warm_start = warm_start
+    """
+
+    store = segment.settings.warm_start
+
+    if not store.has_key(segment.tag):
+        return
+
+    stored = store[segment.tag]
+
+    x_old = stored.control_points.ravel()
+    x_new = state.numerics.dimensionless.control_points.ravel()
+
+    def do_load(S,U):
+        for k,v in S.iteritems():
+            if not U.has_key(k): continue
+            u = U[k]
+            # recursion
+            if isinstance(v,Data):
+                if isinstance(u,Data):
+                    do_load(v,u)
+            # arrays, in place to keep any views
+            elif isinstance(v,array_type):
+                if not isinstance(u,array_type) or u.ndim != v.ndim:
+                    continue
+                elif u.shape == v.shape:
+                    u[...] = v
+                elif u.shape[1:] == v.shape[1:] and v.shape[0] == len(x_old) and u.shape[0] == len(x_new):
+                    v = np.reshape(v,[v.shape[0],-1])
+                    u = np.reshape(u,[u.shape[0],-1])
+                    for j in range(v.shape[1]):
+                        u[:,j] = np.interp(x_new,x_old,v[:,j])
+            # scalars
+            elif isinstance(v,(int,float)) and np.rank(u) == 0:
+                U[k] = v
+
+    do_load(stored.unknowns,state.unknowns)
+
+    return
+
+# ----------------------------------------------------------------------
+#  Store Warm Start
+# ----------------------------------------------------------------------
+
+def store_warm_start(segment,state):
+    """ store_warm_start(segment,state)
+        stores a copy of the converged state.unknowns under segment.tag
+        in segment.settings.warm_start
+    """
+
+    store = segment.settings.warm_start
+
+    stored = Data()
+    stored.control_points = deepcopy(state.numerics.dimensionless.control_points)
+    stored.unknowns       = Data()
+
+    def do_store(U,S):
+        for k,v in U.iteritems():
+            if isinstance(v,Data):
+                S[k] = Data()
+                do_store(v,S[k])
+            elif isinstance(v,(array_type,int,float)):
+                S[k] = deepcopy(v)
+
+    do_store(state.unknowns,stored.unknowns)
+
+    store[segment.tag] = stored
+
+    return
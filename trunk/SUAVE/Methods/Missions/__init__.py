@@ -1,2 +1,4 @@
+from evaluate_missions import evaluate_missions
+
 
 import Segments
\ No newline at end of file
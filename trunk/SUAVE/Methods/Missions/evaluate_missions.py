@@ -0,0 +1,106 @@
+# evaluate_missions.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import cPickle as pickle
+import multiprocessing
+from copy import deepcopy
+from warnings import warn
+
+# ----------------------------------------------------------------------
+#  Evaluate Missions
+# ----------------------------------------------------------------------
+
+def evaluate_missions(missions,state=None,number_of_processes=1,deltas=None):
+    """ results = evaluate_missions(missions,state=None,number_of_processes=1,deltas=None)
+        evaluates independent missions, in a pool of worker processes
+        if more than one process is requested
+
+        Inputs:
+            missions            - list of missions, or one base mission if
+                                  deltas are given
+            state               - optional state passed to each mission.evaluate()
+            number_of_processes - number of worker processes,
+                                  None uses all cpus, 1 evaluates serially
+            deltas              - optional list of dictionaries of
+                                  {'key.path' : value}, each is deep_set on a
+                                  copy of the base mission before evaluation,
+                                  only the deltas are sent to the workers
+
+        Outputs:
+            results - list of mission results, in the order of missions or deltas
+
+        Assumptions:
+            missions are independent and can be pickled
+            changes a mission makes to itself while evaluating stay in the worker
+            falls back to serial evaluation if the missions can't be pickled
+    """
+
+    if number_of_processes is None:
+        number_of_processes = multiprocessing.cpu_count()
+
+    if deltas is None:
+        base  = None
+        tasks = list(missions)
+    else:
+        base  = missions
+        tasks = list(deltas)
+
+    number_of_processes = min(number_of_processes,len(tasks))
+
+    # serial
+    if number_of_processes <= 1:
+        return _evaluate_serial(base,tasks,state)
+
+    # check missions can be shipped
+    try:
+        pickle.dumps( (base,tasks,state) , pickle.HIGHEST_PROTOCOL )
+    except Exception as exc:
+        warn('missions could not be pickled, evaluating serially: %s' % exc, RuntimeWarning)
+        return _evaluate_serial(base,tasks,state)
+
+    # parallel, map keeps the order
+    pool = multiprocessing.Pool( number_of_processes, _initialize_worker, (base,state) )
+    try:
+        results = pool.map(_evaluate_task,tasks,chunksize=1)
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    return results
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+_worker = {}
+
+def _initialize_worker(base,state):
+    _worker['base']  = base
+    _worker['state'] = state
+
+def _evaluate_task(task):
+    return _evaluate(_worker['base'],task,_worker['state'])
+
+def _evaluate_serial(base,tasks,state):
+    return [ _evaluate(base,task,state) for task in tasks ]
+
+def _evaluate(base,task,state):
+
+    if base is None:
+        mission = task
+    else:
+        mission = deepcopy(base)
+        for keys,value in task.items():
+            mission.deep_set(keys,value)
+
+    return mission.evaluate(state)
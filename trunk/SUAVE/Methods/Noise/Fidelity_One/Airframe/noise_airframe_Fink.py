@@ -21,7 +21,7 @@ from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_tone_correction
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import dbA_noise
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_source_conditions
 
 import numpy as np
 
@@ -29,7 +29,7 @@ import numpy as np
 #  Noise Fidelity One
 # ----------------------------------------------------------------------
 
-def noise_fidelity_one(config, analyses, noise_segment,ioprint = 0, filename=0): 
+def noise_fidelity_one(config, analyses, noise_segment,ioprint = 0, filename=0, source_conditions = None): 
 
     """ SUAVE.Methods.Noise.Fidelity_One.noise_fidelity_one(config, analyses, noise_segment):
             Computes the noise from different sources of the airframe for a given vehicle for a constant altitude flight.
@@ -59,6 +59,9 @@ def noise_fidelity_one(config, analyses, noise_segment,ioprint = 0, filename=0):
                     altitude                    - Airport altitude
                     delta_isa                   - ISA Temperature deviation
 
+                source_conditions - optional, results of noise_source_conditions for this segment,
+                                    computed if not given
+
 
             Outputs: One Third Octave Band SPL [dB]
                 SPL_wing                         - Sound Pressure Level of the clean wing
@@ -96,9 +99,14 @@ def noise_fidelity_one(config, analyses, noise_segment,ioprint = 0, filename=0):
     nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels   
     main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels   
     main_units     =   config.landing_gear.main_units                            #Number of main units   
-    velocity       =   np.float(noise_segment.conditions.freestream.velocity[0,0]) 
-    altitude       =   noise_segment.conditions.freestream.altitude[:,0] 
-    time           =   noise_segment.conditions.frames.inertial.time     
+    
+    # Prepares the atmospheric and geometric conditions of all the points at once
+    if source_conditions is None:
+        source_conditions = noise_source_conditions(noise_segment,analyses,config)
+        
+    velocity       =   source_conditions.velocity
+    altitude       =   source_conditions.altitude
+    time           =   source_conditions.time
 
     # determining flap slot number
     if wing.main_wing.flaps.type   == 'single_sloted':
@@ -108,43 +116,28 @@ def noise_fidelity_one(config, analyses, noise_segment,ioprint = 0, filename=0):
     elif wing.main_wing.flaps.type == 'triple_sloted':
         slots = 3
     
-    # Calls the function noise_geometric to calculate all the distance and emission angles
-    geometric = noise_geometric(noise_segment,analyses,config)
-    
-    distance_vector = geometric[:][0]    
-    angle = geometric[:][1]
-    phi   = geometric[:][2]
+    # Distance and emission angles
+    distance_vector = source_conditions.geometric.distance
+    angle = source_conditions.geometric.theta
+    phi   = source_conditions.geometric.phi
     
-        
     # Number of points on the discretize segment   
     nsteps=len(time)
     
-    # Preparing matrix for noise calculation
-    sound_speed = np.zeros(nsteps)
-    density     = np.zeros(nsteps)
-    viscosity   = np.zeros(nsteps)
-    temperature = np.zeros(nsteps)
-    M           = np.zeros(nsteps)
-    deltaw      = np.zeros(nsteps)
-    
     # ==============================================
-    #         Computing atmospheric conditions
+    #         Atmospheric conditions
     # ==============================================
     
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(altitude[id])
-        
-        #unpack    
-        sound_speed[id] =    np.float(atmo_data.speed_of_sound)
-        density[id]     =    np.float(atmo_data.density)
-        viscosity[id]   =    np.float(atmo_data.dynamic_viscosity*10.7639) #units converstion - m2 to ft2
-        temperature[id] =    np.float(atmo_data.temperature)
+    sound_speed =    source_conditions.freestream.speed_of_sound
+    density     =    source_conditions.freestream.density
+    viscosity   =    source_conditions.freestream.dynamic_viscosity*10.7639 #units converstion - m2 to ft2
+    temperature =    source_conditions.freestream.temperature
         
-        #Mach number
-        M[id] = velocity/np.sqrt(1.4*287*temperature[id])
+    #Mach number
+    M = velocity/np.sqrt(1.4*287*temperature)
     
-        #Wing Turbulent Boundary Layer thickness, ft
-        deltaw[id] = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity[id]))**(-0.2)
+    #Wing Turbulent Boundary Layer thickness, ft
+    deltaw = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity))**(-0.2)
     
 
     #Units conversion - knots to ft/s
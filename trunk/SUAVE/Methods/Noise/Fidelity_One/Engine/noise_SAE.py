@@ -24,14 +24,14 @@ from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_tone_correction
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_source_conditions
 
 
 # ----------------------------------------------------------------------        
 #   Noise SAE
 # ----------------------------------------------------------------------    
 
-def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0): 
+def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0, source_conditions = None): 
 
     #SAE ARP*876D 1994
     """This method predicts the free-field 1/3 Octave Band SPL of coaxial subsonic
@@ -68,6 +68,9 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
                         altitude                    - Airport altitude
                         delta_isa                   - ISA Temperature deviation
 
+                    source_conditions - optional, results of noise_source_conditions for this segment
+                                        and turbofan, computed if not given
+
 
                 Outputs: One Third Octave Band SPL [dB]
                     SPL_p                           - Sound Pressure Level of the primary jet
@@ -79,15 +82,19 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
                     ."""
 
 
+    # Prepares the atmospheric, geometric and jet conditions of all the points at once
+    if source_conditions is None:
+        source_conditions = noise_source_conditions(noise_segment,analyses,config,turbofan)
+
     #unpack
     
-    Velocity_primary_1      =       np.float(turbofan.core_nozzle.noise_speed * 0.92*(turbofan.design_thrust/52700.))   
-    Temperature_primary     =       noise_segment.conditions.propulsion.acoustic_outputs.core.exit_stagnation_temperature
-    Pressure_primary        =       noise_segment.conditions.propulsion.acoustic_outputs.core.exit_stagnation_pressure
+    Velocity_primary        =       source_conditions.engine.velocity_primary
+    Temperature_primary     =       source_conditions.engine.temperature_primary
+    Pressure_primary        =       source_conditions.engine.pressure_primary
     
-    Velocity_secondary_1    =       np.float(turbofan.fan_nozzle.noise_speed * (turbofan.design_thrust/52700.)) 
-    Temperature_secondary   =       noise_segment.conditions.propulsion.acoustic_outputs.fan.exit_stagnation_temperature
-    Pressure_secondary      =       noise_segment.conditions.propulsion.acoustic_outputs.fan.exit_stagnation_pressure 
+    Velocity_secondary      =       source_conditions.engine.velocity_secondary
+    Temperature_secondary   =       source_conditions.engine.temperature_secondary
+    Pressure_secondary      =       source_conditions.engine.pressure_secondary
     
     N1                      =       np.float(turbofan.fan.rotation * 0.92*(turbofan.design_thrust/52700.))
     Diameter_primary        =       turbofan.core_nozzle_diameter
@@ -99,45 +106,31 @@ def noise_SAE (turbofan,noise_segment,config,analyses,ioprint = 0, filename = 0)
     Ye                      =       turbofan.geometry_ye
     Ce                      =       turbofan.geometry_Ce
     
-    Velocity_aircraft       =       np.float(noise_segment.conditions.freestream.velocity[0,0]) 
-    Altitude                =       noise_segment.conditions.freestream.altitude[:,0] 
+    Velocity_aircraft       =       source_conditions.velocity
+    Altitude                =       source_conditions.altitude
     AOA                     =       np.mean(noise_segment.conditions.aerodynamics.angle_of_attack / Units.deg)
     
-    time                    =       noise_segment.conditions.frames.inertial.time  
-    
-    # Calls the function noise_geometric to calculate all the distance and emission angles
-    geometric = noise_geometric(noise_segment,analyses,config)
+    time                    =       source_conditions.time
     
     #unpack
-    angles              = geometric[:][1]
-    distance_microphone = geometric[:][0]    
-    phi                 = geometric[:][2]    
+    angles              = source_conditions.geometric.theta
+    distance_microphone = source_conditions.geometric.distance
+    phi                 = source_conditions.geometric.phi
     
     nsteps = len(time)        
     
     #Preparing matrix for noise calculation
-    sound_ambient       = np.zeros(nsteps)
-    density_ambient     = np.zeros(nsteps)
-    viscosity           = np.zeros(nsteps)
-    temperature_ambient = np.zeros(nsteps)
-    pressure_amb        = np.zeros(nsteps)
     Mach_aircraft       = np.zeros(nsteps)
-    
-    Velocity_primary = np.ones(nsteps)*Velocity_primary_1
-    Velocity_secondary = np.ones(nsteps)*Velocity_secondary_1
 
     # ==============================================
-    # Computing atmospheric conditions
+    # Atmospheric conditions
     # ==============================================
     
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(Altitude[id])        
-    
-        sound_ambient[id]       =   np.float(atmo_data.speed_of_sound)
-        density_ambient[id]     =   np.float(atmo_data.density)
-        viscosity[id]           =   np.float(atmo_data.dynamic_viscosity)
-        temperature_ambient[id] =   np.float(atmo_data.temperature)
-        pressure_amb[id]        =   np.float(atmo_data.pressure)
+    sound_ambient       =   source_conditions.freestream.speed_of_sound
+    density_ambient     =   source_conditions.freestream.density
+    viscosity           =   source_conditions.freestream.dynamic_viscosity
+    temperature_ambient =   source_conditions.freestream.temperature
+    pressure_amb        =   source_conditions.freestream.pressure
     
     #Base parameters necessary input for the noise code
     pressure_isa = 101325 #[Pa]
@@ -6,3 +6,4 @@ from noise_tone_correction import noise_tone_correction
 from dbA_noise import dbA_noise
 from noise_geometric import noise_geometric
 from noise_certification_limits import noise_certification_limits
+from noise_source_conditions import noise_source_conditions
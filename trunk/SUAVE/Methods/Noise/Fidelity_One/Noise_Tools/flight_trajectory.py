@@ -9,7 +9,7 @@
 
 import SUAVE
 import numpy as np
-from SUAVE.Core import Units
+from SUAVE.Core import Data, Units
 
 from SUAVE.Methods.Propulsion.turbofan_sizing import turbofan_sizing
 
@@ -82,12 +82,11 @@ def flight_trajectory(configs,turbofan,analyses):
         altitute         = np.ones(n_steps)*altitute_flyover
         
     #Calculate flight path
-        for i in range(1,n_steps):           
-            s[i]         = s[i-1]+velocity*dt
-            dist[i]      = np.sqrt(altitute[i]**2+(s[i]-x0)**2)
-            theta[i]     = np.arctan(np.abs(altitute[i]/(s[i]-x0)))
-            phi[i]       = 0
-            time[i]      = time[i-1]+dt
+        s[:]         = march(s[0],velocity*dt,n_steps)
+        dist[1:]     = np.sqrt(altitute[1:]**2+(s[1:]-x0)**2)
+        theta[1:]    = np.arctan(np.abs(altitute[1:]/(s[1:]-x0)))
+        phi[1:]      = 0
+        time[:]      = march(time[0],dt,n_steps)
             
             
          #Determine the engine performance parameter for the velocity and altitute    
@@ -124,14 +123,13 @@ def flight_trajectory(configs,turbofan,analyses):
         phi[0]      = 0
         
       #Calculate flight path
-        for i in range(1,n_steps):
-            s[i] = s[i-1]+velocity_x*dt
-            altitute[i] = altitute[i-1]-velocity_y*dt
-            dist[i]     = np.sqrt(altitute[i]**2+(s[i]-x0)**2)
-            theta[i]    = np.arctan(np.abs(altitute[i]/(s[i]-x0)))
-            phi[i]      = 0
+        s[:]        = march(s[0],velocity_x*dt,n_steps)
+        altitute[:] = march(altitute[0],-velocity_y*dt,n_steps)
+        dist[1:]    = np.sqrt(altitute[1:]**2+(s[1:]-x0)**2)
+        theta[1:]   = np.arctan(np.abs(altitute[1:]/(s[1:]-x0)))
+        phi[1:]     = 0
                            
-            time[i] = time[i-1]+dt
+        time[:] = march(time[0],dt,n_steps)
             
         #Determine the engine performance parameter for the velocity and altitute    
         engine_data = engine_performnace(altitute,velocity,turbofan,analyses)
@@ -167,13 +165,12 @@ def flight_trajectory(configs,turbofan,analyses):
         phi[0]   = 0
         
         #Calculate flight path
-        for i in range(1,n_steps):
-            s[i]        = s[i-1]+velocity_x*dt
-            altitute[i] = altitute[i-1]+velocity_y*dt
-            dist[i]     = np.sqrt(altitute[i]**2+(s[i]-x0)**2)
-            theta[i]    = np.arctan(np.abs(altitute[i]/(s[i]-x0)))
-            phi[i]      = 0
-            time[i]     = time[i-1]+dt
+        s[:]        = march(s[0],velocity_x*dt,n_steps)
+        altitute[:] = march(altitute[0],velocity_y*dt,n_steps)
+        dist[1:]    = np.sqrt(altitute[1:]**2+(s[1:]-x0)**2)
+        theta[1:]   = np.arctan(np.abs(altitute[1:]/(s[1:]-x0)))
+        phi[1:]     = 0
+        time[:]     = march(time[0],dt,n_steps)
             
         #Determine the engine performance parameter for the velocity and altitute    
         engine_data = engine_performnace(altitute,velocity,turbofan,analyses)
@@ -214,20 +211,33 @@ def flight_trajectory(configs,turbofan,analyses):
         
         
         #Calculate flight path
-        for i in xrange(1,n_steps):
-            s[i]        = s[i-1]+velocity_x*dt
-            altitute[i] = altitute[i-1]+velocity_y*dt
-            phi[i]      = np.arctan(z0/altitute[i])
-            dist[i]     = np.sqrt((450/np.sin(phi[i]))**2+(s[i]-x0)**2)
-            theta[i]    = np.arccos(np.abs((x0-s[i])/dist[i]))
+        s[:]        = march(s[0],velocity_x*dt,n_steps)
+        altitute[:] = march(altitute[0],velocity_y*dt,n_steps)
+        phi[1:]     = np.arctan(z0/altitute[1:])
+        dist[1:]    = np.sqrt((450/np.sin(phi[1:]))**2+(s[1:]-x0)**2)
+        theta[1:]   = np.arccos(np.abs((x0-s[1:])/dist[1:]))
             
-            time[i] = time[i-1]+dt
+        time[:] = march(time[0],dt,n_steps)
 
         #Determine the engine performance parameter for the velocity and altitute
         engine_data = engine_performnace(altitute,velocity,turbofan,analyses)
     
     return(time,altitute,dist,theta,phi,engine_data)
 
+# ----------------------------------------------------------------------        
+#   Helper Functions
+# ---------------------------------------------------------------------- 
+
+def march(x0,dx,n_steps):
+    """ x = march(x0,dx,n_steps)
+        the n_steps values of x[i] = x[i-1] + dx, starting from x0
+    """
+    
+    steps    = np.ones(n_steps) * dx
+    steps[0] = x0
+    
+    return np.cumsum(steps)
+
 # ----------------------------------------------------------------------        
 #   Engine Performance
 # ---------------------------------------------------------------------- 
@@ -251,44 +261,46 @@ def engine_performnace(altitude,velocity,turbofan,analyses):
                 pressure_secondary      -        Core nozzle jet stagnation pressure [Pa]
 
             Assumptions:
-                               ."""
+                The atmosphere and the turbofan are evaluated once for all the points of the trajectory."""
     
     
     #Calculation of the Aircraft Mach number
     mach_number = velocity/340.3
     
     #Number of discrete points on the flight trajectory
-    n_steps = np.size(altitude)
+    n_steps  = np.size(altitude)
+    altitude = np.reshape(altitude,[n_steps,1])
+    ones_row = np.ones([n_steps,1])
     
-    #Defining the necessary arrays for the engine performance procedure
-    velocity_primary      = np.zeros(n_steps)
-    temperature_primary   = np.zeros(n_steps)
-    pressure_primary      = np.zeros(n_steps)
-    velocity_secondary    = np.zeros(n_steps)
-    temperature_secondary = np.zeros(n_steps)
-    pressure_secondary    = np.zeros(n_steps)
-
-    #size the turbofan
-
-    for i in range (0,n_steps):
-        
-        atmo_data = analyses.atmosphere.compute_values(altitude[i])
-         
-         #call the atmospheric model to get the conditions at the specified altitude
-        atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
-        conditions = atmosphere.compute_values(altitude[i])
-        
-        #setup conditions
-        conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
-        
-        turbofan(conditions)
-      
-        velocity_primary[i]        = np.float(turbofan.core_nozzle.outputs.velocity)
-        temperature_primary[i]     = np.float(turbofan.core_nozzle.outputs.stagnation_temperature)
-        pressure_primary[i]        = np.float(turbofan.core_nozzle.outputs.stagnation_pressure)
+    #call the atmospheric model once for all the points of the trajectory
+    atmo_data = analyses.atmosphere.compute_values(altitude)
+    
+    #setup conditions, the throttle is left at its default
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(n_steps)
+    
+    conditions.freestream.altitude          = altitude
+    conditions.freestream.pressure          = atmo_data.pressure
+    conditions.freestream.temperature       = atmo_data.temperature
+    conditions.freestream.density           = atmo_data.density
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound    = atmo_data.speed_of_sound
+    conditions.freestream.velocity          = ones_row * velocity
+    conditions.freestream.mach_number       = ones_row * mach_number
+    
+    state = Data()
+    state.numerics   = Data()
+    state.conditions = conditions
+    
+    #evaluate the turbofan for all the points of the trajectory
+    turbofan.evaluate_thrust(state)
+    
+    velocity_primary        = turbofan.core_nozzle.outputs.velocity[:,0]
+    temperature_primary     = turbofan.core_nozzle.outputs.stagnation_temperature[:,0]
+    pressure_primary        = turbofan.core_nozzle.outputs.stagnation_pressure[:,0]
     
-        velocity_secondary[i]      = np.float(turbofan.fan_nozzle.outputs.velocity)
-        temperature_secondary[i]   = np.float(turbofan.fan_nozzle.outputs.stagnation_temperature)
-        pressure_secondary[i]      = np.float(turbofan.fan_nozzle.outputs.stagnation_pressure) 
+    velocity_secondary      = turbofan.fan_nozzle.outputs.velocity[:,0]
+    temperature_secondary   = turbofan.fan_nozzle.outputs.stagnation_temperature[:,0]
+    pressure_secondary      = turbofan.fan_nozzle.outputs.stagnation_pressure[:,0]
         
     return (velocity_primary,temperature_primary,pressure_primary,velocity_secondary,temperature_secondary,pressure_secondary)
\ No newline at end of file
@@ -0,0 +1,84 @@
+# noise_source_conditions.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from SUAVE.Core import Data
+
+from noise_geometric import noise_geometric
+
+# ----------------------------------------------------------------------
+#   Noise Source Conditions
+# ----------------------------------------------------------------------
+
+def noise_source_conditions(noise_segment,analyses,config,turbofan=None):
+    """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.noise_source_conditions(noise_segment,analyses,config,turbofan=None):
+            Prepares the source side inputs of the noise tools for every point of the noise segment in one pass.
+
+            Inputs:
+                noise_segment    - converged segment results
+                analyses
+                config
+                turbofan         - optional, adds the jet conditions for the engine noise
+
+            Outputs:
+                time             - time history of the segment, [s]
+                altitude         - altitude of each point, [m]
+                velocity         - aircraft velocity, [m/s]
+                freestream       - speed_of_sound, density, dynamic_viscosity, temperature and pressure of each point
+                geometric        - distance, theta and phi of each point, see noise_geometric
+                engine           - velocity, temperature and pressure of the primary and secondary jets of each point
+
+            Assumptions:
+                Time, altitude, position and jet exit conditions are taken from the converged segment.
+                The atmosphere is evaluated at the segment altitudes on a standard day, not taken from the
+                segment freestream, where the propulsion overwrites the speed of sound.
+                The jet velocities are the noise speeds of the nozzles scaled by the design thrust."""
+
+    conditions = noise_segment.conditions
+    freestream = conditions.freestream
+
+    results = Data()
+    results.time     = conditions.frames.inertial.time
+    results.altitude = freestream.altitude[:,0]
+    results.velocity = np.float(freestream.velocity[0,0])
+
+    # atmospheric conditions, one call for all the points
+    atmo_data = analyses.atmosphere.compute_values(results.altitude)
+
+    results.freestream = Data()
+    results.freestream.speed_of_sound    = atmo_data.speed_of_sound[:,0]
+    results.freestream.density           = atmo_data.density[:,0]
+    results.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity[:,0]
+    results.freestream.temperature       = atmo_data.temperature[:,0]
+    results.freestream.pressure          = atmo_data.pressure[:,0]
+
+    # distance and emission angles
+    geometric = noise_geometric(noise_segment,analyses,config)
+
+    results.geometric = Data()
+    results.geometric.distance = geometric[0]
+    results.geometric.theta    = geometric[1]
+    results.geometric.phi      = geometric[2]
+
+    # jet conditions
+    if turbofan is not None:
+
+        n_steps   = len(results.time)
+        core      = conditions.propulsion.acoustic_outputs.core
+        fan       = conditions.propulsion.acoustic_outputs.fan
+
+        results.engine = Data()
+        results.engine.velocity_primary      = np.ones(n_steps) * np.float(turbofan.core_nozzle.noise_speed * 0.92*(turbofan.design_thrust/52700.))
+        results.engine.temperature_primary   = core.exit_stagnation_temperature
+        results.engine.pressure_primary      = core.exit_stagnation_pressure
+        results.engine.velocity_secondary    = np.ones(n_steps) * np.float(turbofan.fan_nozzle.noise_speed * (turbofan.design_thrust/52700.))
+        results.engine.temperature_secondary = fan.exit_stagnation_temperature
+        results.engine.pressure_secondary    = fan.exit_stagnation_pressure
+
+    return results
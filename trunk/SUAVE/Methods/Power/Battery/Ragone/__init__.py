@@ -1,3 +1,4 @@
 from find_ragone_properties import find_ragone_properties
 from find_specific_power    import find_specific_power
-from find_ragone_optimum    import find_ragone_optimum
\ No newline at end of file
+from find_ragone_optimum    import find_ragone_optimum
+from find_ragone_optima    import find_ragone_optima
\ No newline at end of file
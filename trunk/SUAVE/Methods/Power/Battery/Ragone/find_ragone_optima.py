@@ -0,0 +1,64 @@
+# find_ragone_optima.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from scipy.special import lambertw
+
+# ----------------------------------------------------------------------
+#  Methods
+# ----------------------------------------------------------------------
+
+def find_ragone_optima(battery, energy, power):
+    """
+    Finds the optimum-mass battery for each pair of energy and power requirements at once,
+    from the ragone curve of the battery. The battery is not changed.
+
+    Inputs:
+            battery
+            energy= energies the battery is required to hold [J], an array of any shape
+            power= powers the battery is required to provide [W], broadcast with energy
+
+       Reads:
+            battery.ragone.const_1
+            battery.ragone.const_2
+            battery.ragone.upper_bound
+            battery.ragone.lower_bound
+
+       Outputs:
+            specific_energy [J/kg]
+            specific_power  [W/kg]
+            mass            [kg]
+
+       Assumptions:
+            The specific power falls with specific energy, const_2 < 0.
+            The mass needed for energy then falls, and that needed for power rises,
+            with specific energy, so the optimum is where the two are equal,
+            E*const_1*10**(const_2*e) = P*e, or the nearest bound.
+    """
+
+    const_1 = battery.ragone.const_1
+    const_2 = battery.ragone.const_2
+    lb      = battery.ragone.lower_bound
+    ub      = battery.ragone.upper_bound
+
+    energy, power = np.broadcast_arrays(np.asarray(energy,dtype=float),np.asarray(power,dtype=float))
+
+    # E*c1*exp(k*e) = P*e  ->  -k*e*exp(-k*e) = -k*E*c1/P
+    k = const_2*np.log(10.)
+    with np.errstate(divide='ignore'):
+        x = -k*energy*const_1/power
+
+    # without power any specific energy is equal, take the largest
+    e_equal = np.where(np.isinf(x), ub, -np.real(lambertw(np.where(np.isinf(x),0.,x)))/k)
+
+    specific_energy = np.clip(e_equal,lb,ub)
+    specific_power  = const_1*10.**(const_2*specific_energy)
+    mass            = np.maximum(energy/specific_energy, power/specific_power)
+
+    return specific_energy, specific_power, mass
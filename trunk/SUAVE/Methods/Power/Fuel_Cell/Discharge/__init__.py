@@ -4,4 +4,5 @@ from larminie import larminie
 from setup_larminie import setup_larminie
 from find_voltage_larminie import find_voltage_larminie
 from find_power_larminie import find_power_larminie
-from find_power_diff_larminie import find_power_diff_larminie
\ No newline at end of file
+from find_power_diff_larminie import find_power_diff_larminie
+from find_current_density_larminie import find_current_density_larminie
\ No newline at end of file
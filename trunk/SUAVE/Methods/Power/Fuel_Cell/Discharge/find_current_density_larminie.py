@@ -0,0 +1,88 @@
+# find_current_density_larminie.py
+#
+# Created : Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from SUAVE.Core import Units
+from find_power_larminie import find_power_larminie
+
+# ----------------------------------------------------------------------
+#  Find Current Density Larminie
+# ----------------------------------------------------------------------
+
+def find_current_density_larminie(fuel_cell, power, lb, ub, tolerance=1e-5):
+    """ current_density = find_current_density_larminie(fuel_cell, power, lb, ub, tolerance=1e-5)
+        the current densities at which a cell gives each power, found for all
+        the powers at once by bisection
+
+        Inputs:
+            fuel_cell - setup with setup_larminie
+            power     - power of a cell [W], an array of any shape
+            lb, ub    - bounds of the current density [A/m^2]
+            tolerance - of the current density [A/m^2]
+
+        Outputs:
+            current_density - [A/m^2], the shape of power
+
+        Assumptions:
+            The power of a cell rises to a maximum then falls with current
+            density. The lower, more efficient, current density is given.
+            Powers above the maximum give the current density of the maximum,
+            powers below that at lb give lb.
+    """
+
+    power = np.asarray(power,dtype=float)
+
+    # the maximum power, where its slope falls to zero
+    i_max = bisect(lambda i: -find_power_slope_larminie(fuel_cell,i), lb, ub, 0., tolerance)
+
+    # the rising side of the power curve
+    current_density = bisect(lambda i: find_power_larminie(i,fuel_cell), lb, i_max, power, tolerance)
+
+    return current_density
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def find_power_slope_larminie(fuel_cell, current_density):
+    """ a value proportional to the slope of the power of a cell with
+        current density, zero at the maximum power
+    """
+
+    r   = fuel_cell.r/(Units.kohm*(Units.cm**2))
+    A1  = fuel_cell.A1
+    m   = fuel_cell.m
+    n   = fuel_cell.n
+
+    i1 = current_density/(Units.mA/(Units.cm**2.)) #current density(mA cm^-2)
+    v  = fuel_cell.Eoc-r*i1-A1*np.log(i1)-m*np.exp(n*i1)
+
+    # d(v*i1)/di1
+    return v - i1*(r + m*n*np.exp(n*i1)) - A1
+
+
+def bisect(function, lower, upper, target, tolerance):
+    """ x = bisect(function, lower, upper, target, tolerance)
+        where the increasing function reaches target, within the bounds,
+        for each target at once
+    """
+
+    lower  = np.ones_like(target)*lower
+    upper  = np.ones_like(target)*upper
+    target = np.ones_like(lower)*target
+
+    iterations = int(np.ceil(np.log2(max(np.max(upper-lower),tolerance)/tolerance)))
+    for k in xrange(iterations):
+        middle = 0.5*(lower+upper)
+        below  = function(middle) < target
+        lower  = np.where(below,middle,lower)
+        upper  = np.where(below,upper,middle)
+
+    return 0.5*(lower+upper)
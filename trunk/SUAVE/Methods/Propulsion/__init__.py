@@ -1,7 +1,9 @@
 from ducted_fan_sizing import ducted_fan_sizing
 from propeller_design import propeller_design
+from propeller_map import propeller_map
 from turbofan_nox_emission_index import turbofan_nox_emission_index
 from turbofan_sizing import turbofan_sizing
+from turbofan_deck import turbofan_deck
 from turbojet_sizing import turbojet_sizing
 from fm_id import fm_id
 import electric_motor_sizing
\ No newline at end of file
@@ -0,0 +1,210 @@
+# propeller_map.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+from SUAVE.Core import Data
+from warnings import warn
+
+# ----------------------------------------------------------------------
+#  Propeller Map
+# ----------------------------------------------------------------------
+
+def propeller_map(propeller,advance_ratio,tip_mach,reynolds_number,cache=None,model=None):
+    """ Sweeps a propeller over a grid of operating points, so it can be
+        evaluated by interpolation instead of the blade element solution
+
+          Inputs:
+              propeller       - with its prop_attributes
+              advance_ratio   - grid of V/(n*D)
+              tip_mach        - grid of omega*R/a
+              reynolds_number - grid of rho*omega*R*c/mu, c is the chord at 75% radius
+              cache           - optional SUAVE.Analyses.Surrogates.Training_Cache,
+                                reuses the sweep of the same geometry and grid
+              model           - optional SUAVE.Analyses.Surrogates.Model,
+                                a Tensor_Spline if not given
+
+          Outputs:
+              performance_map, assign it to propeller.performance_map
+                  advance_ratio, tip_mach, reynolds_number - the grid
+                  thrust_coefficient, power_coefficient, efficiency -
+                      [n_advance_ratio x n_tip_mach x n_reynolds_number]
+                  reference_chord
+                  surrogate - model of the thrust and power coefficients
+                      of the advance ratio, tip Mach and log10 of the Reynolds number
+
+          Assumptions:
+              The blade element solution of Propeller.spin, solved to
+              convergence at each point, points that do not converge are
+              interpolated from their neighbours in advance ratio, then in
+              tip Mach and Reynolds number where no advance ratio converged
+              The temperature is taken at sea level, it only enters the
+              blade drag through the tip Mach number and a Sutherland ratio
+
+    """
+
+    # Unpack
+    advance_ratio   = np.array(advance_ratio,dtype=float)
+    tip_mach        = np.array(tip_mach,dtype=float)
+    reynolds_number = np.array(reynolds_number,dtype=float)
+    prop_attributes = propeller.prop_attributes
+
+    # Reuse a sweep of the same propeller
+    key = None
+    if cache is not None:
+        key   = cache.key(prop_attributes,advance_ratio,tip_mach,reynolds_number)
+        sweep = cache.load(key)
+    else:
+        sweep = None
+
+    if sweep is None:
+        sweep = propeller_sweep(prop_attributes,advance_ratio,tip_mach,reynolds_number)
+        if cache is not None:
+            cache.save(key,sweep)
+
+    CT = sweep.thrust_coefficient
+    CP = sweep.power_coefficient
+
+    # Fit the coefficients on the grid
+    if model is None:
+        # imported here, SUAVE loads the analyses after the methods
+        from SUAVE.Analyses.Surrogates import Tensor_Spline
+        model = Tensor_Spline()
+
+    J, Mt, Re = np.meshgrid(advance_ratio,tip_mach,reynolds_number,indexing='ij')
+    X = np.array([ J.flatten() , Mt.flatten() , np.log10(Re.flatten()) ]).T
+    Y = np.array([ CT.flatten() , CP.flatten() ]).T
+    model.fit(X,Y)
+
+    # Pack
+    performance_map = Data()
+    performance_map.advance_ratio      = advance_ratio
+    performance_map.tip_mach           = tip_mach
+    performance_map.reynolds_number    = reynolds_number
+    performance_map.thrust_coefficient = CT
+    performance_map.power_coefficient  = CP
+    performance_map.efficiency         = sweep.efficiency
+    performance_map.reference_chord    = sweep.reference_chord
+    performance_map.surrogate          = model
+
+    return performance_map
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def propeller_sweep(prop_attributes,advance_ratio,tip_mach,reynolds_number):
+    """ sweep = propeller_sweep(prop_attributes,advance_ratio,tip_mach,reynolds_number)
+        the thrust and power coefficients and efficiency on the grid
+    """
+
+    # Sea level air
+    gamma = 1.4
+    R_gas = 287.0531
+    T     = 288.15
+    rho   = 1.225
+    a     = np.sqrt(gamma*R_gas*T)
+
+    # Reference chord at 75% radius
+    R     = prop_attributes.tip_radius
+    Rh    = prop_attributes.hub_radius
+    c     = prop_attributes.chord_distribution
+    N     = len(c)
+    chi   = np.linspace(Rh/R,1,N+1)[0:N]
+    c_ref = np.interp(0.75,chi,c)
+    D     = 2.*R
+
+    # imported here, SUAVE loads the components after the methods
+    from SUAVE.Components.Energy.Converters.Propeller import solve_inflow, \
+         blade_element_residual, blade_element_loads
+
+    B    = prop_attributes.number_blades
+    beta = prop_attributes.twist_distribution
+    r    = chi*R
+
+    # Every point of the grid at once
+    J, Mt, Re = np.meshgrid(advance_ratio,tip_mach,reynolds_number,indexing='ij')
+    shape = J.shape
+
+    omega = Mt.flatten()[:,None]*a/R
+    n     = omega/(2.*np.pi)
+    V     = J.flatten()[:,None]*n*D
+    nu    = omega*R*c_ref/Re.flatten()[:,None]
+    a     = a*np.ones_like(omega)
+    T     = T*np.ones_like(omega)
+    rho   = rho*np.ones_like(omega)
+
+    # Start from no induced velocity
+    psi = np.arctan2(V*np.ones_like(r),np.outer(omega,r))
+    psi, converged, iterations = solve_inflow(psi,omega,V,0.,0.,B,R,r,beta,c,nu,a)
+
+    stations = blade_element_residual(psi,omega,V,0.,0.,B,R,r,beta,c,nu,a,False)
+    thrust, torque, power, Cp = blade_element_loads(stations,omega,rho,T,B,R,r)
+
+    CT = thrust/(rho*(n*n)*(D*D*D*D))
+    CP = Cp*1.0
+    CT[~converged] = np.nan
+    CP[~converged] = np.nan
+    CT = np.reshape(CT,shape)
+    CP = np.reshape(CP,shape)
+
+    # Points that did not converge are filled from their neighbours
+    axes = [ advance_ratio , tip_mach , np.log10(reynolds_number) ]
+    CT   = fill_failed(CT,axes)
+    CP   = fill_failed(CP,axes)
+
+    efficiency = advance_ratio[:,None,None]*CT/CP
+
+    # Pack
+    sweep = Data()
+    sweep.thrust_coefficient = CT
+    sweep.power_coefficient  = CP
+    sweep.efficiency         = efficiency
+    sweep.reference_chord    = c_ref
+
+    return sweep
+
+
+def fill_failed(values,axes):
+    """ values = fill_failed(values,axes)
+        fills the points of a grid that are not finite, interpolating along
+        the first axis, then along the next ones for the lines that have no
+        finite point along the axes before, the ends are held
+    """
+
+    if not np.any(np.isfinite(values)):
+        raise ValueError , 'Propeller map did not converge at any point of the grid.'
+
+    values = values*1.0
+
+    for i,points in enumerate(axes):
+
+        # one line along the axis per row
+        lines  = np.rollaxis(values,i,values.ndim)
+        rows   = np.reshape(lines,[-1,len(points)])
+        failed = ~np.isfinite(rows)
+
+        fill = np.any(failed,axis=1) & ~np.all(failed,axis=1)
+        if not np.any(fill):
+            continue
+
+        if i == 0:
+            warn('Propeller map points did not converge, they are interpolated.', Warning)
+        else:
+            warn('Propeller map points did not converge at any advance ratio, they are filled from their neighbours.', Warning)
+
+        for j in np.where(fill)[0]:
+            row = rows[j]
+            bad = failed[j]
+            row[bad] = np.interp(points[bad],points[~bad],row[~bad])
+
+        values = np.rollaxis(np.reshape(rows,lines.shape),values.ndim-1,i)
+
+    return values
@@ -0,0 +1,132 @@
+# turbofan_deck.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Deck Outputs
+# ----------------------------------------------------------------------
+
+# component, output, if it scales with the freestream pressure
+nozzle_outputs = [
+    ('stagnation_temperature', False),
+    ('stagnation_pressure'   , True ),
+    ('stagnation_enthalpy'   , False),
+    ('mach_number'           , False),
+    ('static_temperature'    , False),
+    ('density'               , True ),
+    ('static_enthalpy'       , False),
+    ('velocity'              , False),
+    ('static_pressure'       , True ),
+    ('area_ratio'            , False),
+]
+
+deck_outputs = [ ('core_nozzle',key,scaled) for key,scaled in nozzle_outputs ] + \
+               [ ('fan_nozzle' ,key,scaled) for key,scaled in nozzle_outputs ] + \
+               [ ('combustor'              ,'fuel_to_air_ratio'     ,False),
+                 ('low_pressure_compressor','stagnation_temperature',False),
+                 ('low_pressure_compressor','stagnation_pressure'   ,True ) ]
+
+# ----------------------------------------------------------------------
+#  Turbofan Deck
+# ----------------------------------------------------------------------
+
+def turbofan_deck(turbofan,mach_number,temperature,model=None):
+    """ Runs the cycle of a sized turbofan over a grid of flight conditions,
+        so the network can be evaluated by interpolation
+
+          Inputs:
+              turbofan    - a sized Turbofan network
+              mach_number - grid of freestream Mach numbers
+              temperature - grid of freestream static temperatures [K]
+              model       - optional SUAVE.Analyses.Surrogates.Model,
+                            a Tensor_Spline if not given
+
+          Outputs:
+              engine_deck, assign it to turbofan.engine_deck
+                  mach_number, temperature - the grid
+                  reference_pressure       - freestream pressure of the cycle runs
+                  outputs  - (component, output, scaled) of each deck output
+                  values   - each output on the grid, [n_mach x n_temperature],
+                             keyed 'component.output'
+                  surrogate - model of the outputs of the Mach number and temperature
+
+          Assumptions:
+              With fixed component pressure ratios and turbine inlet
+              temperature, the cycle depends on the Mach number and the
+              static temperature only, all its pressures and densities
+              scale with the freestream pressure, which they are stored
+              relative to.
+              The throttle only scales the thrust and fuel flow, which the
+              thrust component computes from the deck outputs, so it is
+              not a dimension of the deck.
+
+    """
+
+    # Unpack
+    mach_number = np.array(mach_number,dtype=float)
+    temperature = np.array(temperature,dtype=float)
+    p_ref       = 101325.
+
+    M, T  = np.meshgrid(mach_number,temperature,indexing='ij')
+    shape = M.shape
+    M     = M.flatten()[:,None]
+    T     = T.flatten()[:,None]
+    n     = M.shape[0]
+
+    # the flight conditions of the grid
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(n)
+
+    a = np.sqrt(1.4*287.0531*T)
+
+    conditions.freestream.mach_number    = M
+    conditions.freestream.temperature    = T
+    conditions.freestream.pressure       = p_ref*np.ones_like(M)
+    conditions.freestream.speed_of_sound = a
+    conditions.freestream.velocity       = M*a
+    conditions.freestream.density        = p_ref/(287.0531*T)
+    conditions.freestream.gravity        = 9.81*np.ones_like(M)
+    conditions.propulsion.throttle       = np.ones_like(M)
+
+    # run the cycle for all points at once
+    with np.errstate(divide='ignore',invalid='ignore'):
+        turbofan.evaluate_cycle(conditions)
+
+    values  = Data()
+    columns = []
+    for name,key,scaled in deck_outputs:
+        value = turbofan[name].outputs[key] * np.ones_like(M)
+        if scaled:
+            value = value/p_ref
+        values[name+'.'+key] = np.reshape(value,shape)
+        columns.append(value[:,0])
+
+    # fit the outputs on the grid
+    if model is None:
+        # imported here, SUAVE loads the analyses after the methods
+        from SUAVE.Analyses.Surrogates import Tensor_Spline
+        model = Tensor_Spline()
+
+    X = np.hstack([M,T])
+    Y = np.array(columns).T
+    model.fit(X,Y)
+
+    # Pack
+    engine_deck = Data()
+    engine_deck.mach_number        = mach_number
+    engine_deck.temperature        = temperature
+    engine_deck.reference_pressure = p_ref
+    engine_deck.outputs            = deck_outputs
+    engine_deck.values             = values
+    engine_deck.surrogate          = model
+
+    return engine_deck
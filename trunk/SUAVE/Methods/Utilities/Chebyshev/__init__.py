@@ -1,3 +1,4 @@
 
 from chebyshev_data import chebyshev_data
-from linear_data import linear_data
\ No newline at end of file
+from linear_data import linear_data
+from discretization_operators import discretization_operators, clear_operator_cache
\ No newline at end of file
@@ -0,0 +1,89 @@
+# discretization_operators.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from collections import OrderedDict
+
+# ----------------------------------------------------------------------
+#  Cache
+# ----------------------------------------------------------------------
+
+# number of operator sets kept, the least recently used is dropped first
+cache_size = 32
+
+_cache = OrderedDict()
+
+_plain_types = (bool,int,long,float,str,unicode,type(None))
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+def discretization_operators(discretization_method, N, **options):
+    """ x, D, I = discretization_operators(discretization_method,N,**options)
+        the result of discretization_method(N,**options), for example
+        chebyshev_data, computed once per process and then reused
+
+        Inputs:
+            discretization_method - function returning x, D, I
+            N                     - number of control points
+            options               - passed to discretization_method
+
+        Outputs:
+            x, D, I - read-only arrays shared by all callers,
+                      copy them before changing them in place
+
+        Assumptions:
+            the operators only depend on the method, N and the options
+            that are plain values (numbers, strings, booleans or None),
+            other options, like the operator arrays of the numerics
+            themselves, are not part of the key
+    """
+
+    key = operator_key(discretization_method,N,options)
+
+    # reuse, most recently used goes last
+    if _cache.has_key(key):
+        operators = _cache.pop(key)
+        _cache[key] = operators
+        return operators
+
+    x,D,I = discretization_method(N,**options)
+
+    for array in (x,D,I):
+        if array is not None:
+            array.flags.writeable = False
+
+    operators = (x,D,I)
+    _cache[key] = operators
+
+    while len(_cache) > cache_size:
+        _cache.popitem(last=False)
+
+    return operators
+
+
+def clear_operator_cache():
+    """ clear_operator_cache()
+        drops all cached operators
+    """
+    _cache.clear()
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def operator_key(discretization_method,N,options):
+    """ key = operator_key(discretization_method,N,options)
+        hashable key of the method, N and the plain valued options
+    """
+
+    plain = tuple( sorted( (k,v) for k,v in options.iteritems() if isinstance(v,_plain_types) ) )
+
+    return (discretization_method, int(N), plain)
@@ -1,15 +1,10 @@
 
-import Utilities
-import Noise
-import Weights
-import Aerodynamics
-import Performance
-import Missions
-import Power
-import Propulsion
-import Flight_Dynamics
-import Geometry
-import Center_of_Gravity
+from SUAVE.Core.Lazy_Module import lazy_import
+
+# packages, loaded when first used
+lazy_import(globals(),['Utilities','Noise','Weights','Aerodynamics','Performance',
+                       'Missions','Power','Propulsion','Flight_Dynamics','Geometry',
+                       'Center_of_Gravity'])
 
 from skip import skip
 
@@ -11,7 +11,9 @@
 import SUAVE 
 from SUAVE.Core import Data
 from copy import deepcopy
+from collections import OrderedDict
 import helper_functions as help_fun
+from finite_differences import finite_differences
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -30,15 +32,126 @@ class Nexus(Data):
         self.optimization_problem   = None
         self.last_inputs            = None
         self.evaluation_count       = 0
+        self.last_gradients         = None
+        
+        # finite difference settings, see finite_differences
+        self.gradients                     = Data()
+        self.gradients.method              = 'forward'
+        self.gradients.step_size           = 1e-8
+        self.gradients.number_of_processes = 1
+        self.gradients.broyden_updates     = 0
+        
+        # results of earlier inputs, least recently used first
+        self.cache           = Data()
+        self.cache.size      = 10
+        self.cache.tolerance = 0.
+        self.cache.store     = True # off while finite differencing
+        self.cache.hits      = 0
+        self.cache.misses    = 0
+        self.cache.entries   = OrderedDict()
     
     def evaluate(self,x = None):
+        """ evaluate the procedure at the scaled inputs x, unless the
+            results of x are the last or cached ones
+            
+            A cached point restores the results and summary, earlier
+            points are only looked up if the objective and constraints
+            are read from these.
+        """
         
         self.unpack_inputs(x)
         # This function calls really_evaluate
         if np.all(self.optimization_problem.inputs==self.last_inputs):
-            pass
+            self.cache.hits += 1
+            return
+        
+        key   = self.design_vector()
+        entry = None
+        if self.cached_outputs():
+            entry = self.find_cached(key)
+        
+        if entry is not None:
+            self.cache.hits += 1
+            self.results     = deepcopy(entry.results)
+            self.summary     = deepcopy(entry.summary)
+            self.last_inputs = deepcopy(self.optimization_problem.inputs)
         else:
+            self.cache.misses += 1
             self._really_evaluate()
+            self.store_cached(key)
+        
+    
+    def design_vector(self):
+        
+        inputs = self.optimization_problem.inputs
+        
+        return tuple(inputs[:,1]/inputs[:,3])
+    
+    def find_cached(self,key):
+        
+        entries   = self.cache.entries
+        tolerance = self.cache.tolerance
+        
+        if key in entries:
+            match = key
+        elif tolerance > 0.:
+            match = None
+            for cached_key in entries.iterkeys():
+                if np.max(np.abs(np.subtract(cached_key,key))) <= tolerance:
+                    match = cached_key
+                    break
+        else:
+            match = None
+            
+        if match is None:
+            return None
+        
+        # move to the most recently used
+        entry = entries.pop(match)
+        entries[match] = entry
+        
+        return entry
+    
+    def cached_outputs(self):
+        """ True if every alias of the objective and constraints points
+            into the results or summary, the parts of the nexus a cache
+            entry restores
+        """
+        
+        problem = self.optimization_problem
+        
+        names = []
+        for outputs in [problem.objective,problem.constraints]:
+            names.extend([ row[0] for row in outputs ])
+        
+        for name,pointers in problem.aliases:
+            if name not in names:
+                continue
+            if isinstance(pointers,str):
+                pointers = [pointers]
+            for pointer in pointers:
+                if pointer.split('.')[0] not in ['results','summary']:
+                    return False
+                
+        return True
+    
+    def store_cached(self,key):
+        
+        entries = self.cache.entries
+        
+        if self.cache.size < 1 or not self.cache.store or not self.cached_outputs():
+            return
+        
+        entry = Data()
+        entry.results = deepcopy(self.results)
+        entry.summary = deepcopy(self.summary)
+        
+        entries.pop(key,None)
+        entries[key] = entry
+        
+        # drop the least recently used
+        while len(entries) > self.cache.size:
+            entries.popitem(last=False)
         
     
     def _really_evaluate(self):
@@ -156,33 +269,7 @@ class Nexus(Data):
 
     def finite_difference(self,x):
         
-        obj = self.objective(x)
-        con = self.all_constraints(x)
-        
-        inpu  = self.optimization_problem.inputs
-        const = self.optimization_problem.constraints
-        
-        inplen = len(inpu)
-        conlen = len(const)
-        
-        grad_obj = np.zeros(inplen)
-        jac_con  = np.zeros((inplen,conlen))
-        
-        con2 = (con*np.ones_like(jac_con))
-        
-        for ii in xrange(0,inplen):
-            newx     = np.asarray(x)*1.0
-            newx[ii] = newx[ii]+ 1e-8
-            
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
-        
-        grad_obj = (grad_obj - obj)/(1e-8)
-        
-        jac_con = (jac_con - con2).T/(1e-8)
-        
-        grad_obj = grad_obj.astype(float)
-        jac_con  = jac_con.astype(float)
+        grad_obj, jac_con = finite_differences(self,x)
         
         return grad_obj, jac_con
     
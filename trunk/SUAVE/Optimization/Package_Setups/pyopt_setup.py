@@ -101,6 +101,10 @@ def Pyopt_Solve(problem,solver='SNOPT',FD='single', nonderivative_line_search=Fa
         opt.setOption('Nonderivative linesearch')
     if FD == 'parallel':
         outputs = opt(opt_prob, sens_type='FD',sens_mode='pgc')
+    elif FD == 'nexus':
+        # the finite differences of the nexus, see problem.gradients
+        mysens  = lambda x,f,g:PyOpt_Gradients(problem,x)
+        outputs = opt(opt_prob, sens_type=mysens)
     else:
         
         
@@ -128,3 +132,15 @@ def PyOpt_Problem(problem,x):
     print const
    
     return obj,const,fail
+
+
+# ----------------------------------------------------------------------
+#  Gradient Wrapper
+# ----------------------------------------------------------------------
+
+def PyOpt_Gradients(problem,x):
+   
+    grad_obj, jac_con = problem.finite_difference(x)
+    fail = np.array(np.isnan(grad_obj).any() or np.isnan(jac_con).any()).astype(int)
+   
+    return grad_obj.tolist(), jac_con.tolist(), fail
@@ -1,5 +1,6 @@
 
 from Nexus import Nexus
+from finite_differences import finite_differences
 import helper_functions
 import Package_Setups
 from carpet_plot import carpet_plot
\ No newline at end of file
@@ -0,0 +1,207 @@
+# finite_differences.py
+#
+# Created:  Oct 2016, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# suave imports
+from SUAVE.Core import Data
+import numpy as np
+import multiprocessing
+from warnings import warn
+
+# the nexus of the parallel evaluations, inherited by the worker processes
+_nexus = None
+
+# ----------------------------------------------------------------------
+#  Finite Differences
+# ----------------------------------------------------------------------
+
+def finite_differences(nexus,x):
+    """ grad_obj, jac_con = finite_differences(nexus,x)
+        the gradient of the scaled objective and the jacobian of the scaled
+        constraints at the scaled inputs x
+
+        Inputs:
+            nexus.gradients:
+                method              - 'forward', 'central' or 'complex' step
+                step_size           - one step for all inputs, or one per input
+                number_of_processes - parallel processes evaluating the perturbed
+                                      inputs, 1 evaluates them in this process
+                broyden_updates     - Broyden updates of the last gradients allowed
+                                      between finite differences, 0 for none
+            nexus.last_gradients    - the gradients of the last inputs, reused
+                                      if x has not changed
+
+        Outputs:
+            grad_obj - [n_inputs]
+            jac_con  - [n_constraints x n_inputs]
+
+        Assumptions:
+            The complex step needs a procedure that carries complex inputs
+            through to its results.
+            Parallel processes are forked, each evaluates a copy of the nexus,
+            so this process is left at x.
+    """
+
+    settings = nexus.gradients
+    last     = nexus.last_gradients
+
+    x = np.array(x,dtype=float)
+
+    # the objective and constraint jacobians are often asked for separately
+    if last is not None and np.all(last.inputs == x):
+        return last.objective_gradient.copy(), last.constraint_jacobian.copy()
+
+    # the function values at x
+    F = evaluate_point(nexus,x).astype(float)
+
+    if last is not None and last.updates < settings.broyden_updates:
+        J = broyden_update(last.jacobian,x-last.inputs,F-last.values)
+        updates = last.updates + 1
+    else:
+        J = finite_difference_jacobian(nexus,x,F)
+        updates = 0
+
+    # the objective is the first row
+    grad_obj = J[0,:]
+    jac_con  = J[1:,:]
+
+    # store
+    last = Data()
+    last.inputs              = x
+    last.values              = F
+    last.jacobian            = J
+    last.objective_gradient  = grad_obj
+    last.constraint_jacobian = jac_con
+    last.updates             = updates
+    nexus.last_gradients     = last
+
+    return grad_obj.copy(), jac_con.copy()
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def finite_difference_jacobian(nexus,x,F):
+    """ J = finite_difference_jacobian(nexus,x,F)
+        the jacobian of the objective and constraints, F at x, with the
+        method and steps of nexus.gradients
+    """
+
+    settings = nexus.gradients
+    method   = settings.method
+
+    n = len(x)
+    h = np.ones(n) * settings.step_size
+    I = np.eye(n)
+
+    # the steps are well within any cache tolerance, only match exactly,
+    # and aren't stored over the design points
+    tolerance = nexus.cache.tolerance
+    store     = nexus.cache.store
+    nexus.cache.tolerance = 0.
+    nexus.cache.store     = False
+    try:
+        J = perturbation_jacobian(nexus,x,F,h,I,method)
+    finally:
+        nexus.cache.tolerance = tolerance
+        nexus.cache.store     = store
+
+    # rows are the perturbed inputs
+    return J.T.astype(float)
+
+
+def perturbation_jacobian(nexus,x,F,h,I,method):
+    """ J = perturbation_jacobian(nexus,x,F,h,I,method)
+        the transposed jacobian from the inputs x perturbed by the steps h
+    """
+
+    n = len(x)
+
+    if method == 'forward':
+        X = x + I*h[:,None]
+        values = evaluate_points(nexus,X)
+        J = (values - F)/h[:,None]
+
+    elif method == 'central':
+        X = np.vstack([ x + I*h[:,None] , x - I*h[:,None] ])
+        values = evaluate_points(nexus,X)
+        J = (values[:n] - values[n:])/(2.*h[:,None])
+
+    elif method == 'complex':
+        X = x + 1j*I*h[:,None]
+        values = evaluate_points(nexus,X).astype(complex)
+        J = np.imag(values)/h[:,None]
+
+        # a procedure that drops the imaginary parts gives no gradients
+        if not np.any(np.imag(values)):
+            warn('The complex step did not reach the objective or constraints, '
+                 'the procedure must carry complex inputs through to its results.',RuntimeWarning)
+
+    else:
+        raise ValueError , 'unknown finite difference method %s' % method
+
+    return J
+
+
+def broyden_update(J,dx,dF):
+    """ J = broyden_update(J,dx,dF)
+        the rank one update of the jacobian J for a change of dF over dx
+    """
+
+    dxdx = np.dot(dx,dx)
+    if dxdx == 0.:
+        return J.copy()
+
+    return J + np.outer(dF - np.dot(J,dx),dx)/dxdx
+
+
+def evaluate_point(nexus,x):
+    """ F = evaluate_point(nexus,x)
+        the scaled objective followed by the scaled constraints at x
+    """
+
+    obj = nexus.objective(x)
+    con = nexus.all_constraints(x)
+
+    return np.hstack([obj,con])
+
+
+def evaluate_points(nexus,X):
+    """ values = evaluate_points(nexus,X)
+        evaluate_point for each row of X, in parallel processes if
+        nexus.gradients.number_of_processes is more than one
+    """
+
+    global _nexus
+
+    number_of_processes = nexus.gradients.number_of_processes
+    if number_of_processes is None:
+        number_of_processes = multiprocessing.cpu_count()
+    number_of_processes = min(number_of_processes,len(X))
+
+    if number_of_processes <= 1:
+        return np.array([ evaluate_point(nexus,x) for x in X ])
+
+    _nexus = nexus
+    pool   = multiprocessing.Pool(number_of_processes)
+    try:
+        values = pool.map(evaluate_pool_point,list(X))
+    finally:
+        pool.close()
+        pool.join()
+        _nexus = None
+
+    return np.array(values)
+
+
+def evaluate_pool_point(x):
+    """ F = evaluate_pool_point(x)
+        evaluate_point of the nexus in a worker process
+    """
+    return evaluate_point(_nexus,x)
@@ -114,7 +114,12 @@ def get_values(dictionary,outputs,aliases):
     values = np.zeros(len(outputs))
     for ii in xrange(0,len(outputs)):
         splitstring = pointer[ii].split('.')
-        values[ii]  = eval('dictionary.'+'.'.join(splitstring[0:]))
+        value       = eval('dictionary.'+'.'.join(splitstring[0:]))
+        
+        # keep the complex step of complex inputs
+        if np.iscomplexobj(value) and not np.iscomplexobj(values):
+            values = values.astype(complex)
+        values[ii]  = value
     
     return values
 
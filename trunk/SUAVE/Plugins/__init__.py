@@ -1,9 +1,11 @@
 
 from load_plugin import load_plugin
+from SUAVE.Core.Lazy_Module import Lazy_Module
+
 # these packages are imported by temporarily modifying
 # the python path to account for potential absolute
-# package imports
+# package imports, when they are first used
 
-ADiPy = load_plugin('ADiPy')
-pint = load_plugin('pint')
+ADiPy = Lazy_Module(__name__ + '.ADiPy', lambda: load_plugin('ADiPy'))
+pint  = Lazy_Module(__name__ + '.pint' , lambda: load_plugin('pint'))
 
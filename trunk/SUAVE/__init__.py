@@ -8,15 +8,11 @@
 #  IMPORT!!
 # ----------------------------------------------------------------------
 
-# packages
-import Plugins
+# packages, loaded when first used
 import Core
-import Methods
-import Attributes
-import Components
-import Analyses
-import Optimization
-import Input_Output
+from Core.Lazy_Module import lazy_import
+lazy_import(globals(),['Plugins','Methods','Attributes','Components',
+                       'Analyses','Optimization','Input_Output'])
 
 # the vehicle class
 from Vehicle import Vehicle